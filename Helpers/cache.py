@@ -0,0 +1,254 @@
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from itertools import accumulate, chain
+from typing import List, Optional
+
+from Parser.arena import ASTArena, ArenaNode
+from Parser.parser import Parser
+from Parser.semantic import SemanticAnalyzer
+from Tokens.automaton import default_automaton
+from Tokens.compiled import compile_automaton
+from Tokens.stream import TokenStream
+from Tokens.tokenizer import process_tokens
+
+# Versión del formato de las entradas; cambiarla invalida toda la caché
+CACHE_FORMAT = 1
+DEFAULT_CACHE_DIR = '__fishcache__'
+DEFAULT_MAX_BYTES = 256 << 20
+# Al pasar max_bytes se desalojan entradas hasta quedar en esta fracción
+EVICT_TO = 0.9
+
+# Módulos de los que depende el resultado de tokenizar, parsear y analizar:
+# si cambia cualquiera, cambia la huella y las entradas viejas dejan de usarse
+FRONTEND_MODULES = (
+    'Helpers/cache.py', 'Helpers/cleaner.py', 'Helpers/names.py', 'Helpers/symbolsTable.py',
+    'Helpers/tokenizerHelpers.py', 'Helpers/transitions.py',
+    'Tokens/automaton.py', 'Tokens/automaton_table.py', 'Tokens/compiled.py', 'Tokens/stream.py',
+    'Tokens/tokenizer.py', 'Parser/arena.py', 'Parser/ast.py', 'Parser/diagnostics.py', 'Parser/grammar.py',
+    'Parser/parser.py', 'Parser/passes.py', 'Parser/semantic.py', 'Parser/typeinfo.py',
+)
+
+MAGIC = b'FSHC'
+# magic, clave, tokens, extra, nodos, valores, errores sintácticos, semánticos
+HEADER = struct.Struct('<4s20s6I')
+
+
+def frontend_fingerprint() -> bytes:
+    # Huella del front-end: formato, orden de bytes de las columnas y el
+    # contenido de cada módulo de FRONTEND_MODULES
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    digest = hashlib.blake2b(f'{CACHE_FORMAT}:{sys.byteorder}'.encode(), digest_size=20)
+    for name in FRONTEND_MODULES:
+        with open(os.path.join(root, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+FINGERPRINT = frontend_fingerprint()
+
+
+class FrontendResult:
+    # Lo que produce el front-end para un fuente: sus tokens, el AST empaquetado
+    # (parseado con recuperación, así que puede tener nodos Error) y los errores
+    # sintácticos y semánticos como texto
+    __slots__ = ('tokens', 'arena', 'syntax_errors', 'semantic_errors')
+
+    def __init__(self, tokens: TokenStream, arena: ASTArena, syntax_errors: List[str], semantic_errors: List[str]):
+        self.tokens = tokens
+        self.arena = arena
+        self.syntax_errors = syntax_errors
+        self.semantic_errors = semantic_errors
+
+    @property
+    def ast(self) -> ArenaNode:
+        return self.arena.root
+
+    @property
+    def errors(self) -> List[str]:
+        return self.syntax_errors + self.semantic_errors
+
+
+def run_frontend(automaton, source: bytes) -> FrontendResult:
+    # Tokeniza, parsea (con recuperación) y analiza source, sin caché
+    tokens = process_tokens(automaton, source)
+    parser = Parser(tokens, recover=True)
+    ast = parser.parse()
+    semantic_errors = SemanticAnalyzer(parser.names).analyze(ast)
+    return FrontendResult(tokens, ASTArena.pack(ast), [str(e) for e in parser.errors], [str(e) for e in semantic_errors])
+
+
+def _pack_strings(strings: List[str]) -> bytes:
+    # Longitudes (en caracteres) y después todo el texto junto en UTF-8
+    return array('I', map(len, strings)).tobytes() + ''.join(strings).encode('utf-8')
+
+
+def _unpack_strings(data: memoryview, count: int) -> Optional[List[str]]:
+    # Inversa de _pack_strings: se decodifica el texto una vez y se corta en C
+    lengths = array('I')
+    lengths.frombytes(data[:count * lengths.itemsize])
+    text = str(data[count * lengths.itemsize:], 'utf-8')
+    ends = list(accumulate(lengths))
+    if len(lengths) != count or (ends[-1] if ends else 0) != len(text):
+        return None
+    return list(map(text.__getitem__, map(slice, chain((0,), ends), ends)))
+
+
+def serialize(key: bytes, result: FrontendResult) -> bytes:
+    # Columnas de tokens y del arena tal cual (array.tobytes) y todas las cadenas
+    # (lexemas de extra, valores del AST, errores) con su longitud al frente
+    tokens = result.tokens
+    arena = result.arena
+    extra = sorted(tokens.extra.items())
+    parts = [HEADER.pack(MAGIC, key, len(tokens), len(extra), len(arena), len(arena.values),
+                         len(result.syntax_errors), len(result.semantic_errors))]
+    for column in (tokens.kind, tokens.start, tokens.length, tokens.line, array('I', (i for i, _ in extra)),
+                   arena.kind, arena.value, arena.first_child, arena.next_sibling, arena.line, arena.start, arena.end):
+        parts.append(column.tobytes())
+    parts.append(_pack_strings([lexeme for _, lexeme in extra] + arena.values
+                               + result.syntax_errors + result.semantic_errors))
+    return b''.join(parts)
+
+
+def deserialize(key: bytes, data: bytes, source: bytes, compiled) -> Optional[FrontendResult]:
+    # La entrada de key para source, o None si no es válida (otra clave, otro
+    # formato, truncada): en ese caso se trata como si no estuviera
+    if len(data) < HEADER.size:
+        return None
+    magic, stored_key, n_tokens, n_extra, n_nodes, n_values, n_syntax, n_semantic = HEADER.unpack_from(data)
+    if magic != MAGIC or stored_key != key:
+        return None
+    view = memoryview(data)
+    offset = HEADER.size
+    tokens = TokenStream(source)
+    tokens.compiled = compiled
+    arena = ASTArena()
+    extra_index = array('I')
+    try:
+        for column, count in ((tokens.kind, n_tokens), (tokens.start, n_tokens), (tokens.length, n_tokens),
+                              (tokens.line, n_tokens), (extra_index, n_extra),
+                              (arena.kind, n_nodes), (arena.value, n_nodes), (arena.first_child, n_nodes),
+                              (arena.next_sibling, n_nodes), (arena.line, n_nodes), (arena.start, n_nodes),
+                              (arena.end, n_nodes)):
+            size = count * column.itemsize
+            if offset + size > len(data):
+                return None
+            column.frombytes(view[offset:offset + size])
+            offset += size
+        strings = _unpack_strings(view[offset:], n_extra + n_values + n_syntax + n_semantic)
+    except (ValueError, UnicodeDecodeError):
+        return None
+    if strings is None:
+        return None
+    tokens.extra = dict(zip(extra_index, strings[:n_extra]))
+    arena.values = strings[n_extra:n_extra + n_values]
+    errors = strings[n_extra + n_values:]
+    return FrontendResult(tokens, arena, errors[:n_syntax], errors[n_syntax:])
+
+
+class FrontendCache:
+    """Caché en disco de los resultados del front-end, al estilo de __pycache__.
+
+    Cada entrada es un archivo en directory con nombre la clave: un hash de
+    los bytes del fuente y de FINGERPRINT (versión del formato y de los
+    módulos del front-end), así que un fuente o un compilador distinto nunca
+    lee una entrada que no le corresponde. Un acierto no tokeniza, no parsea
+    y no analiza: solo lee y reconstruye las columnas. Las entradas se
+    escriben de forma atómica; una entrada dañada cuenta como fallo. Si el
+    total pasa de max_bytes se borran las usadas hace más tiempo (LRU por
+    fecha de modificación, que se renueva en cada acierto).
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES, automaton=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.automaton = automaton or default_automaton()
+        self.compiled = compile_automaton(self.automaton)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self.total_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    def key(self, source: bytes) -> bytes:
+        digest = hashlib.blake2b(FINGERPRINT, digest_size=20)
+        digest.update(source)
+        return digest.digest()
+
+    def path(self, key: bytes) -> str:
+        return os.path.join(self.directory, key.hex() + '.fsh')
+
+    def check_file(self, input_file: str) -> FrontendResult:
+        with open(input_file, 'rb') as f:
+            return self.check(f.read())
+
+    def check(self, source: bytes) -> FrontendResult:
+        # Resultado del front-end para source, desde la caché si está
+        key = self.key(source)
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = None
+        if data is not None:
+            result = deserialize(key, data, source, self.compiled)
+            if result is not None:
+                self.hits += 1
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return result
+        self.misses += 1
+        result = run_frontend(self.automaton, source)
+        self.store(path, serialize(key, result))
+        return result
+
+    def store(self, path: str, data: bytes) -> None:
+        # Se escribe en un temporal del mismo directorio y se renombra: otro
+        # proceso ve la entrada completa o no la ve
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp, path)
+        except OSError:
+            try:
+                os.unlink(temp)
+            except OSError:
+                pass
+            return
+        self.total_bytes += len(data)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        # Borra las entradas menos usadas hasta bajar a EVICT_TO * max_bytes
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * EVICT_TO
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        self.total_bytes = total
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.fsh'):
+                    yield entry
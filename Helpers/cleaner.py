@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_right
 
 def _remove_comments(input_text: str) -> str:
      # Eliminar comentarios de bloque <~ ... ~> (no codiciosa, a través de líneas). Si no hay cierre, elimina hasta EOF
@@ -14,3 +15,195 @@ def clean_input(input_text: str) -> str:
      #    Dejamos espacios/tabs intactos (el tokenizer los ignorará). Sustituimos CRLF por LF.
      text = text.replace('\r\n', '\n').replace('\r', '\n')
      return text
+
+# ---------------------------------------------
+# Versión sin reescribir el texto: en lugar de construir el texto limpio, se
+# calculan los tramos [inicio, fin) del original que sobreviven a
+# _remove_comments, con una pasada de find sobre el texto (además de la que
+# hace el tokenizer). El tokenizer recorre esos tramos directamente sobre el
+# texto original, que puede ser un str o bytes/mmap (entonces las posiciones
+# son de bytes).
+# ---------------------------------------------
+_DELIMITERS = ('<~', '~>', '~~', '~', '\n')
+_BYTE_DELIMITERS = tuple(d.encode('ascii') for d in _DELIMITERS)
+
+def kept_segments(input_text) -> list:
+     block_open, block_close, line_open, tilde_char, newline = (
+          _DELIMITERS if isinstance(input_text, str) else _BYTE_DELIMITERS
+     )
+     find = input_text.find
+     n = len(input_text)
+     # 1) Tramos fuera de comentarios de bloque (mismo recorrido que el re.sub)
+     blocks = []
+     pos = 0
+     while pos < n:
+          begin = find(block_open, pos)
+          if begin < 0:
+               blocks.append((pos, n))
+               break
+          if begin > pos:
+               blocks.append((pos, begin))
+          end = find(block_close, begin + 2)
+          if end < 0:
+               # Sin cierre se elimina hasta EOF, salvo el salto de línea final (igual que '$')
+               if input_text[n - 1:] == newline:
+                    blocks.append((n - 1, n))
+               break
+          pos = end + 2
+
+     # 2) Comentarios de línea sobre el texto ya sin bloques: un '~~' puede quedar
+     #    formado por un '~' a cada lado de un bloque eliminado
+     segments = []
+     in_comment = False
+     tilde = False          # el último carácter conservado es un '~' libre
+     for lo, hi in blocks:
+          pos = lo
+          if in_comment or (tilde and input_text[lo:lo + 1] == tilde_char):
+               if not in_comment:
+                    # El '~' del tramo anterior abre el comentario
+                    prev_lo, prev_hi = segments.pop()
+                    if prev_hi - 1 > prev_lo:
+                         segments.append((prev_lo, prev_hi - 1))
+                    pos = lo + 1
+               end = find(newline, pos, hi)
+               if end < 0:
+                    in_comment = True
+                    tilde = False
+                    continue
+               in_comment = False
+               pos = end
+          while True:
+               begin = find(line_open, pos, hi)
+               if begin < 0:
+                    if pos < hi:
+                         segments.append((pos, hi))
+                         tilde = input_text[hi - 1:hi] == tilde_char
+                    else:
+                         tilde = False
+                    break
+               if begin > pos:
+                    segments.append((pos, begin))
+               end = find(newline, begin + 2, hi)
+               if end < 0:
+                    in_comment = True
+                    tilde = False
+                    break
+               pos = end
+     return segments
+
+_BARE_CR = re.compile(r'\r(?!\n)')
+_BYTE_BARE_CR = re.compile(rb'\r(?!\n)')
+
+def bare_carriage_returns(input_text, segments: list) -> list:
+     # Posiciones de '\r' que clean_input convertiría en '\n' por sí solos (los de
+     # un CRLF se ignoran). Un CRLF puede quedar unido al eliminar un comentario.
+     if isinstance(input_text, str):
+          bare_cr, newline = _BARE_CR, '\n'
+     else:
+          bare_cr, newline = _BYTE_BARE_CR, b'\n'
+     starts = [lo for lo, _ in segments]
+     found = []
+     for m in bare_cr.finditer(input_text):
+          pos = m.start()
+          k = bisect_right(starts, pos) - 1
+          if k < 0 or pos >= segments[k][1]:
+               continue        # dentro de un comentario
+          if (pos == segments[k][1] - 1 and k + 1 < len(segments)
+                    and input_text[starts[k + 1]:starts[k + 1] + 1] == newline):
+               continue
+          found.append(pos)
+     return found
+
+# ---------------------------------------------
+# Versión por fragmentos: mismas tres pasadas que clean_input, pero sobre un
+# iterador de trozos de texto. Cada pasada guarda solo el estado mínimo
+# (dentro de comentario o no, y el último carácter si puede iniciar un delimitador).
+# ---------------------------------------------
+def _remove_block_comments_stream(chunks):
+     in_block = False
+     carry = ''
+     last = ''
+     for chunk in chunks:
+          if not chunk:
+               continue
+          last = chunk[-1]
+          text = carry + chunk
+          carry = ''
+          out = []
+          pos = 0
+          while True:
+               if in_block:
+                    end = text.find('~>', pos)
+                    if end < 0:
+                         # Un '~' final puede cerrar el comentario con el siguiente fragmento
+                         if text.endswith('~') and len(text) - 1 >= pos:
+                              carry = '~'
+                         break
+                    pos = end + 2
+                    in_block = False
+               else:
+                    begin = text.find('<~', pos)
+                    if begin < 0:
+                         if text.endswith('<') and len(text) - 1 >= pos:
+                              out.append(text[pos:-1])
+                              carry = '<'
+                         else:
+                              out.append(text[pos:])
+                         break
+                    out.append(text[pos:begin])
+                    pos = begin + 2
+                    in_block = True
+          yield ''.join(out)
+     if in_block:
+          # Sin cierre se elimina hasta EOF, salvo el salto de línea final (igual que '$')
+          if last == '\n':
+               yield '\n'
+     else:
+          yield carry
+
+def _remove_line_comments_stream(chunks):
+     in_comment = False
+     carry = ''
+     for chunk in chunks:
+          text = carry + chunk
+          carry = ''
+          out = []
+          pos = 0
+          while True:
+               if in_comment:
+                    end = text.find('\n', pos)
+                    if end < 0:
+                         break
+                    pos = end
+                    in_comment = False
+               else:
+                    begin = text.find('~~', pos)
+                    if begin < 0:
+                         if text.endswith('~') and len(text) - 1 >= pos:
+                              out.append(text[pos:-1])
+                              carry = '~'
+                         else:
+                              out.append(text[pos:])
+                         break
+                    out.append(text[pos:begin])
+                    pos = begin + 2
+                    in_comment = True
+          yield ''.join(out)
+     if not in_comment:
+          yield carry
+
+def _normalize_newlines_stream(chunks):
+     carry = ''
+     for chunk in chunks:
+          text = carry + chunk
+          carry = ''
+          # Un '\r' final puede ser la primera mitad de un CRLF
+          if text.endswith('\r'):
+               text, carry = text[:-1], '\r'
+          yield text.replace('\r\n', '\n').replace('\r', '\n')
+     if carry:
+          yield '\n'
+
+def clean_stream(chunks):
+     # Equivalente a clean_input aplicado al texto completo, fragmento a fragmento
+     return _normalize_newlines_stream(_remove_line_comments_stream(_remove_block_comments_stream(chunks)))
@@ -0,0 +1,46 @@
+from typing import Dict, List
+
+from Helpers.tokenizerHelpers import TOKEN_TYPES
+
+
+class NameTable:
+    """Tabla de nombres internados de una compilación.
+
+    La crea el TokenStream y la comparten el parser (valores de Var, Assign,
+    Call, declaraciones...) y SemanticAnalyzer (claves de los ámbitos), así
+    que cada nombre distinto existe una sola vez como str: las búsquedas en
+    diccionarios usan el hash ya calculado y comparan por identidad. Cada
+    nombre tiene además un id entero (su orden de llegada). Los tipos de
+    token ('<int', '<string', ...) se cargan primero, con los mismos objetos
+    de TOKEN_TYPES que usan los nodos Type.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        for typ in TOKEN_TYPES:
+            self.intern(typ)
+
+    def intern(self, name: str) -> str:
+        # El objeto canónico para name (el primero que llegó con ese texto)
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return self.names[i]
+
+    def id(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def name(self, i: int) -> str:
+        return self.names[i]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
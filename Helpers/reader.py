@@ -1,3 +1,6 @@
+import mmap
+import os
+
 def reader(input_file: str) -> str:
     try:
         with open(input_file, "r", encoding="utf-8") as f:
@@ -6,3 +9,24 @@ def reader(input_file: str) -> str:
         print(f"No se encontró el archivo de entrada: {input_file}")
         raise
     return raw
+
+def read_chunks(file_obj, chunk_size: int):
+    # Lee un archivo abierto en trozos de chunk_size caracteres
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+def map_file(input_file: str):
+    # Archivo mapeado en memoria, solo lectura: el tokenizer lo recorre como bytes
+    # sin decodificarlo a str, y las páginas quedan en la caché del sistema,
+    # compartidas entre procesos que lean el mismo archivo
+    try:
+        with open(input_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''      # mmap no admite archivos vacíos
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        print(f"No se encontró el archivo de entrada: {input_file}")
+        raise
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List, Optional, Tuple
+
 tokens = {
     "MAIN": {
         "regex": r"fish",
@@ -207,4 +209,69 @@ tokens = {
         "regex": r"[0-9]+(\.[0-9]+)?",
         "example": "42, 3.14"
     }
-}
\ No newline at end of file
+}
+
+
+class ScopedSymbols:
+    """Tabla de símbolos con ámbitos anidados, de búsqueda O(1).
+
+    bindings guarda, para cada nombre, solo el símbolo visible ahora (el del
+    ámbito más interno que lo declara), así que buscar es un acceso a un
+    diccionario sin importar la profundidad. Cada declaración deja en undo
+    lo que tapó; pop_scope deshace las declaraciones del ámbito que se
+    cierra, en orden inverso, y vuelven a verse los símbolos sombreados. Abrir
+    un ámbito solo anota dónde empieza en undo. Los valores son de quien usa
+    la tabla (Symbol en SemanticAnalyzer).
+    """
+
+    def __init__(self):
+        self.bindings: Dict[str, Any] = {}
+        self.levels: Dict[str, int] = {}    # nombre -> ámbito donde se declaró el visible
+        self.undo: List[Tuple[str, Any, int]] = []
+        self.marks: List[int] = []          # len(undo) al abrir cada ámbito
+        self.version = 0                    # cambia cada vez que cambia bindings
+
+    @property
+    def depth(self) -> int:
+        return len(self.marks)
+
+    def push_scope(self) -> None:
+        self.marks.append(len(self.undo))
+
+    def pop_scope(self) -> None:
+        if not self.marks:
+            return
+        mark = self.marks.pop()
+        if len(self.undo) > mark:
+            self.version += 1
+        bindings = self.bindings
+        levels = self.levels
+        undo = self.undo
+        while len(undo) > mark:
+            name, previous, level = undo.pop()
+            if level < 0:
+                del bindings[name]
+                del levels[name]
+            else:
+                bindings[name] = previous
+                levels[name] = level
+
+    def declare(self, name: str, symbol: Any) -> Optional[Any]:
+        # Declara name en el ámbito actual; devuelve el símbolo que ya estaba
+        # declarado con ese nombre en este mismo ámbito (o None)
+        previous = self.bindings.get(name)
+        level = self.levels.get(name, -1)
+        self.undo.append((name, previous, level))
+        self.version += 1
+        self.bindings[name] = symbol
+        self.levels[name] = len(self.marks)
+        return previous if level == len(self.marks) else None
+
+    def lookup(self, name: str) -> Optional[Any]:
+        return self.bindings.get(name)
+
+    def declared_here(self, name: str) -> bool:
+        return self.levels.get(name, -1) == len(self.marks)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.bindings
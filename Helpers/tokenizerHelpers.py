@@ -28,8 +28,72 @@ ID_STATE = 5
 NUM_STATE = 6
 STRING_BODY_STATE = 122
 STRING_END_STATE = 123
+CHAR_BODY_STATE = 200
 CHAR_END_STATE = 201
 
+# Letras con transición propia desde el estado inicial (inicio de reservadas)
+RESERVED_INITIALS = {'f', 'i', 'e', 't', 'c', 'w', 's', 'a', 'd'}
+
+# Tipo de token de cada estado de aceptación
+STATE_TOKEN_TYPES = {
+    # Tipos de datos
+    30: '<int', 
+    36: '<string', 
+    42: '<charal', 
+    48: '<bubble', 
+    52: '<hook',
+    # Operadores
+    11: '<=',      # Asignación
+    12: '<+',      # Suma
+    13: '<-',      # Resta
+    14: '<*',      # Multiplicación
+    15: '</',      # División
+    16: '<%',      # Módulo
+    17: '<<',      # Menor que
+    21: '<<>',     # Mayor que
+    22: '<<=',     # Menor o igual
+    23: '<!=',     # Diferente
+    24: '<==',     # Igual
+    25: '<++',     # Incremento
+    26: '<--',     # Decremento
+    27: '<<>=',    # Mayor o igual
+    19: '<D',      # Delimitador
+    20: 'COMENTARIO_BLOQUE_INICIO',
+    # Palabras reservadas
+    56: 'fish',       # Main
+    60: 'IMPORT', 
+    64: 'fishtion',   # Function
+    65: 'fork',       # For
+    71: 'finally', 
+    73: 'if',
+    77: 'else', 
+    82: 'emerge',     # Return
+    85: 'try', 
+    90: 'catch', 
+    95: 'whale',      # While
+    101: 'splash',    # Print
+    106: 'ARRAY', 
+    110: 'DICT',
+    # Símbolos
+    111: 'CORCHETE_IZQ', 
+    112: 'CORCHETE_DER', 
+    113: '{', 
+    114: '}',
+    115: ',', 
+    116: 'PUNTO', 
+    118: 'COMENTARIO_LINEA', 
+    119: 'COMENTARIO_BLOQUE_FIN',
+    2: '(', 
+    3: ')',
+    # Operadores simples
+    1: 'OP', 
+    7: 'OP', 
+    8: 'OP', 
+    9: 'OP',
+    # Literales de string
+    123: 'STRING_LITERAL',
+}
+
 def classify_state(state: int) -> str:
     # Identificadores y números
     if state == ID_STATE:
@@ -41,62 +105,10 @@ def classify_state(state: int) -> str:
     # Prefijo de reservada inconcluso
     if state in RESERVED_PREFIX_STATES and state not in RESERVED_FINAL_STATES:
         return 'ident'
-    mapping = {
-        # Tipos de datos
-        30: '<int', 
-        36: '<string', 
-        42: '<charal', 
-        48: '<bubble', 
-        52: '<hook',
-        # Operadores
-        11: '<=',      # Asignación
-        12: '<+',      # Suma
-        13: '<-',      # Resta
-        14: '<*',      # Multiplicación
-        15: '</',      # División
-        16: '<%',      # Módulo
-        17: '<<',      # Menor que
-        21: '<<>',     # Mayor que
-        22: '<<=',     # Menor o igual
-        23: '<!=',     # Diferente
-        24: '<==',     # Igual
-        25: '<++',     # Incremento
-        26: '<--',     # Decremento
-        27: '<<>=',    # Mayor o igual
-        19: '<D',      # Delimitador
-        20: 'COMENTARIO_BLOQUE_INICIO',
-        # Palabras reservadas
-        56: 'fish',       # Main
-        60: 'IMPORT', 
-        64: 'fishtion',   # Function
-        65: 'fork',       # For
-        71: 'finally', 
-        73: 'if',
-        77: 'else', 
-        82: 'emerge',     # Return
-        85: 'try', 
-        90: 'catch', 
-        95: 'whale',      # While
-        101: 'splash',    # Print
-        106: 'ARRAY', 
-        110: 'DICT',
-        # Símbolos
-        111: 'CORCHETE_IZQ', 
-        112: 'CORCHETE_DER', 
-        113: '{', 
-        114: '}',
-        115: ',', 
-        116: 'PUNTO', 
-        118: 'COMENTARIO_LINEA', 
-        119: 'COMENTARIO_BLOQUE_FIN',
-        2: '(', 
-        3: ')',
-        # Operadores simples
-        1: 'OP', 
-        7: 'OP', 
-        8: 'OP', 
-        9: 'OP',
-        # Literales de string
-        123: 'STRING_LITERAL',
-    }
-    return mapping.get(state, 'NO RECONOCIDO')
\ No newline at end of file
+    return STATE_TOKEN_TYPES.get(state, 'NO RECONOCIDO')
+
+# Tipos de token posibles; el índice es el id numérico que guardan las columnas de TokenStream
+TOKEN_TYPES = list(dict.fromkeys(
+    list(STATE_TOKEN_TYPES.values()) + ['ident', 'NUM', 'CHAR_LITERAL', 'NO RECONOCIDO', 'NO VALIDO', '$']
+))
+TOKEN_TYPE_IDS = {typ: i for i, typ in enumerate(TOKEN_TYPES)}
@@ -0,0 +1,155 @@
+from array import array
+from typing import List, Optional
+
+from Parser.ast import ASTNode
+
+# Tipos de nodo que construye el parser; en el arena se guarda su índice
+NODE_KINDS = (
+    'Program', 'Block', 'Error',
+    'Declaration', 'Initializer', 'Type', 'FunctionDef', 'Params', 'Param',
+    'CallStmt', 'Assign', 'Inc', 'Dec', 'Args',
+    'If', 'While', 'For', 'ForStep', 'Postfix', 'AssignTo', 'Empty',
+    'TryCatch', 'Finally', 'Print', 'Return',
+    'BinaryOp', 'UnaryOp', 'PostfixOp', 'Call', 'Var', 'Num', 'String', 'Char',
+)
+NODE_KIND_IDS = {kind: i for i, kind in enumerate(NODE_KINDS)}
+
+# Enlace vacío (sin hijos, sin hermano siguiente, sin valor)
+NO_NODE = -1
+
+
+class ASTArena:
+    """AST guardado por columnas en lugar de un objeto por nodo.
+
+    El nodo i ocupa la fila i de cada columna: kind (índice en NODE_KINDS),
+    value (índice en values, o NO_NODE si es None), first_child y next_sibling
+    (filas enlazadas, o NO_NODE), line y el tramo start/end del nodo. Los
+    nodos van por niveles, así que los hijos de un nodo quedan contiguos, y
+    cada valor distinto (nombres, lexemas, tipos) se guarda una sola vez.
+    node(i) y root devuelven vistas ArenaNode con la interfaz de ASTNode
+    (kind, value, children, line), que es lo que usan SemanticAnalyzer y
+    pretty_print.
+    """
+
+    def __init__(self):
+        self.kind = array('B')
+        self.value = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.line = array('i')
+        self.start = array('i')
+        self.end = array('i')
+        self.values: List[str] = []
+
+    @classmethod
+    def pack(cls, root: ASTNode) -> 'ASTArena':
+        # Recorre el árbol por niveles (sin recursión): los hijos de la fila i se
+        # agregan a la cola al procesarla y toman las filas siguientes libres
+        arena = cls()
+        value_ids = {}
+        nodes = [root]
+        arena.next_sibling.append(NO_NODE)
+        i = 0
+        while i < len(nodes):
+            node = nodes[i]
+            nodes[i] = None
+            arena.kind.append(NODE_KIND_IDS[node.kind])
+            if node.value is None:
+                arena.value.append(NO_NODE)
+            else:
+                index = value_ids.get(node.value)
+                if index is None:
+                    index = value_ids[node.value] = len(arena.values)
+                    arena.values.append(node.value)
+                arena.value.append(index)
+            arena.line.append(node.line)
+            arena.start.append(node.start)
+            arena.end.append(node.end)
+            children = node.children
+            if children:
+                first = len(nodes)
+                arena.first_child.append(first)
+                arena.next_sibling.extend(range(first + 1, first + len(children)))
+                arena.next_sibling.append(NO_NODE)
+                nodes.extend(children)
+            else:
+                arena.first_child.append(NO_NODE)
+            i += 1
+        return arena
+
+    def unpack(self) -> ASTNode:
+        # El árbol de ASTNode equivalente (p. ej. para Parser.reparse)
+        nodes = [ASTNode(NODE_KINDS[kind], self.values[value] if value >= 0 else None, [], line, start, end)
+                 for kind, value, line, start, end
+                 in zip(self.kind, self.value, self.line, self.start, self.end)]
+        for node, child in zip(nodes, self.first_child):
+            while child != NO_NODE:
+                node.children.append(nodes[child])
+                child = self.next_sibling[child]
+        return nodes[0]
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def node(self, i: int) -> 'ArenaNode':
+        return ArenaNode(self, i)
+
+    @property
+    def root(self) -> 'ArenaNode':
+        return ArenaNode(self, 0)
+
+    def nbytes(self) -> int:
+        # Bytes de las columnas (sin contar los valores, que se comparten)
+        columns = (self.kind, self.value, self.first_child, self.next_sibling, self.line, self.start, self.end)
+        return sum(column.itemsize * len(column) for column in columns)
+
+
+class ArenaNode:
+    # Vista del nodo index de un ASTArena con la interfaz de ASTNode (solo
+    # lectura). Se crea al pedirla; dos vistas del mismo nodo son iguales
+    __slots__ = ('arena', 'index')
+
+    def __init__(self, arena: ASTArena, index: int):
+        self.arena = arena
+        self.index = index
+
+    @property
+    def kind(self) -> str:
+        return NODE_KINDS[self.arena.kind[self.index]]
+
+    @property
+    def value(self) -> Optional[str]:
+        value = self.arena.value[self.index]
+        return self.arena.values[value] if value >= 0 else None
+
+    @property
+    def children(self) -> List['ArenaNode']:
+        arena = self.arena
+        next_sibling = arena.next_sibling
+        children = []
+        child = arena.first_child[self.index]
+        while child != NO_NODE:
+            children.append(ArenaNode(arena, child))
+            child = next_sibling[child]
+        return children
+
+    @property
+    def line(self) -> int:
+        return self.arena.line[self.index]
+
+    @property
+    def start(self) -> int:
+        return self.arena.start[self.index]
+
+    @property
+    def end(self) -> int:
+        return self.arena.end[self.index]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ArenaNode) and other.arena is self.arena and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.arena), self.index))
+
+    def __repr__(self) -> str:
+        return f"ArenaNode({self.kind!r}, value={self.value!r}, line={self.line})"
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, Callable, List
 
 
 @dataclass
@@ -8,6 +8,13 @@ class ASTNode:
     value: Any = None
     children: List['ASTNode'] = field(default_factory=list)
     line: int = -1
+    # Tramo de tokens [start, end) que ocupa el nodo; solo lo tienen Program,
+    # Block, Finally y los ITEM de un bloque (lo usa Parser.reparse)
+    start: int = field(default=-1, repr=False, compare=False)
+    end: int = field(default=-1, repr=False, compare=False)
+    # Solo se pone en el Program: True si el árbol puede tener LazyBlock sin
+    # cargar (no es un campo, así que no ocupa lugar en los demás nodos)
+    deferred = False
 
     def add(self, node: 'ASTNode') -> None:
         if node is not None:
@@ -15,12 +22,55 @@ class ASTNode:
             self.children.append(node)
 
 
+class LazyBlock(ASTNode):
+    """BLOCK que se parsea la primera vez que se piden sus hijos.
+
+    load devuelve la lista de ITEM del bloque. Hasta entonces solo se conocen
+    el tramo y la línea, que es lo que necesita quien mira firmas de
+    funciones. Una vez cargado se compara e imprime igual que un Block normal.
+    """
+
+    def __init__(self, load: Callable[[], List[ASTNode]], line: int = -1, start: int = -1, end: int = -1):
+        self.kind = 'Block'
+        self.value = None
+        self.line = line
+        self.start = start
+        self.end = end
+        self.load = load
+        self._children = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.load is None
+
+    @property
+    def children(self) -> List[ASTNode]:
+        if self.load is not None:
+            self._children = self.load()
+            self.load = None
+        return self._children
+
+    @children.setter
+    def children(self, children: List[ASTNode]) -> None:
+        self._children = children
+        self.load = None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ASTNode):
+            return NotImplemented
+        return ((self.kind, self.value, self.children, self.line)
+                == (other.kind, other.value, other.children, other.line))
+
+
 def pretty_print(node: ASTNode, indent: int = 0) -> None:
-    pad = '  ' * indent
-    if node is None:
-        print(pad + '<empty>')
-        return
-    val = f": {node.value}" if node.value is not None else ''
-    print(f"{pad}{node.kind}{val}")
-    for c in node.children:
-        pretty_print(c, indent + 1)
+    # Preorden con pila explícita (hijos apilados al revés), sin recursión
+    stack = [(node, indent)]
+    while stack:
+        node, indent = stack.pop()
+        pad = '  ' * indent
+        if node is None:
+            print(pad + '<empty>')
+            continue
+        val = f": {node.value}" if node.value is not None else ''
+        print(f"{pad}{node.kind}{val}")
+        stack.extend((c, indent + 1) for c in reversed(node.children))
@@ -0,0 +1,50 @@
+# Memoria del AST como árbol de ASTNode y empaquetado en un ASTArena, para
+# programas generados de tamaño creciente (el último pasa del millón de nodos).
+#
+#     python -m Parser.bench_arena
+import tracemalloc
+
+from Parser.arena import ASTArena
+from Parser.parser import Parser
+from Tokens.automaton import default_automaton
+from Tokens.tokenizer import process_tokens
+
+FUNCTION = '''fishtion f{i}(<int a, <string b) <int {{
+    <int x <= a <+ {i} <* (a <- 2)<D
+    whale (x << 10) {{
+        if (x <== 3) {{ splash(b)<D }} else {{ x <++<D }}
+    }}
+    emerge x<D
+}}
+'''
+SIZES = (1000, 10000, 30000)
+
+
+def program(functions: int) -> str:
+    return 'fish {\n' + ''.join(FUNCTION.format(i=i) for i in range(functions)) + '}\n'
+
+
+def measure(tokens) -> tuple:
+    # Bytes que ocupa el árbol recién parseado y los del arena una vez que el
+    # árbol se libera
+    parser = Parser(tokens)
+    tracemalloc.start()
+    ast = parser.parse()
+    tree_bytes = tracemalloc.get_traced_memory()[0]
+    arena = ASTArena.pack(ast)
+    del ast
+    arena_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(arena), tree_bytes, arena_bytes
+
+
+def main():
+    automaton = default_automaton()
+    for functions in SIZES:
+        nodes, tree_bytes, arena_bytes = measure(process_tokens(automaton, program(functions)))
+        print(f'{nodes:>9} nodos  ASTNode {tree_bytes / nodes:6.1f} B/nodo  '
+              f'ASTArena {arena_bytes / nodes:6.1f} B/nodo  ({tree_bytes / arena_bytes:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
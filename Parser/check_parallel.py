@@ -0,0 +1,76 @@
+# Comprueba que analyze_parallel da lo mismo que analyze ordenado por (línea,
+# index): los mismos errores, con sus líneas, conteos y aborted, con y sin
+# dedupe y con y sin max_errors. Los programas generados tienen errores
+# semánticos repetidos dentro y fuera de funciones anidadas, varios en una
+# misma línea, y se revisan en este proceso y repartidos entre procesos.
+#
+#     python -m Parser.check_parallel
+import random
+from operator import attrgetter
+
+from Parser.parser import Parser
+from Parser.semantic import SemanticAnalyzer
+from Tokens.automaton import default_automaton
+from Tokens.tokenizer import process_tokens
+
+PROGRAMS = 300
+MODES = ({'max_errors': None}, {'max_errors': None, 'dedupe': False}, {'max_errors': 1},
+         {'max_errors': 3}, {'max_errors': 8}, {'max_errors': 5, 'dedupe': False})
+STATEMENTS = ('<int {v} <= 1 <D', '{v} <= 2 <D', '{v} <= "s" <D', 'splash({v}) <D', '{v} <++<D',
+              '<string {v} <= 3 <D', 'f{n}(1) <D', 'emerge {v} <D')
+
+
+def statements(rng: random.Random, count: int) -> str:
+    # Varias sentencias por línea: los errores empatan en línea
+    names = 'abcxy'
+    line = []
+    for _ in range(count):
+        line.append(rng.choice(STATEMENTS).format(v=rng.choice(names), n=rng.randrange(4)))
+        if rng.random() < 0.4:
+            line.append('\n')
+    return ' '.join(line)
+
+
+def function(rng: random.Random, index: int, depth: int) -> str:
+    body = [statements(rng, rng.randrange(1, 6))]
+    if depth < 2 and rng.random() < 0.5:
+        body.append(function(rng, index * 10 + 1, depth + 1))
+        body.append(statements(rng, rng.randrange(3)))
+    return f'fishtion f{index}(<int a) <int {{\n' + '\n'.join(body) + '\nemerge a <D\n}\n'
+
+
+def program(rng: random.Random) -> str:
+    parts = []
+    for index in range(rng.randrange(1, 6)):
+        parts.append(statements(rng, rng.randrange(4)))
+        parts.append(function(rng, index, 0))
+    parts.append(statements(rng, rng.randrange(4)))
+    return 'fish {\n' + '\n'.join(parts) + '\n}\n'
+
+
+def view(errors) -> list:
+    return [(d.code, d.args, d.line, d.start, d.count) for d in errors]
+
+
+def main():
+    automaton = default_automaton()
+    rng = random.Random(22)
+    for number in range(PROGRAMS):
+        parser = Parser(process_tokens(automaton, program(rng)), recover=True)
+        ast = parser.parse()
+        for options in MODES:
+            sequential = SemanticAnalyzer(parser.names, **options)
+            sequential.analyze(ast)
+            parallel = SemanticAnalyzer(parser.names, **options)
+            if number % 50 == 0:
+                parallel.analyze_parallel(ast, workers=2, min_tokens=0)
+            else:
+                parallel.analyze_parallel(ast, workers=1)
+            expected = sorted(sequential.errors, key=attrgetter('line', 'index'))
+            assert view(parallel.errors) == view(expected), (number, options)
+            assert parallel.aborted == sequential.aborted, (number, options)
+    print(f'{PROGRAMS} programas, {len(MODES)} modos: analyze_parallel igual a analyze')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+from typing import Any, Dict, Tuple
+
+ERROR = 'error'
+WARNING = 'warning'
+
+# Máximo de errores que se registran por defecto (parser en modo de
+# recuperación y SemanticAnalyzer)
+MAX_ERRORS = 100
+
+# Código -> plantilla del mensaje; los {0}, {1}... son los argumentos del
+# Diagnostic. E1xx: sintácticos, E2xx: semánticos, W3xx: avisos de lint,
+# E4xx: de ejecución (Runtime/)
+MESSAGES: Dict[str, str] = {
+    'E100': "Se esperaba '{0}' pero llegó '{1}'",
+    'E101': "Tokens extra después de finalizar PROGRAM: '{0}'",
+    'E102': "PROGRAM debe iniciar con 'fish'",
+    'E103': "Falta '}}' al cerrar BLOCK",
+    'E104': "Se esperaba '{{' al iniciar un BLOCK",
+    'E105': "Token inesperado al iniciar ITEM",
+    'E106': "Se esperaba 'ident' en DECLARATION",
+    'E107': "Se esperaba '<D' al final de DECLARATION",
+    'E108': "Se esperaba '<=' en DECLARATION_TAIL",
+    'E109': "Tipo inválido en TYPE",
+    'E110': "Se esperaba nombre de funcion",
+    'E111': "Token inesperado en PARAMS",
+    'E112': "Se esperaba identificador en PARAM",
+    'E113': "Token inesperado al iniciar STATEMENT",
+    'E114': "Forma inválida de IDENT_STMT",
+    'E115': "Token inesperado en ARGS",
+    'E116': "Token inesperado en FOR_INIT",
+    'E117': "Token inesperado en FOR_COND",
+    'E118': "Token inesperado en FOR_STEP",
+    'E119': "Token inválido en FOR_STEP_TAIL",
+    'E120': "Se esperaba ident en DECL_NO_DELIM",
+    'E121': "ASSIGN_NO_DELIM espera '<=' o '<--' después de ident",
+    'E122': "Token inesperado en UNARY: '{0}' (lexema: '{1}')",
+    'E200': "Variable '{0}' ya declarada en este ámbito",
+    'E201': "Función '{0}' ya declarada",
+    'E202': "Variable '{0}' no declarada",
+    'E203': "Llamada a función no declarada '{0}'",
+    'E204': "Inicializador de '{0}' no es compatible con el tipo {1}",
+    'E205': "Asignación a '{0}' ({1}) con tipo incompatible {2}",
+    'E206': "Llamada a '{0}' con {1} args, esperaba {2}",
+    'E207': "Arg {1} en llamada a '{0}' incompatible: esperaba {2}, tiene {3}",
+    'E208': "'return' fuera de función",
+    'E209': "Tipo de retorno incompatible en función '{0}': esperaba {1}, obtuvo {2}",
+    'E210': "Operación binaria '{0}' entre tipos incompatibles: {1} y {2}",
+    'W300': "Bloque vacío",
+    'W301': "Código inalcanzable después de 'emerge'",
+    'E400': "División por cero",
+    'E401': "Módulo por cero",
+    'E402': "Recursión demasiado profunda en la llamada a '{0}'",
+    'E403': "No se puede ejecutar '{0}': el programa tiene errores",
+    'E404': "Programa demasiado grande para el bytecode en '{0}'",
+    'E405': "CPython no puede compilar el programa traducido: {0}",
+    'E406': "No se puede llamar a '{0}' fuera de la función que la define: usa sus variables",
+    'E407': "Operación '{0}' entre valores incompatibles",
+    'E408': "Expresión demasiado anidada para compilarla a closures",
+}
+
+
+class Diagnostic:
+    """Un error o aviso del front-end, sin formatear.
+
+    Guarda el código, la severidad, la línea, el tramo de tokens [start, end)
+    (-1 si el nodo no lo tiene) y los argumentos del mensaje; el texto sale de
+    MESSAGES recién al pedirlo (str o message). count cuenta las veces que se
+    encontró: las repeticiones (mismo código y mismos argumentos, p. ej. la
+    misma variable no declarada) se suman aquí en lugar de agregarse. index es
+    su posición en el recorrido del análisis semántico (el orden de analyze),
+    que desempata los de una misma línea.
+    """
+
+    __slots__ = ('code', 'severity', 'line', 'start', 'end', 'args', 'count', 'index')
+
+    def __init__(self, code: str, line: int, start: int = -1, end: int = -1,
+                 args: Tuple[Any, ...] = (), severity: str = ERROR):
+        self.code = code
+        self.severity = severity
+        self.line = line
+        self.start = start
+        self.end = end
+        self.args = args
+        self.count = 1
+        self.index = 0
+
+    @property
+    def key(self) -> tuple:
+        # Lo que identifica a las repeticiones
+        return (self.code, self.args)
+
+    @property
+    def message(self) -> str:
+        return MESSAGES[self.code].format(*self.args)
+
+    def __str__(self) -> str:
+        return f"[Línea {self.line}] {self.message}"
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.code!r}, line={self.line}, args={self.args!r})"
+
+
+class ErrorLimit(Exception):
+    # La lanza quien registra diagnósticos al llegar a su max_errors, para
+    # cortar el recorrido en curso
+    pass
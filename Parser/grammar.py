@@ -0,0 +1,153 @@
+from Helpers.tokenizerHelpers import TOKEN_TYPES, TOKEN_TYPE_IDS
+
+# Gramática de Fish++ (la misma que documentan los métodos de Parser) en BNF:
+# las repeticiones ( ... )* y los opcionales quedan como no terminales con
+# prima y una producción vacía ([]). Los terminales son tipos de token.
+GRAMMAR = {
+    'PROGRAM': [['fish', 'BLOCK']],
+    'BLOCK': [['{', 'DECLS_AND_STMTS', '}']],
+    'DECLS_AND_STMTS': [['ITEM', 'DECLS_AND_STMTS'], []],
+    'ITEM': [['DECLARATION'], ['FUNCTION_DEF'], ['STATEMENT']],
+    'DECLARATION': [['TYPE', 'ident', 'DECLARATION_TAIL']],
+    'DECLARATION_TAIL': [['<=', 'EXPR', '<D']],
+    'TYPE': [['<int'], ['<string'], ['<charal'], ['<bubble'], ['<hook']],
+    'FUNCTION_DEF': [['fishtion', 'ident', '(', 'PARAMS', ')', 'TYPE', 'BLOCK']],
+    'PARAMS': [['PARAM', "PARAMS'"], []],
+    "PARAMS'": [[',', 'PARAM', "PARAMS'"], []],
+    'PARAM': [['TYPE', 'ident']],
+    'STATEMENT': [['IF_ELSE'], ['WHILE_LOOP'], ['FOR_LOOP'], ['TRY_CATCH'],
+                  ['PRINT_STMT'], ['RETURN_STMT'], ['BLOCK'], ['IDENT_STMT']],
+    'IDENT_STMT': [['ident', 'IDENT_TAIL']],
+    'IDENT_TAIL': [['(', 'ARGS', ')', '<D'], ['<=', 'EXPR', '<D'], ['<++', '<D'], ['<--', '<D']],
+    'ARGS': [['EXPR', "ARGS'"], []],
+    "ARGS'": [[',', 'EXPR', "ARGS'"], []],
+    'IF_ELSE': [['if', '(', 'EXPR', ')', 'BLOCK', 'ELSE_PART']],
+    'ELSE_PART': [['else', 'BLOCK'], []],
+    'WHILE_LOOP': [['whale', '(', 'EXPR', ')', 'BLOCK']],
+    'FOR_LOOP': [['fork', '(', 'FOR_INIT', '<D', 'FOR_COND', '<D', 'FOR_STEP', ')', 'BLOCK']],
+    'FOR_INIT': [['DECL_NO_DELIM'], ['ASSIGN_NO_DELIM'], []],
+    'FOR_COND': [['EXPR'], []],
+    'FOR_STEP': [['ident', 'FOR_STEP_TAIL'], []],
+    'FOR_STEP_TAIL': [['<++'], ['<--'], ['<=', 'EXPR']],
+    'DECL_NO_DELIM': [['TYPE', 'ident', '<=', 'EXPR']],
+    'ASSIGN_NO_DELIM': [['ident', 'ASSIGN_NO_DELIM_TAIL']],
+    'ASSIGN_NO_DELIM_TAIL': [['<=', 'EXPR'], ['<--']],
+    'TRY_CATCH': [['try', 'BLOCK', 'catch', 'BLOCK', 'TRY_CATCH_TAIL']],
+    'TRY_CATCH_TAIL': [['finally', 'BLOCK'], []],
+    'PRINT_STMT': [['splash', '(', 'EXPR', ')', '<D']],
+    'RETURN_STMT': [['emerge', 'EXPR', '<D']],
+    'EXPR': [['EQUALITY']],
+    'EQUALITY': [['RELATIONAL', "EQUALITY'"]],
+    "EQUALITY'": [['<==', 'RELATIONAL', "EQUALITY'"], ['<!=', 'RELATIONAL', "EQUALITY'"], []],
+    'RELATIONAL': [['ADD', "RELATIONAL'"]],
+    "RELATIONAL'": [['<<', 'ADD', "RELATIONAL'"], ['<<>', 'ADD', "RELATIONAL'"],
+                    ['<<=', 'ADD', "RELATIONAL'"], ['<<>=', 'ADD', "RELATIONAL'"], []],
+    'ADD': [['MUL', "ADD'"]],
+    "ADD'": [['<+', 'MUL', "ADD'"], ['<-', 'MUL', "ADD'"], []],
+    'MUL': [['UNARY', "MUL'"]],
+    "MUL'": [['<*', 'UNARY', "MUL'"], ['</', 'UNARY', "MUL'"], ['<%', 'UNARY', "MUL'"], []],
+    'UNARY': [['<+', 'UNARY'], ['<-', 'UNARY'], ['POSTFIX']],
+    'POSTFIX': [['PRIMARY', "POSTFIX'"]],
+    "POSTFIX'": [['<++', "POSTFIX'"], ['<--', "POSTFIX'"], []],
+    'PRIMARY': [['ident', 'CALL_PART'], ['NUM'], ['STRING_LITERAL'], ['CHAR_LITERAL'], ['(', 'EXPR', ')']],
+    'CALL_PART': [['(', 'ARGS', ')'], []],
+}
+
+START = 'PROGRAM'
+END = TOKEN_TYPE_IDS['$']
+
+# No terminales cuya producción vacía solo se elige con un token de FOLLOW; en
+# el resto (repeticiones y opcionales) se elige con cualquier token que no
+# inicie otra producción y el error, si lo hay, lo reporta quien sigue
+STRICT_EPSILON = {'PARAMS', 'ARGS', 'FOR_INIT', 'FOR_COND', 'FOR_STEP'}
+
+# Entrada de la tabla de predicción sin producción aplicable
+NO_PRODUCTION = -1
+
+
+def bitset(*types: str) -> int:
+    # Conjunto de tipos de token como entero: el bit TOKEN_TYPE_IDS[tipo]
+    bits = 0
+    for typ in types:
+        bits |= 1 << TOKEN_TYPE_IDS[typ]
+    return bits
+
+
+def first_of(sequence, first: dict, nullable: set) -> tuple:
+    # FIRST de una secuencia de símbolos y si puede derivar vacío
+    bits = 0
+    for symbol in sequence:
+        if symbol not in GRAMMAR:
+            return bits | bitset(symbol), False
+        bits |= first[symbol]
+        if symbol not in nullable:
+            return bits, False
+    return bits, True
+
+
+def first_sets() -> tuple:
+    # FIRST de cada no terminal (bitsets) y el conjunto de no terminales anulables
+    first = {name: 0 for name in GRAMMAR}
+    nullable = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, productions in GRAMMAR.items():
+            for production in productions:
+                bits, empty = first_of(production, first, nullable)
+                if bits | first[name] != first[name]:
+                    first[name] |= bits
+                    changed = True
+                if empty and name not in nullable:
+                    nullable.add(name)
+                    changed = True
+    return first, nullable
+
+
+def follow_sets(first: dict, nullable: set) -> dict:
+    follow = {name: 0 for name in GRAMMAR}
+    follow[START] = 1 << END
+    changed = True
+    while changed:
+        changed = False
+        for name, productions in GRAMMAR.items():
+            for production in productions:
+                for i, symbol in enumerate(production):
+                    if symbol not in GRAMMAR:
+                        continue
+                    bits, empty = first_of(production[i + 1:], first, nullable)
+                    if empty:
+                        bits |= follow[name]
+                    if bits | follow[symbol] != follow[symbol]:
+                        follow[symbol] |= bits
+                        changed = True
+    return follow
+
+
+def predict_table(first: dict, nullable: set, follow: dict) -> dict:
+    # no terminal -> lista indexada por tipo de token con el índice de la
+    # producción a aplicar (o NO_PRODUCTION). Falla si la gramática no es LL(1).
+    table = {}
+    for name, productions in GRAMMAR.items():
+        row = [NO_PRODUCTION] * len(TOKEN_TYPES)
+        epsilon = NO_PRODUCTION
+        for index, production in enumerate(productions):
+            bits, empty = first_of(production, first, nullable)
+            if empty:
+                epsilon = index
+                bits |= follow[name]
+            for kind in range(len(TOKEN_TYPES)):
+                if bits >> kind & 1:
+                    if row[kind] != NO_PRODUCTION:
+                        raise ValueError(f"La gramática no es LL(1): conflicto en {name} con '{TOKEN_TYPES[kind]}'")
+                    row[kind] = index
+        if epsilon != NO_PRODUCTION and name not in STRICT_EPSILON:
+            row = [epsilon if index == NO_PRODUCTION else index for index in row]
+        table[name] = row
+    return table
+
+
+# Se calculan una vez al importar
+FIRST, NULLABLE = first_sets()
+FOLLOW = follow_sets(FIRST, NULLABLE)
+PREDICT = predict_table(FIRST, NULLABLE, FOLLOW)
@@ -0,0 +1,37 @@
+from typing import List
+
+from Parser.ast import ASTNode
+from Parser.diagnostics import WARNING, Diagnostic
+from Parser.passes import Pass
+
+
+class LintRule(Pass):
+    # Regla de estilo: una pasada que solo junta avisos (no cambia el
+    # resultado del análisis). Se corre junto al semántico con
+    # SemanticAnalyzer.analyze(ast, rules=[...]) o con run_passes
+    def __init__(self):
+        self.warnings: List[Diagnostic] = []
+
+    def warn(self, node: ASTNode, code: str, *args) -> None:
+        self.warnings.append(Diagnostic(code, node.line, node.start, node.end, args, WARNING))
+
+
+class EmptyBlock(LintRule):
+    # Bloques sin nada adentro ({ })
+    def enter_Block(self, node: ASTNode) -> None:
+        if not node.children:
+            self.warn(node, 'W300')
+
+
+class UnreachableCode(LintRule):
+    # Lo que sigue a un emerge en el mismo bloque no se ejecuta nunca
+    def enter_Block(self, node: ASTNode) -> None:
+        items = node.children
+        for i, item in enumerate(items[:-1]):
+            if item.kind == 'Return':
+                self.warn(items[i + 1], 'W301')
+                break
+
+
+# Las reglas que trae el compilador
+DEFAULT_RULES = (EmptyBlock, UnreachableCode)
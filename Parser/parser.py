@@ -1,6 +1,16 @@
+import gc
+import re
+from array import array
 from dataclasses import dataclass
-from typing import List, Optional
-from Parser.ast import ASTNode
+from functools import partial
+from types import GeneratorType
+from typing import Iterator, List, Optional
+from Helpers.tokenizerHelpers import TOKEN_TYPES, TOKEN_TYPE_IDS
+from Parser.ast import ASTNode, LazyBlock
+from Parser.diagnostics import MAX_ERRORS, Diagnostic
+from Parser.grammar import END, FIRST, PREDICT, bitset
+from Tokens.stream import TokenStream, TokenCursor
+from Tokens.tokenizer import token_diff
 
 
 @dataclass
@@ -11,224 +21,630 @@ class Token:
 
 
 class ParseError(Exception):
-    pass
+    # Error sintáctico: lleva su Diagnostic (que se formatea recién en str) y
+    # la posición del token donde ocurrió
+    def __init__(self, diagnostic: Diagnostic, pos: int = -1):
+        super().__init__(diagnostic)
+        self.diagnostic = diagnostic
+        self.line = diagnostic.line
+        self.pos = pos
 
+    def __str__(self) -> str:
+        return str(self.diagnostic)
 
-class Parser:
-    def __init__(self, tokens: List):
-        # Convertir tuplas a objetos Token
-        token_objects = []
-        for i, token in enumerate(tokens):
-            if isinstance(token, tuple):
-                # token puede venir como (lexeme, type) o (lexeme, type, line)
-                if len(token) == 3:
-                    lexeme, token_type, line = token
-                else:
-                    lexeme, token_type = token
-                    line = i + 1
-                token_objects.append(Token(type=token_type, lexeme=lexeme, line=line))
-            else:
-                token_objects.append(token)
 
-        # Agregamos token de fin de entrada $
-        self.tokens = token_objects + [Token(type='$', lexeme='$', line=-1)]
+# Tipos de token como enteros (ids de TOKEN_TYPE_IDS, los mismos de TokenStream.kind)
+FISH = TOKEN_TYPE_IDS['fish']
+LBRACE = TOKEN_TYPE_IDS['{']
+RBRACE = TOKEN_TYPE_IDS['}']
+LPAREN = TOKEN_TYPE_IDS['(']
+RPAREN = TOKEN_TYPE_IDS[')']
+COMMA = TOKEN_TYPE_IDS[',']
+DELIM = TOKEN_TYPE_IDS['<D']
+ASSIGN = TOKEN_TYPE_IDS['<=']
+INC = TOKEN_TYPE_IDS['<++']
+DEC = TOKEN_TYPE_IDS['<--']
+PLUS = TOKEN_TYPE_IDS['<+']
+MINUS = TOKEN_TYPE_IDS['<-']
+IDENT = TOKEN_TYPE_IDS['ident']
+NUM = TOKEN_TYPE_IDS['NUM']
+STRING_LITERAL = TOKEN_TYPE_IDS['STRING_LITERAL']
+CHAR_LITERAL = TOKEN_TYPE_IDS['CHAR_LITERAL']
+FISHTION = TOKEN_TYPE_IDS['fishtion']
+IF = TOKEN_TYPE_IDS['if']
+ELSE = TOKEN_TYPE_IDS['else']
+WHALE = TOKEN_TYPE_IDS['whale']
+FORK = TOKEN_TYPE_IDS['fork']
+TRY = TOKEN_TYPE_IDS['try']
+CATCH = TOKEN_TYPE_IDS['catch']
+FINALLY = TOKEN_TYPE_IDS['finally']
+SPLASH = TOKEN_TYPE_IDS['splash']
+EMERGE = TOKEN_TYPE_IDS['emerge']
+
+# Conjuntos FIRST precalculados (bitsets: kind in S  <=>  S >> kind & 1)
+FIRST_ITEM = FIRST['ITEM']
+FIRST_TYPE = FIRST['TYPE']
+FIRST_EXPR = FIRST['EXPR']
+FIRST_PRIMARY = FIRST['PRIMARY']
+EQUALITY_OPS = FIRST["EQUALITY'"]
+RELATIONAL_OPS = FIRST["RELATIONAL'"]
+ADD_OPS = FIRST["ADD'"]
+MUL_OPS = FIRST["MUL'"]
+POSTFIX_OPS = FIRST["POSTFIX'"]
+
+# Filas de la tabla de predicción que el parser consulta directamente
+PREDICT_ITEM = PREDICT['ITEM']
+PREDICT_STATEMENT = PREDICT['STATEMENT']
+PREDICT_IDENT_TAIL = PREDICT['IDENT_TAIL']
+PREDICT_FOR_INIT = PREDICT['FOR_INIT']
+PREDICT_FOR_STEP_TAIL = PREDICT['FOR_STEP_TAIL']
+PREDICT_PRIMARY = PREDICT['PRIMARY']
+
+# Precedencia de cada operador binario (0 si el tipo no lo es), de menor a mayor
+# según el nivel de la gramática en que aparece
+PRECEDENCE = [0] * len(TOKEN_TYPES)
+for _level, _ops in enumerate((EQUALITY_OPS, RELATIONAL_OPS, ADD_OPS, MUL_OPS), 1):
+    for _kind in range(len(TOKEN_TYPES)):
+        if _ops >> _kind & 1:
+            PRECEDENCE[_kind] = _level
+# Elementos de la pila de expr que no son binarios (precedencia < 1)
+UNARY_FRAME = -1
+GROUP_FRAME = -2
+CALL_FRAME = -3
+# Producción de PRIMARY -> tipo de nodo de los literales
+LITERAL_NODES = (None, 'Num', 'String', 'Char')
+# Llaves en la columna de tipos (para saltar el cuerpo de una función sin parsearlo)
+BRACES = re.compile(b'[' + re.escape(bytes([LBRACE])) + re.escape(bytes([RBRACE])) + b']')
+# Inicios de sentencia en los que se resincroniza tras un error (además de <D y }).
+# Los identificadores no están: aparecen a mitad de expresión y resincronizar
+# en ellos solo suma errores en cascada
+SYNC_STARTS = bitset('if', 'whale', 'fork', 'try', 'splash', 'emerge', 'fishtion',
+                     '<int', '<string', '<charal', '<bubble', '<hook')
+
+
+class Parser:
+    def __init__(self, tokens, recover: bool = False, max_errors: int = MAX_ERRORS, lazy: bool = False):
+        # tokens puede ser un TokenStream (lo que devuelve process_tokens) o una
+        # lista de tuplas (lexeme, type[, line]) / Token, que se pasa a columnas.
+        # Con recover=True parse() no se detiene en el primer error: lo guarda en
+        # errors, deja un nodo Error en el AST y sigue (hasta max_errors errores).
+        # Con lazy=True el cuerpo de cada función se salta por conteo de llaves y
+        # queda como un LazyBlock que se parsea al pedir sus hijos (sin efecto
+        # con recover, donde los errores se reportan todos al parsear)
+        if not isinstance(tokens, TokenStream):
+            tokens = TokenStream.from_tokens(tokens)
+        self.tokens = tokens
+        # Nombres internados de la compilación (los de tokens): los valores de
+        # los nodos con nombre son los objetos de esta tabla
+        self.names = tokens.names
+        # Columnas de tipo y línea con un centinela al final: pasado el último
+        # token se lee el token de fin de entrada $ (línea -1)
+        self.kinds = tokens.kind.tobytes() + bytes([END])
+        self.lines = tokens.line + array('i', [-1])
         self.pos = 0
+        self.recover = recover
+        self.max_errors = max_errors
+        self.lazy = lazy and not recover
+        # Si el árbol que se reparsea puede tener LazyBlock sin cargar
+        self.deferred = False
+        self.errors: List[ParseError] = []
+        # Producción elegida por la tabla de predicción -> método que la construye
+        self.items = (self.declaration, self.function_def)
+        self.statements = (self.if_else, self.while_loop, self.for_loop, self.try_catch,
+                           self.print_stmt, self.return_stmt, self.block, self.ident_stmt)
 
     # ---------------------------------------------
     # Utilidades básicas
     # ---------------------------------------------
     @property
-    def current(self) -> Token:
-        return self.tokens[self.pos]
+    def diagnostics(self) -> List[Diagnostic]:
+        # Los errores registrados, como Diagnostic (igual que SemanticAnalyzer.errors)
+        return [error.diagnostic for error in self.errors]
+
+    @property
+    def current(self) -> TokenCursor:
+        # Vista del token actual (tipo, lexema, línea) para depurar o reportar
+        cursor = TokenCursor(self.tokens)
+        cursor.pos = self.pos
+        return cursor
+
+    def type_name(self) -> str:
+        return TOKEN_TYPES[self.kinds[self.pos]]
+
+    def lexeme(self) -> str:
+        if self.kinds[self.pos] == END:
+            return '$'
+        return self.tokens.name(self.pos)
+
+    def error(self, code: str, *args) -> ParseError:
+        # Error code (ver Parser/diagnostics.py) en el token actual
+        pos = self.pos
+        return ParseError(Diagnostic(code, self.lines[pos], pos, pos + 1, args), pos)
 
     def advance(self) -> None:
-        if self.pos < len(self.tokens) - 1:
+        if self.kinds[self.pos] != END:
             self.pos += 1
 
-    def match(self, expected_type: str) -> None:
-        if self.current.type == expected_type:
-            self.advance()
+    def match(self, expected: int) -> None:
+        if self.kinds[self.pos] == expected:
+            self.pos += 1
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                f"Se esperaba '{expected_type}' pero llegó '{self.current.type}'"
-            )
+            raise self.expected(expected)
 
-    def check(self, *types: str) -> bool:
-        return self.current.type in types
+    def expected(self, expected: int) -> ParseError:
+        return self.error('E100', TOKEN_TYPES[expected], self.type_name())
+
+    def run(self, production) -> ASTNode:
+        # Ejecuta una producción con una pila explícita en lugar de la pila de
+        # Python. Las producciones que contienen bloques son generadores: ceden
+        # (yield) el método de la subproducción que necesitan y reciben su nodo.
+        # Los métodos que no son generadores devuelven el nodo directamente.
+        # En modo de recuperación un ParseError se lanza (throw) dentro del
+        # generador que pidió la subproducción fallida, hasta que un BLOCK lo atrapa.
+        value = production()
+        if type(value) is not GeneratorType:
+            return value
+        stack = [value]
+        value = None
+        error = None
+        while True:
+            try:
+                if error is None:
+                    production = stack[-1].send(value)
+                else:
+                    failed, error = error, None
+                    production = stack[-1].throw(failed)
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+                if not stack:
+                    return value
+                continue
+            except ParseError as failed:
+                stack.pop()
+                if not self.recover or not stack:
+                    raise
+                error = failed
+                continue
+            try:
+                value = production()
+            except ParseError as failed:
+                if not self.recover:
+                    raise
+                error = failed
+                continue
+            if type(value) is GeneratorType:
+                stack.append(value)
+                value = None
+
+    # ---------------------------------------------
+    # Recuperación de errores (modo pánico)
+    # ---------------------------------------------
+    def record(self, error: ParseError) -> None:
+        # Un error en la misma posición que el anterior es una consecuencia de
+        # aquel y no se registra. Al llegar a max_errors se salta al final de la
+        # entrada: los bloques abiertos se cierran sin más errores.
+        if self.errors and self.errors[-1].pos == error.pos:
+            return
+        if len(self.errors) >= self.max_errors:
+            self.pos = len(self.kinds) - 1
+            return
+        self.errors.append(error)
+
+    def synchronize(self, start: int) -> None:
+        # Descarta tokens hasta <D (que se consume), '}' o un inicio de sentencia,
+        # saltando bloques { ... } completos. start es donde empezó lo que falló:
+        # ahí no se resincroniza, para avanzar siempre.
+        kinds = self.kinds
+        pos = self.pos
+        depth = 0
+        while True:
+            kind = kinds[pos]
+            if kind == END:
+                break
+            if kind == LBRACE:
+                depth += 1
+            elif kind == RBRACE:
+                if not depth:
+                    break
+                depth -= 1
+            elif not depth:
+                if kind == DELIM:
+                    pos += 1
+                    break
+                if SYNC_STARTS >> kind & 1 and pos > start:
+                    break
+            pos += 1
+        self.pos = pos
+
+    def recovered(self, error: ParseError, start: int) -> ASTNode:
+        # Registra el error, resincroniza y devuelve el nodo Error que ocupa el
+        # lugar de lo que no se pudo construir
+        self.record(error)
+        self.synchronize(start)
+        return ASTNode('Error', value=str(error), line=error.line)
+
+    def spanned(self, node: ASTNode, start: int) -> ASTNode:
+        # Le da a node el tramo [start, pos) y deja los tramos de sus hijos
+        # (bloques y Finally) relativos a start; los ITEM de un Block ya son
+        # relativos al bloque. Así un nodo desplazado no toca sus descendientes.
+        if node.kind != 'Block':
+            for child in node.children:
+                if child.end >= 0:
+                    child.start -= start
+                    child.end -= start
+        node.start = start
+        node.end = self.pos
+        return node
 
     # ---------------------------------------------
     # Entrada principal
     # ---------------------------------------------
     def parse(self) -> ASTNode:
-        ast = self.program()
-        if self.current.type != '$':
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                f"Tokens extra después de finalizar PROGRAM: '{self.current.type}'"
-            )
+        # El AST no forma ciclos: mientras se construye se pausa el recolector de
+        # ciclos, que si no recorre una y otra vez los nodos ya creados
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            ast = self.run(self.program)
+        finally:
+            if enabled:
+                gc.enable()
+        if self.kinds[self.pos] != END:
+            error = self.error('E101', self.type_name())
+            if not self.recover:
+                raise error
+            self.record(error)
         return ast
 
+    # ---------------------------------------------
+    # Reparseo incremental
+    # ---------------------------------------------
+    def reparse(self, previous_ast: ASTNode, previous_tokens: TokenStream) -> ASTNode:
+        # previous_ast es el AST de previous_tokens y los tokens de este parser son
+        # los de previous_tokens tras una edición (p. ej. lo que devuelve relex).
+        # Solo se vuelven a parsear los ITEM del bloque más interno que contiene
+        # el cambio; el resto de los nodos se reutiliza tal cual, corrigiendo sus
+        # tramos y líneas. previous_ast se actualiza en su lugar y queda igual al
+        # que daría parse() (que es lo que se usa en modo de recuperación). En un
+        # árbol lazy los cuerpos que se reutilizan no se cargan: al cargarlos dan
+        # los mismos nodos, o el mismo primer error, que un parse() lazy nuevo,
+        # también si la edición deja el programa inválido
+        changed = self.tokens.changed
+        if changed is None or len(previous_tokens) - changed[1] != len(self.tokens) - changed[2]:
+            changed = token_diff(previous_tokens, self.tokens)
+        first, old_end, new_end = changed
+        if self.recover or previous_ast.end != len(previous_tokens):
+            return self.parse()
+        # Con un árbol lazy, los cuerpos sin cargar que se reutilizan pasan a
+        # este parser (ver rebind)
+        self.deferred = previous_ast.deferred
+        delta = new_end - old_end
+        shift = self.lines[new_end] - previous_tokens.line[old_end] if old_end < len(previous_tokens) else 0
+        if first == old_end and not delta and not shift:
+            return previous_ast
+
+        # Camino de nodos con tramo que contienen el cambio sin tocar sus bordes
+        # (el primer token y el que sigue al último, que decidieron dónde acaban),
+        # con el inicio absoluto de cada uno
+        path = [(previous_ast, 0)]
+        node, base = previous_ast, 0
+        while True:
+            if isinstance(node, LazyBlock) and not node.loaded:
+                # Un cuerpo sin cargar no se carga aquí (se haría con los tokens viejos)
+                break
+            children = node.children
+            if node.kind == 'Block':
+                i = search(children, 'start', first - base, right=True) - 1
+                candidates = children[i:i + 1] if i >= 0 else ()
+            else:
+                candidates = children
+            for child in candidates:
+                if child.end >= 0 and base + child.start < first and old_end < base + child.end:
+                    break
+            else:
+                break
+            node, base = child, base + child.start
+            path.append((node, base))
+
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for level in range(len(path) - 1, 0, -1):
+                block, base = path[level]
+                if block.kind != 'Block':
+                    continue
+                if isinstance(block, LazyBlock) and not block.loaded:
+                    if self.defer_block(block, base, delta, shift):
+                        break
+                elif self.reparse_block(block, base, first, new_end, delta, shift):
+                    break
+            else:
+                self.pos = 0
+                return self.parse()
+
+            # Los nodos que contienen el bloque crecen con él y lo que les sigue se
+            # desplaza (sus descendientes son relativos a ellos y no cambian)
+            for (outer, outer_base), (inner, _) in zip(path[level - 1::-1], path[level:0:-1]):
+                outer.end += delta
+                if outer.line >= 0:
+                    outer.line += shift
+                children = outer.children
+                if outer.kind == 'Block':
+                    index = search(children, 'start', inner.start, right=True) - 1
+                else:
+                    index = next(i for i, child in enumerate(children) if child is inner)
+                shift_nodes(children[index + 1:], delta, shift)
+                if self.deferred:
+                    self.rebind(children[index + 1:], outer_base)
+        finally:
+            if enabled:
+                gc.enable()
+        previous_ast.deferred = self.deferred or self.lazy
+        return previous_ast
+
+    def defer_block(self, block: LazyBlock, base: int, delta: int, shift: int) -> bool:
+        # block es un cuerpo sin cargar que contiene el cambio. Si su '{' todavía
+        # cierra en la misma '}' (corrida delta) sigue sin cargar, ahora con los
+        # tokens nuevos; si no, devuelve False y se reparsea el nivel de afuera
+        end = base + block.end - block.start + delta
+        if not self.lazy or self.matching_brace(base) != end:
+            return False
+        block.load = partial(self.lazy_body, base)
+        block.end += delta
+        if block.line >= 0:
+            block.line += shift
+        self.pos = len(self.kinds) - 1
+        return True
+
+    def rebind(self, nodes: List[ASTNode], base: int) -> None:
+        # Los LazyBlock sin cargar dentro de nodes (que siguen al cambio, con
+        # tramos relativos a base) se cargan desde aquí: con los tokens viejos
+        # darían posiciones, líneas y errores de antes de la edición. Los que
+        # están antes del cambio ven los mismos tokens y se quedan como están
+        lazy_body = self.lazy_body
+        pending = [(nodes, base)]
+        while pending:
+            nodes, base = pending.pop()
+            for node in nodes:
+                if node.end < 0:
+                    continue
+                start = base + node.start
+                if type(node) is LazyBlock and node.load is not None:
+                    node.load = partial(lazy_body, start)
+                elif node.children:
+                    pending.append((node.children, start))
+
+    def reparse_block(self, block: ASTNode, base: int, first: int, new_end: int, delta: int, shift: int) -> bool:
+        # Vuelve a parsear los ITEM de block (que empieza en base) que tocan el
+        # cambio, incluidos los que terminan justo en first (su token de
+        # anticipación cambió), hasta que un ITEM nuevo empieza donde empezaba uno
+        # viejo o el bloque cierra en su '}'. Devuelve False si ya no cierra ahí.
+        items = block.children
+        old_end = new_end - delta
+        lo = search(items, 'end', first - base)
+        hi = search(items, 'start', old_end - base)
+        pos = base + (items[lo - 1].end if lo else 1)
+        closing = base + block.end - block.start - 1 + delta
+        kinds = self.kinds
+        parsed = []
+        while True:
+            if pos >= new_end:
+                k = search(items, 'start', pos - delta - base, hi)
+                if k < len(items) and base + items[k].start == pos - delta or pos == closing:
+                    break
+            kind = kinds[pos]
+            if not FIRST_ITEM >> kind & 1:
+                # Igual que en block(): el parse completo fallaría aquí mismo
+                if kind == RBRACE:
+                    return False
+                self.pos = pos
+                raise self.error('E103')
+            self.pos = pos
+            node = self.spanned(self.run(self.item()), pos)
+            node.start -= base
+            node.end -= base
+            parsed.append(node)
+            pos = self.pos
+
+        shift_nodes(items[k:], delta, shift)
+        if self.deferred:
+            self.rebind(items[k:], base)
+        items[lo:k] = parsed
+        block.end += delta
+        if block.line >= 0:
+            block.line += shift
+        self.pos = len(self.kinds) - 1
+        return True
+
     # ---------------------------------------------
     # PROGRAM → fish BLOCK
     # ---------------------------------------------
-    def program(self) -> ASTNode:
-        if self.current.type == 'fish':
-            self.match('fish')
-            block_node = self.block()
-            return ASTNode('Program', children=[block_node], line=self.current.line)
+    def program(self) -> Iterator:
+        if self.kinds[self.pos] == FISH:
+            self.pos += 1
+        elif self.recover:
+            # Se intenta leer el BLOCK de todos modos
+            self.record(self.error('E102'))
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "PROGRAM debe iniciar con 'fish'"
-            )
+            raise self.error('E102')
+        try:
+            block_node = yield self.block
+        except ParseError as error:
+            # Solo en modo de recuperación: sin un BLOCK no hay dónde seguir
+            self.record(error)
+            self.pos = len(self.kinds) - 1
+            block_node = ASTNode('Error', value=str(error), line=error.line)
+        root = ASTNode('Program', children=[block_node], line=self.lines[self.pos], start=0, end=self.pos)
+        root.deferred = self.lazy
+        return root
 
     # ---------------------------------------------
     # BLOCK → { DECLS_AND_STMTS }
     # ---------------------------------------------
-    def block(self) -> ASTNode:
-        if self.current.type == '{':
-            self.match('{')
-            items = self.decls_and_stmts()
-            if self.current.type == '}':
-                self.match('}')
-                node = ASTNode('Block', children=items, line=self.current.line)
-                return node
+    def block(self) -> Iterator:
+        start = self.pos
+        if self.kinds[start] == LBRACE:
+            self.pos += 1
+            items = yield from self.decls_and_stmts()
+            for item in items:
+                if item.end >= 0:
+                    item.start -= start
+                    item.end -= start
+            if self.kinds[self.pos] == RBRACE:
+                self.pos += 1
+                return ASTNode('Block', children=items, line=self.lines[self.pos], start=start, end=self.pos)
+            elif self.recover:
+                # Fin de la entrada: el bloque se cierra con lo que se leyó
+                self.record(self.error('E103'))
+                return ASTNode('Block', children=items, line=self.lines[self.pos], start=start, end=self.pos)
             else:
-                raise ParseError(
-                    f"[Línea {self.current.line}] "
-                    "Falta '}' al cerrar BLOCK"
-                )
+                raise self.error('E103')
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Se esperaba '{' al iniciar un BLOCK"
-            )
+            raise self.error('E104')
 
     # ---------------------------------------------
     # DECLS_AND_STMTS → ITEM DECLS_AND_STMTS | ε
     # ---------------------------------------------
-    def decls_and_stmts(self) -> List[ASTNode]:
+    def decls_and_stmts(self) -> Iterator:
         items: List[ASTNode] = []
-        while self.check('<int', '<string', '<charal', '<bubble', '<hook',
-                         'fishtion', 'if', 'whale', 'fork', 'try',
-                         'splash', 'emerge', '{', 'ident'):
-            node = self.item()
-            items.append(node)
-        return items
+        kinds = self.kinds
+        while True:
+            while FIRST_ITEM >> kinds[self.pos] & 1:
+                start = self.pos
+                try:
+                    items.append(self.spanned((yield self.item()), start))
+                except ParseError as error:
+                    # Solo en modo de recuperación (run lanza aquí el error del ITEM)
+                    items.append(self.recovered(error, start))
+            kind = kinds[self.pos]
+            if not self.recover or kind == RBRACE or kind == END:
+                return items
+            # Token que no inicia un ITEM ni cierra el bloque
+            items.append(self.recovered(self.error('E103'), self.pos))
 
     # ---------------------------------------------
     # ITEM → DECLARATION | FUNCTION_DEF | STATEMENT
     # ---------------------------------------------
-    def item(self) -> ASTNode:
-        if self.check('<int', '<string', '<charal', '<bubble', '<hook'):
-            return self.declaration()
-        elif self.current.type == 'fishtion':
-            return self.function_def()
-        elif self.check('if', 'whale', 'fork', 'try', 'splash', 'emerge',
-                        '{', 'ident'):
+    def item(self):
+        # Devuelve el método que construye el ITEM que empieza en el token actual
+        production = PREDICT_ITEM[self.kinds[self.pos]]
+        if production < 0:
+            raise self.error('E105')
+        if production == 2:
             return self.statement()
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado al iniciar ITEM"
-            )
+        return self.items[production]
 
     # ---------------------------------------------
     # DECLARATION → TYPE ident DECLARATION_TAIL
     # ---------------------------------------------
     def declaration(self) -> ASTNode:
         type_node = self.type_()
-        if self.current.type == 'ident':
-            name = self.current.lexeme
-            self.match('ident')
+        if self.kinds[self.pos] == IDENT:
+            name = self.tokens.name(self.pos)
+            self.pos += 1
             init = self.declaration_tail()
-            node = ASTNode('Declaration', value=name, children=[type_node], line=self.current.line)
+            node = ASTNode('Declaration', value=name, children=[type_node], line=self.lines[self.pos])
             if init:
                 node.add(init)
             return node
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Se esperaba 'ident' en DECLARATION"
-            )
+            raise self.error('E106')
 
     # ---------------------------------------------
     # DECLARATION_TAIL → <= EXPR <D
     # ---------------------------------------------
     def declaration_tail(self) -> ASTNode:
-        if self.current.type == '<=':
-            self.match('<=')
+        if self.kinds[self.pos] == ASSIGN:
+            self.pos += 1
             expr_node = self.expr()
-            if self.current.type == '<D':
-                self.match('<D')
-                return ASTNode('Initializer', children=[expr_node], line=self.current.line)
+            if self.kinds[self.pos] == DELIM:
+                self.pos += 1
+                return ASTNode('Initializer', children=[expr_node], line=self.lines[self.pos])
             else:
-                raise ParseError(
-                    f"[Línea {self.current.line}] "
-                    "Se esperaba '<D' al final de DECLARATION"
-                )
+                raise self.error('E107')
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Se esperaba '<=' en DECLARATION_TAIL"
-            )
+            raise self.error('E108')
 
     # ---------------------------------------------
     # TYPE → <int | <string | <charal | <bubble | <hook
     # ---------------------------------------------
     def type_(self) -> ASTNode:
-        if self.check('<int', '<string', '<charal', '<bubble', '<hook'):
-            t = self.current.type
-            self.advance()
-            return ASTNode('Type', value=t, line=self.current.line)
+        kind = self.kinds[self.pos]
+        if FIRST_TYPE >> kind & 1:
+            self.pos += 1
+            return ASTNode('Type', value=TOKEN_TYPES[kind], line=self.lines[self.pos])
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Tipo inválido en TYPE"
-            )
+            raise self.error('E109')
 
     # ---------------------------------------------
     # FUNCTION_DEF → fishtion ident ( PARAMS ) TYPE BLOCK
     # ---------------------------------------------
-    def function_def(self) -> ASTNode:
-        self.match('fishtion')
-        if self.current.type != 'ident':
-            raise ParseError(f"[Línea {self.current.line}] Se esperaba nombre de funcion")
-        name = self.current.lexeme
-        self.match('ident')
-        self.match('(')
+    def function_def(self) -> Iterator:
+        self.match(FISHTION)
+        if self.kinds[self.pos] != IDENT:
+            raise self.error('E110')
+        name = self.tokens.name(self.pos)
+        self.pos += 1
+        self.match(LPAREN)
         params_node = self.params()
-        self.match(')')
+        self.match(RPAREN)
         ret_type = self.type_()
-        block_node = self.block()
-        node = ASTNode('FunctionDef', value=name, children=[params_node, ret_type, block_node], line=self.current.line)
+        end = self.matching_brace(self.pos) if self.lazy else -1
+        if end >= 0:
+            block_node = LazyBlock(partial(self.lazy_body, self.pos), line=self.lines[end], start=self.pos, end=end)
+            self.pos = end
+        else:
+            block_node = yield self.block
+        node = ASTNode('FunctionDef', value=name, children=[params_node, ret_type, block_node], line=self.lines[self.pos])
         return node
 
+    def matching_brace(self, start: int) -> int:
+        # Posición siguiente a la '}' que cierra la '{' de start, o -1 si en
+        # start no hay '{' o no se cierra (ahí se parsea para dar el error)
+        if self.kinds[start] != LBRACE:
+            return -1
+        depth = 0
+        for brace in BRACES.finditer(self.kinds, start):
+            if brace.group()[0] == LBRACE:
+                depth += 1
+            else:
+                depth -= 1
+                if not depth:
+                    return brace.end()
+        return -1
+
+    def lazy_body(self, start: int) -> List[ASTNode]:
+        # Los ITEM del BLOCK de función que empieza en start (lo llama LazyBlock)
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.pos = start
+            return self.run(self.block).children
+        finally:
+            if enabled:
+                gc.enable()
+
     # ---------------------------------------------
     # PARAMS → PARAM PARAMS' | ε
     # ---------------------------------------------
     def params(self) -> ASTNode:
         params = []
-        if self.check('<int', '<string', '<charal', '<bubble', '<hook'):
+        kind = self.kinds[self.pos]
+        if FIRST_TYPE >> kind & 1:
             params.append(self.param())
             params.extend(self.params_p())
-        elif self.current.type == ')':
-            pass
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en PARAMS"
-            )
-        return ASTNode('Params', children=params, line=self.current.line)
+        elif kind != RPAREN:
+            raise self.error('E111')
+        return ASTNode('Params', children=params, line=self.lines[self.pos])
 
     # ---------------------------------------------
     # PARAMS' → , PARAM PARAMS' | ε
     # ---------------------------------------------
     def params_p(self) -> List[ASTNode]:
         params = []
-        while self.current.type == ',':
-            self.match(',')
+        while self.kinds[self.pos] == COMMA:
+            self.pos += 1
             params.append(self.param())
         return params
 
@@ -237,68 +653,54 @@ class Parser:
     # ---------------------------------------------
     def param(self) -> ASTNode:
         t = self.type_()
-        if self.current.type != 'ident':
-            raise ParseError(f"[Línea {self.current.line}] Se esperaba identificador en PARAM")
-        name = self.current.lexeme
-        self.match('ident')
-        return ASTNode('Param', value=name, children=[t], line=self.current.line)
+        if self.kinds[self.pos] != IDENT:
+            raise self.error('E112')
+        name = self.tokens.name(self.pos)
+        self.pos += 1
+        return ASTNode('Param', value=name, children=[t], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # STATEMENT → IF_ELSE | WHILE_LOOP | FOR_LOOP
     #           | TRY_CATCH | PRINT_STMT | RETURN_STMT
     #           | BLOCK | IDENT_STMT
     # ---------------------------------------------
-    def statement(self) -> ASTNode:
-        if self.current.type == 'if':
-            return self.if_else()
-        elif self.current.type == 'whale':
-            return self.while_loop()
-        elif self.current.type == 'fork':
-            return self.for_loop()
-        elif self.current.type == 'try':
-            return self.try_catch()
-        elif self.current.type == 'splash':
-            return self.print_stmt()
-        elif self.current.type == 'emerge':
-            return self.return_stmt()
-        elif self.current.type == '{':
-            return self.block()
-        elif self.current.type == 'ident':
-            return self.ident_stmt()
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado al iniciar STATEMENT"
-            )
+    def statement(self):
+        # Devuelve el método que construye el STATEMENT que empieza en el token actual
+        production = PREDICT_STATEMENT[self.kinds[self.pos]]
+        if production < 0:
+            raise self.error('E113')
+        return self.statements[production]
 
     # ---------------------------------------------
     # IDENT_STMT → ident IDENT_TAIL
+    # IDENT_TAIL → ( ARGS ) <D | <= EXPR <D | <++ <D | <-- <D
     # ---------------------------------------------
     def ident_stmt(self) -> ASTNode:
-        name = self.current.lexeme
-        self.match('ident')
+        name = self.tokens.name(self.pos)
+        self.match(IDENT)
         # Distinguish call vs assign vs inc/dec
-        if self.current.type == '(':
-            self.match('(')
+        production = PREDICT_IDENT_TAIL[self.kinds[self.pos]]
+        if production == 0:
+            self.pos += 1
             args = self.args()
-            self.match(')')
-            self.match('<D')
-            return ASTNode('CallStmt', value=name, children=[args], line=self.current.line)
-        elif self.current.type == '<=':
-            self.match('<=')
+            self.match(RPAREN)
+            self.match(DELIM)
+            return ASTNode('CallStmt', value=name, children=[args], line=self.lines[self.pos])
+        elif production == 1:
+            self.pos += 1
             expr = self.expr()
-            self.match('<D')
-            return ASTNode('Assign', value=name, children=[expr], line=self.current.line)
-        elif self.current.type == '<++':
-            self.match('<++')
-            self.match('<D')
-            return ASTNode('Inc', value=name, line=self.current.line)
-        elif self.current.type == '<--':
-            self.match('<--')
-            self.match('<D')
-            return ASTNode('Dec', value=name, line=self.current.line)
+            self.match(DELIM)
+            return ASTNode('Assign', value=name, children=[expr], line=self.lines[self.pos])
+        elif production == 2:
+            self.pos += 1
+            self.match(DELIM)
+            return ASTNode('Inc', value=name, line=self.lines[self.pos])
+        elif production == 3:
+            self.pos += 1
+            self.match(DELIM)
+            return ASTNode('Dec', value=name, line=self.lines[self.pos])
         else:
-            raise ParseError(f"[Línea {self.current.line}] Forma inválida de IDENT_STMT")
+            raise self.error('E114')
 
     def ident_tail(self) -> None:
         # Left for compatibility; not used now because ident_stmt handles cases
@@ -309,26 +711,21 @@ class Parser:
     # ---------------------------------------------
     def args(self) -> ASTNode:
         args = []
-        if self.check('<+', '<-', 'ident', 'NUM',
-                      'STRING_LITERAL', 'CHAR_LITERAL', '('):
+        kind = self.kinds[self.pos]
+        if FIRST_EXPR >> kind & 1:
             args.append(self.expr())
             args.extend(self.args_p())
-        elif self.current.type == ')':
-            pass
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en ARGS"
-            )
-        return ASTNode('Args', children=args, line=self.current.line)
+        elif kind != RPAREN:
+            raise self.error('E115')
+        return ASTNode('Args', children=args, line=self.lines[self.pos])
 
     # ---------------------------------------------
     # ARGS' → , EXPR ARGS' | ε
     # ---------------------------------------------
     def args_p(self) -> List[ASTNode]:
         args = []
-        while self.current.type == ',':
-            self.match(',')
+        while self.kinds[self.pos] == COMMA:
+            self.pos += 1
             args.append(self.expr())
         return args
 
@@ -336,167 +733,156 @@ class Parser:
     # IF_ELSE → if ( EXPR ) BLOCK ELSE_PART
     # ELSE_PART → else BLOCK | ε
     # ---------------------------------------------
-    def if_else(self) -> ASTNode:
-        self.match('if')
-        self.match('(')
+    def if_else(self) -> Iterator:
+        self.match(IF)
+        self.match(LPAREN)
         cond = self.expr()
-        self.match(')')
-        then_block = self.block()
-        else_block = self.else_part()
+        self.match(RPAREN)
+        then_block = yield self.block
+        else_block = yield from self.else_part()
         
         if else_block:
-            return ASTNode('If', children=[cond, then_block, else_block], line=self.current.line)
+            return ASTNode('If', children=[cond, then_block, else_block], line=self.lines[self.pos])
         else:
-            return ASTNode('If', children=[cond, then_block], line=self.current.line)
+            return ASTNode('If', children=[cond, then_block], line=self.lines[self.pos])
     
     # ---------------------------------------------
     # ELSE_PART → else BLOCK | ε
     # ---------------------------------------------
-    def else_part(self) -> Optional[ASTNode]:
-        if self.current.type == 'else':
-            self.match('else')
-            return self.block()
+    def else_part(self) -> Iterator:
+        if self.kinds[self.pos] == ELSE:
+            self.pos += 1
+            return (yield self.block)
         else:
             return None
 
     # ---------------------------------------------
     # WHILE_LOOP → whale ( EXPR ) BLOCK
     # ---------------------------------------------
-    def while_loop(self) -> ASTNode:
-        self.match('whale')
-        self.match('(')
+    def while_loop(self) -> Iterator:
+        self.match(WHALE)
+        self.match(LPAREN)
         cond = self.expr()
-        self.match(')')
-        block = self.block()
-        return ASTNode('While', children=[cond, block], line=self.current.line)
+        self.match(RPAREN)
+        block = yield self.block
+        return ASTNode('While', children=[cond, block], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # FOR_LOOP → fork ( FOR_INIT <D FOR_COND <D FOR_STEP ) BLOCK
     # ---------------------------------------------
-    def for_loop(self) -> ASTNode:
-        self.match('fork')
-        self.match('(')
+    def for_loop(self) -> Iterator:
+        self.match(FORK)
+        self.match(LPAREN)
         init = self.for_init()
-        self.match('<D')
+        self.match(DELIM)
         cond = self.for_cond()
-        self.match('<D')
+        self.match(DELIM)
         step = self.for_step()
-        self.match(')')
-        block = self.block()
-        return ASTNode('For', children=[init or ASTNode('Empty'), cond or ASTNode('Empty'), step or ASTNode('Empty'), block], line=self.current.line)
+        self.match(RPAREN)
+        block = yield self.block
+        return ASTNode('For', children=[init or ASTNode('Empty'), cond or ASTNode('Empty'), step or ASTNode('Empty'), block], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # FOR_INIT → DECL_NO_DELIM | ASSIGN_NO_DELIM | ε
     # ---------------------------------------------
     def for_init(self) -> Optional[ASTNode]:
-        if self.check('<int', '<string', '<charal', '<bubble', '<hook'):
+        production = PREDICT_FOR_INIT[self.kinds[self.pos]]
+        if production == 0:
             return self.decl_no_delim()
-        elif self.current.type == 'ident':
+        elif production == 1:
             return self.assign_no_delim()
-        elif self.current.type == '<D':
+        elif production == 2:
             return None
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en FOR_INIT"
-            )
+            raise self.error('E116')
 
     # ---------------------------------------------
     # FOR_COND → EXPR | ε
     # ---------------------------------------------
     def for_cond(self) -> Optional[ASTNode]:
-        if self.check('<+', '<-', 'ident', 'NUM',
-                      'STRING_LITERAL', 'CHAR_LITERAL', '('):
+        kind = self.kinds[self.pos]
+        if FIRST_EXPR >> kind & 1:
             return self.expr()
-        elif self.current.type == '<D':
+        elif kind == DELIM:
             return None
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en FOR_COND"
-            )
+            raise self.error('E117')
 
     # ---------------------------------------------
     # FOR_STEP → ident FOR_STEP_TAIL | ε
     # ---------------------------------------------
     def for_step(self) -> Optional[ASTNode]:
-        if self.current.type == 'ident':
-            name = self.current.lexeme
-            self.match('ident')
+        kind = self.kinds[self.pos]
+        if kind == IDENT:
+            name = self.tokens.name(self.pos)
+            self.pos += 1
             tail = self.for_step_tail()
-            node = ASTNode('ForStep', value=name, children=[tail] if tail else [], line=self.current.line)
+            node = ASTNode('ForStep', value=name, children=[tail] if tail else [], line=self.lines[self.pos])
             return node
-        elif self.current.type == ')':
+        elif kind == RPAREN:
             return None
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en FOR_STEP"
-            )
+            raise self.error('E118')
 
     # ---------------------------------------------
     # FOR_STEP_TAIL → <++ | <-- | <= EXPR
     # ---------------------------------------------
     def for_step_tail(self) -> ASTNode:
-        if self.current.type == '<++':
-            self.match('<++')
-            return ASTNode('Postfix', value='<++', line=self.current.line)
-        elif self.current.type == '<--':
-            self.match('<--')
-            return ASTNode('Postfix', value='<--', line=self.current.line)
-        elif self.current.type == '<=':
-            self.match('<=')
+        production = PREDICT_FOR_STEP_TAIL[self.kinds[self.pos]]
+        if production == 0:
+            self.pos += 1
+            return ASTNode('Postfix', value='<++', line=self.lines[self.pos])
+        elif production == 1:
+            self.pos += 1
+            return ASTNode('Postfix', value='<--', line=self.lines[self.pos])
+        elif production == 2:
+            self.pos += 1
             expr = self.expr()
-            return ASTNode('AssignTo', children=[expr], line=self.current.line)
+            return ASTNode('AssignTo', children=[expr], line=self.lines[self.pos])
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inválido en FOR_STEP_TAIL"
-            )
+            raise self.error('E119')
 
     # ---------------------------------------------
     # DECL_NO_DELIM → TYPE ident <= EXPR
     # ---------------------------------------------
     def decl_no_delim(self) -> ASTNode:
         t = self.type_()
-        if self.current.type != 'ident':
-            raise ParseError(f"[Línea {self.current.line}] Se esperaba ident en DECL_NO_DELIM")
-        name = self.current.lexeme
-        self.match('ident')
-        self.match('<=')
+        if self.kinds[self.pos] != IDENT:
+            raise self.error('E120')
+        name = self.tokens.name(self.pos)
+        self.pos += 1
+        self.match(ASSIGN)
         expr = self.expr()
-        return ASTNode('Declaration', value=name, children=[t, expr], line=self.current.line)
+        return ASTNode('Declaration', value=name, children=[t, expr], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # ASSIGN_NO_DELIM → ident <= EXPR
     #                  | ident <--
     # ---------------------------------------------
     def assign_no_delim(self) -> ASTNode:
-        name = self.current.lexeme
-        self.match('ident')
-        if self.current.type == '<=':
-            self.match('<=')
+        name = self.tokens.name(self.pos)
+        self.match(IDENT)
+        kind = self.kinds[self.pos]
+        if kind == ASSIGN:
+            self.pos += 1
             expr = self.expr()
-            return ASTNode('Assign', value=name, children=[expr], line=self.current.line)
-        elif self.current.type == '<--':
-            self.match('<--')
-            return ASTNode('Dec', value=name, line=self.current.line)
+            return ASTNode('Assign', value=name, children=[expr], line=self.lines[self.pos])
+        elif kind == DEC:
+            self.pos += 1
+            return ASTNode('Dec', value=name, line=self.lines[self.pos])
         else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "ASSIGN_NO_DELIM espera '<=' o '<--' después de ident"
-            )
+            raise self.error('E121')
 
     # ---------------------------------------------
     # TRY_CATCH → try BLOCK catch BLOCK TRY_CATCH_TAIL
     # ---------------------------------------------
-    def try_catch(self) -> ASTNode:
-        self.match('try')
-        try_block = self.block()
-        self.match('catch')
-        catch_block = self.block()
-        tail = self.try_catch_tail()
-        node = ASTNode('TryCatch', children=[try_block, catch_block], line=self.current.line)
+    def try_catch(self) -> Iterator:
+        self.match(TRY)
+        try_block = yield self.block
+        self.match(CATCH)
+        catch_block = yield self.block
+        tail = yield from self.try_catch_tail()
+        node = ASTNode('TryCatch', children=[try_block, catch_block], line=self.lines[self.pos])
         if tail:
             node.add(tail)
         return node
@@ -504,11 +890,12 @@ class Parser:
     # ---------------------------------------------
     # TRY_CATCH_TAIL → finally BLOCK | ε
     # ---------------------------------------------
-    def try_catch_tail(self) -> Optional[ASTNode]:
-        if self.current.type == 'finally':
-            self.match('finally')
-            finally_block = self.block()
-            return ASTNode('Finally', children=[finally_block], line=self.current.line)
+    def try_catch_tail(self) -> Iterator:
+        start = self.pos
+        if self.kinds[start] == FINALLY:
+            self.pos += 1
+            finally_block = yield self.block
+            return self.spanned(ASTNode('Finally', children=[finally_block], line=self.lines[self.pos]), start)
         else:
             return None
 
@@ -516,146 +903,160 @@ class Parser:
     # PRINT_STMT → splash ( EXPR ) <D
     # ---------------------------------------------
     def print_stmt(self) -> ASTNode:
-        self.match('splash')
-        self.match('(')
+        self.match(SPLASH)
+        self.match(LPAREN)
         expr = self.expr()
-        self.match(')')
-        self.match('<D')
-        return ASTNode('Print', children=[expr], line=self.current.line)
+        self.match(RPAREN)
+        self.match(DELIM)
+        return ASTNode('Print', children=[expr], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # RETURN_STMT → emerge EXPR <D
     # ---------------------------------------------
     def return_stmt(self) -> ASTNode:
-        self.match('emerge')
+        self.match(EMERGE)
         expr = self.expr()
-        self.match('<D')
-        return ASTNode('Return', children=[expr], line=self.current.line)
+        self.match(DELIM)
+        return ASTNode('Return', children=[expr], line=self.lines[self.pos])
 
     # ---------------------------------------------
     # EXPR → EQUALITY
-    # ---------------------------------------------
-    def expr(self) -> ASTNode:
-        return self.equality()
-
-    # ---------------------------------------------
     # EQUALITY → RELATIONAL ( (<==|<!=) RELATIONAL )*
-    # ---------------------------------------------
-    def equality(self) -> ASTNode:
-        node = self.relational()
-        while self.current.type in ('<==', '<!='):
-            op = self.current.type
-            self.advance()
-            right = self.relational()
-            node = ASTNode('BinaryOp', value=op, children=[node, right], line=self.current.line)
-        return node
-
-    # ---------------------------------------------
     # RELATIONAL → ADD ( << | <<> | <<= | <<>= )*
-    # ---------------------------------------------
-    def relational(self) -> ASTNode:
-        node = self.add()
-        while self.current.type in ('<<', '<<>', '<<=', '<<>='):
-            op = self.current.type
-            self.advance()
-            right = self.add()
-            node = ASTNode('BinaryOp', value=op, children=[node, right], line=self.current.line)
-        return node
-
-    # ---------------------------------------------
     # ADD → MUL ( (<+|<-) MUL )*
-    # ---------------------------------------------
-    def add(self) -> ASTNode:
-        node = self.mul()
-        while self.current.type in ('<+', '<-'):
-            op = self.current.type
-            self.advance()
-            right = self.mul()
-            node = ASTNode('BinaryOp', value=op, children=[node, right], line=self.current.line)
-        return node
-
-    # ---------------------------------------------
     # MUL → UNARY ( (<*|</|<%) UNARY )*
-    # ---------------------------------------------
-    def mul(self) -> ASTNode:
-        node = self.unary()
-        while self.current.type in ('<*', '</', '<%'):
-            op = self.current.type
-            self.advance()
-            right = self.unary()
-            node = ASTNode('BinaryOp', value=op, children=[node, right], line=self.current.line)
-        return node
-
-    # ---------------------------------------------
     # UNARY → <+ UNARY | <- UNARY | POSTFIX
-    # ---------------------------------------------
-    def unary(self) -> ASTNode:
-        if self.current.type == '<+':
-            op = self.current.type
-            self.match('<+')
-            operand = self.unary()
-            return ASTNode('UnaryOp', value=op, children=[operand], line=self.current.line)
-        elif self.current.type == '<-':
-            op = self.current.type
-            self.match('<-')
-            operand = self.unary()
-            return ASTNode('UnaryOp', value=op, children=[operand], line=self.current.line)
-        elif self.check('ident', 'NUM', 'STRING_LITERAL', 'CHAR_LITERAL', '('):
-            return self.postfix()
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                f"Token inesperado en UNARY: '{self.current.type}' (lexema: '{self.current.lexeme}')"
-            )
-
-    # ---------------------------------------------
     # POSTFIX → PRIMARY ( <++ | <-- )*
-    # ---------------------------------------------
-    def postfix(self) -> ASTNode:
-        node = self.primary()
-        while self.current.type in ('<++', '<--'):
-            op = self.current.type
-            self.advance()
-            node = ASTNode('PostfixOp', value=op, children=[node], line=self.current.line)
-        return node
-
-    # ---------------------------------------------
     # PRIMARY → ident (ARGS)? | NUM | STRING_LITERAL | CHAR_LITERAL | ( EXPR )
+    #
+    # Por precedencia (Pratt) con una pila explícita en vez de un método por
+    # nivel: cada elemento de la pila es un binario pendiente (precedencia, op,
+    # operando izquierdo), un unario (UNARY_FRAME, op), un '(' (GROUP_FRAME) o
+    # los argumentos de una llamada (CALL_FRAME, nombre, args).
     # ---------------------------------------------
-    def primary(self) -> ASTNode:
-        if self.current.type == 'ident':
-            name = self.current.lexeme
-            self.match('ident')
-            if self.current.type == '(':
-                self.match('(')
-                args = self.args()
-                self.match(')')
-                return ASTNode('Call', value=name, children=[args], line=self.current.line)
+    def expr(self) -> ASTNode:
+        kinds = self.kinds
+        lines = self.lines
+        tokens = self.tokens
+        pos = self.pos
+        stack = []
+        while True:
+            # Operando
+            kind = kinds[pos]
+            if kind == PLUS or kind == MINUS:
+                stack.append((UNARY_FRAME, TOKEN_TYPES[kind], None))
+                pos += 1
+                continue
+            production = PREDICT_PRIMARY[kind]
+            if production == 0:
+                name = tokens.name(pos)
+                pos += 1
+                if kinds[pos] == LPAREN:
+                    pos += 1
+                    kind = kinds[pos]
+                    if FIRST_EXPR >> kind & 1:
+                        stack.append((CALL_FRAME, name, []))
+                        continue
+                    self.pos = pos
+                    if kind != RPAREN:
+                        raise self.error('E115')
+                    args = ASTNode('Args', children=[], line=lines[pos])
+                    pos += 1
+                    node = ASTNode('Call', value=name, children=[args], line=lines[pos])
+                else:
+                    node = ASTNode('Var', value=name, line=lines[pos])
+            elif production == 4:
+                stack.append((GROUP_FRAME, None, None))
+                pos += 1
+                continue
+            elif production > 0:
+                pos += 1
+                node = ASTNode(LITERAL_NODES[production], value=tokens.lexeme(pos - 1), line=lines[pos])
             else:
-                return ASTNode('Var', value=name, line=self.current.line)
-        elif self.current.type == 'NUM':
-            val = self.current.lexeme
-            self.match('NUM')
-            return ASTNode('Num', value=val, line=self.current.line)
-        elif self.current.type == 'STRING_LITERAL':
-            val = self.current.lexeme
-            self.match('STRING_LITERAL')
-            return ASTNode('String', value=val, line=self.current.line)
-        elif self.current.type == 'CHAR_LITERAL':
-            val = self.current.lexeme
-            self.match('CHAR_LITERAL')
-            return ASTNode('Char', value=val, line=self.current.line)
-        elif self.current.type == '(':
-            self.match('(')
-            node = self.expr()
-            self.match(')')
-            return node
-        else:
-            raise ParseError(
-                f"[Línea {self.current.line}] "
-                "Token inesperado en PRIMARY"
-            )
+                self.pos = pos
+                raise self.error('E122', self.type_name(), self.lexeme())
+
+            # Operando completo: sufijos, unarios pendientes y operador siguiente
+            while True:
+                while POSTFIX_OPS >> kinds[pos] & 1:
+                    op = TOKEN_TYPES[kinds[pos]]
+                    pos += 1
+                    node = ASTNode('PostfixOp', value=op, children=[node], line=lines[pos])
+                while stack and stack[-1][0] == UNARY_FRAME:
+                    node = ASTNode('UnaryOp', value=stack.pop()[1], children=[node], line=lines[pos])
+
+                kind = kinds[pos]
+                precedence = PRECEDENCE[kind]
+                # Los binarios pendientes de igual o mayor precedencia ya tienen su
+                # operando derecho (asociatividad por la izquierda)
+                while stack and stack[-1][0] >= (precedence or 1):
+                    frame = stack.pop()
+                    node = ASTNode('BinaryOp', value=frame[1], children=[frame[2], node], line=lines[pos])
+                if precedence:
+                    stack.append((precedence, TOKEN_TYPES[kind], node))
+                    pos += 1
+                    break
+
+                # Terminó una subexpresión
+                if not stack:
+                    self.pos = pos
+                    return node
+                frame = stack[-1]
+                if frame[0] == GROUP_FRAME:
+                    # ( EXPR ) es un PRIMARY: puede llevar sufijos
+                    stack.pop()
+                    if kind != RPAREN:
+                        self.pos = pos
+                        raise self.expected(RPAREN)
+                    pos += 1
+                    continue
+                # Argumento de una llamada: ARGS' → , EXPR ARGS' | ε
+                frame[2].append(node)
+                if kind == COMMA:
+                    pos += 1
+                    break
+                stack.pop()
+                args = ASTNode('Args', children=frame[2], line=lines[pos])
+                if kind != RPAREN:
+                    self.pos = pos
+                    raise self.expected(RPAREN)
+                pos += 1
+                node = ASTNode('Call', value=frame[1], children=[args], line=lines[pos])
 
     def primary_id(self) -> None:
         # deprecated; handled in primary
         return None
+
+
+def shift_nodes(nodes: List[ASTNode], delta: int, shift: int) -> None:
+    # Desplaza delta tokens los tramos de nodes (relativos a su padre, así que
+    # los descendientes no cambian) y shift las líneas de nodes y de todos sus
+    # descendientes; las líneas -1, del fin de entrada, se quedan igual. Un
+    # LazyBlock sin cargar no se carga: sus hijos saldrán de los tokens nuevos
+    if delta:
+        for node in nodes:
+            if node.end >= 0:
+                node.start += delta
+                node.end += delta
+    if shift:
+        stack = list(nodes)
+        while stack:
+            node = stack.pop()
+            if node.line >= 0:
+                node.line += shift
+            if not isinstance(node, LazyBlock) or node.loaded:
+                stack.extend(node.children)
+
+
+def search(nodes: List[ASTNode], attr: str, value: int, lo: int = 0, right: bool = False) -> int:
+    # bisect_left (o bisect_right) de value en nodes ordenados por su atributo
+    # attr; el key= de bisect es de Python 3.10 y esto corre desde 3.8
+    hi = len(nodes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        key = getattr(nodes[mid], attr)
+        if key < value or right and key == value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
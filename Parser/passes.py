@@ -0,0 +1,228 @@
+import gc
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from Parser.arena import NODE_KINDS, NODE_KIND_IDS
+from Parser.ast import ASTNode
+
+# Lo que devuelve un enter_* para que su pasada no entre en los hijos del nodo
+# (ni llame a su leave_*); las demás pasadas siguen normalmente
+SKIP = False
+
+# Tipos de nodo que el parser puede poner como hijos directos de cada tipo
+EXPRESSION_KINDS = ('BinaryOp', 'UnaryOp', 'PostfixOp', 'Call', 'Var', 'Num', 'String', 'Char')
+ITEM_KINDS = ('Declaration', 'FunctionDef', 'If', 'While', 'For', 'TryCatch', 'Print', 'Return',
+              'Block', 'CallStmt', 'Assign', 'Inc', 'Dec', 'Error')
+CHILD_KINDS = {
+    'Program': ('Block', 'Error'),
+    'Block': ITEM_KINDS,
+    'Declaration': ('Type', 'Initializer') + EXPRESSION_KINDS,
+    'Initializer': EXPRESSION_KINDS,
+    'FunctionDef': ('Params', 'Type', 'Block'),
+    'Params': ('Param',),
+    'Param': ('Type',),
+    'CallStmt': ('Args',),
+    'Assign': EXPRESSION_KINDS,
+    'Args': EXPRESSION_KINDS,
+    'If': ('Block',) + EXPRESSION_KINDS,
+    'While': ('Block',) + EXPRESSION_KINDS,
+    'For': ('Declaration', 'Assign', 'Dec', 'ForStep', 'Empty', 'Block') + EXPRESSION_KINDS,
+    'ForStep': ('Postfix', 'AssignTo'),
+    'AssignTo': EXPRESSION_KINDS,
+    'TryCatch': ('Block', 'Finally'),
+    'Finally': ('Block',),
+    'Print': EXPRESSION_KINDS,
+    'Return': EXPRESSION_KINDS,
+    'BinaryOp': EXPRESSION_KINDS,
+    'UnaryOp': EXPRESSION_KINDS,
+    'PostfixOp': EXPRESSION_KINDS,
+    'Call': ('Args',),
+}
+
+
+def kind_mask(kinds) -> int:
+    # Conjunto de tipos de nodo como entero: el bit NODE_KIND_IDS[tipo]
+    bits = 0
+    for kind in kinds:
+        bits |= 1 << NODE_KIND_IDS[kind]
+    return bits
+
+
+def subtree_masks() -> Dict[str, int]:
+    # Tipo -> máscara de los tipos que pueden aparecer debajo de él (a
+    # cualquier profundidad); punto fijo sobre CHILD_KINDS
+    masks = {kind: kind_mask(CHILD_KINDS.get(kind, ())) for kind in NODE_KINDS}
+    changed = True
+    while changed:
+        changed = False
+        for kind, children in CHILD_KINDS.items():
+            bits = masks[kind]
+            for child in children:
+                bits |= masks[child]
+            if bits != masks[kind]:
+                masks[kind] = bits
+                changed = True
+    return masks
+
+
+# Se calcula una vez al importar
+SUBTREE_MASKS = subtree_masks()
+ALL_KINDS = kind_mask(NODE_KINDS)
+
+
+class Pass:
+    """Una pasada sobre el AST para run_passes.
+
+    Los ganchos se declaran como métodos enter_<Kind>(node), que se llama al
+    llegar al nodo (antes que sus hijos; si devuelve SKIP la pasada no entra
+    en ellos), y leave_<Kind>(node, values), que se llama después de los
+    hijos con lo que devolvió el leave de cada uno (None si no tiene, o si no
+    se visitó) y devuelve el valor del nodo. La tabla tipo -> gancho se arma
+    una vez por clase. kinds son los tipos de nodo que le importan a la
+    pasada: por defecto los que tienen gancho, o NODE_KINDS para todos. Un subárbol
+    donde no puede aparecer ningún tipo que le importe a alguna pasada no se
+    recorre.
+    """
+
+    # None: los tipos con gancho; NODE_KINDS: todos
+    kinds: Optional[Iterable[str]] = None
+    enter_hooks: Dict[str, str] = {}
+    leave_hooks: Dict[str, str] = {}
+    hook_kinds: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.enter_hooks = {kind: 'enter_' + kind for kind in NODE_KINDS if hasattr(cls, 'enter_' + kind)}
+        cls.leave_hooks = {kind: 'leave_' + kind for kind in NODE_KINDS if hasattr(cls, 'leave_' + kind)}
+        cls.hook_kinds = frozenset(cls.enter_hooks) | frozenset(cls.leave_hooks)
+
+    def hooks(self) -> tuple:
+        # Tablas tipo -> [(0, gancho)] de enter y de leave, ligadas a esta
+        # instancia, y su máscara: lo que usa _fused_walk con la pasada sola. Se
+        # arman la primera vez, así correrla muchas veces sobre subárboles sale barato
+        hooks = self.__dict__.get('_hooks')
+        if hooks is None:
+            hooks = self._hooks = ({kind: [(0, getattr(self, name))] for kind, name in self.enter_hooks.items()},
+                                   {kind: [(0, getattr(self, name))] for kind, name in self.leave_hooks.items()},
+                                   self.mask)
+        return hooks
+
+    @property
+    def mask(self) -> int:
+        return kind_mask(self.hook_kinds if self.kinds is None else self.kinds)
+
+    def begin(self, root: ASTNode) -> None:
+        # Antes del recorrido
+        pass
+
+    def finish(self, root: ASTNode) -> None:
+        # Después del recorrido
+        pass
+
+
+def run_passes(root: ASTNode, passes: List[Pass]) -> list:
+    # Corre todas las pasadas en un solo recorrido de root (sin recursión) y
+    # devuelve el valor del leave de la raíz para cada una. En cada nodo se
+    # llama a los enter de las pasadas en orden, se recorren los hijos y se
+    # llama a los leave en el mismo orden. Como en Parser.parse: el recorrido
+    # no crea ciclos, así que se pausa el recolector de ciclos
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _fused_walk(root, passes)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _fused_walk(root: ASTNode, passes: List[Pass]) -> list:
+    # Tipo de nodo -> [(pasada, gancho)]: en cada nodo solo se toca a las
+    # pasadas que tienen gancho para su tipo
+    if len(passes) == 1:
+        enter_table, leave_table, full_mask = passes[0].hooks()
+        masks = [full_mask]
+    else:
+        enter_table: Dict[str, list] = {}
+        leave_table: Dict[str, list] = {}
+        masks = []
+        full_mask = 0
+        for i, p in enumerate(passes):
+            enters, leaves, mask = p.hooks()
+            for kind, ((_, hook),) in enters.items():
+                enter_table.setdefault(kind, []).append((i, hook))
+            for kind, ((_, hook),) in leaves.items():
+                leave_table.setdefault(kind, []).append((i, hook))
+            masks.append(mask)
+            full_mask |= mask
+    everyone = frozenset(range(len(passes)))
+    for p in passes:
+        p.begin(root)
+
+    results = [None] * len(passes)
+    # Marcos [nodo, hijos, índice del hijo actual, pasadas activas, su máscara,
+    # ganchos leave del nodo, valores de los hijos por pasada (o None)]
+    stack = []
+    node = root
+    active = everyone
+    mask = full_mask
+    while True:
+        # Entrar en node con las pasadas de active
+        kind = node.kind
+        for i, hook in enter_table.get(kind, ()):
+            if (active is everyone or i in active) and hook(node) is SKIP:
+                active = active - {i}
+                mask = 0
+                for j in active:
+                    mask |= masks[j]
+        leaving = leave_table.get(kind, ())
+        if leaving and active is not everyone:
+            leaving = [(i, hook) for i, hook in leaving if i in active]
+        children = node.children
+        if children and mask & SUBTREE_MASKS.get(kind, ALL_KINDS):
+            values = None
+            if leaving:
+                values = [None] * len(passes)
+                for i, _ in leaving:
+                    values[i] = [None] * len(children)
+            frame = [node, children, -1, active, mask, leaving, values]
+            stack.append(frame)
+        else:
+            # Sin hijos que recorrer: se sale del nodo enseguida
+            frame = None
+            parent = stack[-1] if stack else None
+            for i, hook in leaving:
+                value = hook(node, (None,) * len(children) if children else ())
+                if parent is None:
+                    results[i] = value
+                elif parent[6] is not None and parent[6][i] is not None:
+                    parent[6][i][parent[2]] = value
+            if parent is None:
+                break
+            frame = parent
+
+        # Siguiente hijo del marco de arriba, o salir de los marcos terminados
+        while True:
+            node, children, index, active, mask, leaving, values = frame
+            index += 1
+            while index < len(children) and children[index] is None:
+                index += 1
+            if index < len(children):
+                frame[2] = index
+                break
+            stack.pop()
+            parent = stack[-1] if stack else None
+            for i, hook in leaving:
+                value = hook(node, values[i])
+                if parent is None:
+                    results[i] = value
+                elif parent[6] is not None and parent[6][i] is not None:
+                    parent[6][i][parent[2]] = value
+            if parent is None:
+                break
+            frame = parent
+        if not stack:
+            break
+        node = children[index]
+
+    for p in passes:
+        p.finish(root)
+    return results
@@ -1,5 +1,19 @@
-from typing import Dict, List, Optional
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from Helpers.names import NameTable
+from Helpers.symbolsTable import ScopedSymbols
 from Parser.ast import ASTNode
+from Parser.diagnostics import MAX_ERRORS, Diagnostic, ErrorLimit
+from Parser.passes import SKIP, Pass, run_passes
+from Parser.typeinfo import TypeTable
+
+
+# Modo paralelo: por debajo de estos tokens en cuerpos de función no conviene
+# levantar procesos
+PARALLEL_MIN_TOKENS = 200000
 
 
 class SemanticError(Exception):
@@ -12,247 +26,439 @@ class Symbol:
         self.type = typ
         self.node = node
 
-
-class SemanticAnalyzer:
-    def __init__(self):
-        self.scopes: List[Dict[str, Symbol]] = []
+    def __getstate__(self) -> dict:
+        # Al pasar entre procesos (analyze_parallel) no viaja el nodo, que
+        # arrastraría su parte del AST
+        return dict(self.__dict__, node=None)
+
+
+class SemanticAnalyzer(Pass):
+    def __init__(self, names: Optional[NameTable] = None, max_errors: Optional[int] = MAX_ERRORS,
+                 dedupe: bool = True):
+        # names: la tabla de nombres con la que se parseó el AST (Parser.names).
+        # Los nombres de los nodos y las claves de los ámbitos son entonces los
+        # mismos objetos, y los tipos que se comparan también.
+        # Los errores son Diagnostic (ver Parser/diagnostics.py). Con dedupe un
+        # error repetido (mismo código y argumentos, p. ej. la misma variable no
+        # declarada) se cuenta en el primero en lugar de agregarse; al llegar a
+        # max_errors (None: sin límite) el análisis se corta y aborted queda en True
+        self.names = names if names is not None else NameTable()
+        self.int_type = self.names.intern('<int')
+        self.string_type = self.names.intern('<string')
+        self.char_type = self.names.intern('<charal')
+        self.symbols = ScopedSymbols()
+        # Tipo y símbolo resueltos de cada nodo (ver Parser/typeinfo.py)
+        self.types = TypeTable({'Num': self.int_type, 'String': self.string_type, 'Char': self.char_type})
         self.functions: Dict[str, Symbol] = {}
-        self.errors: List[str] = []
+        self.max_errors = max_errors
+        self.dedupe = dedupe
+        self.errors: List[Diagnostic] = []
+        self.reported: Dict[tuple, Diagnostic] = {}   # (código, argumentos) -> primer error
+        self.aborted = False
         self.current_function: Optional[Symbol] = None
+        self.enclosing: List[Optional[Symbol]] = []
+        # FunctionDef vistos hasta ahora, en preorden (el orden de cada función)
+        self.function_count = 0
+        # Modo paralelo: cuerpos que se mandan a los procesos, como (orden,
+        # tipos visibles, errores de este recorrido antes del cuerpo)
+        self.deferred: Optional[List[Tuple[int, Dict[str, str], int]]] = None
+        self.snapshot: Tuple[int, Dict[str, str]] = (-1, {})
+
+    def report(self, node: ASTNode, code: str, *args) -> None:
+        # El mensaje no se arma aquí: solo se guardan el código y los argumentos.
+        # De un error repetido queda la línea más baja (también al juntar los
+        # de analyze_parallel); index es su posición en errors
+        if self.dedupe:
+            first = self.reported.get((code, args))
+            if first is not None:
+                first.count += 1
+                if node.line < first.line:
+                    first.line, first.start, first.end = node.line, node.start, node.end
+                return
+            diagnostic = self.reported[code, args] = Diagnostic(code, node.line, node.start, node.end, args)
+        else:
+            diagnostic = Diagnostic(code, node.line, node.start, node.end, args)
+        diagnostic.index = len(self.errors)
+        self.errors.append(diagnostic)
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise ErrorLimit
 
     def push_scope(self) -> None:
-        #print("Current scopes:", self.scopes)
-        self.scopes.append({})
+        self.symbols.push_scope()
 
     def pop_scope(self) -> None:
-        if self.scopes:
-            #print("Popping scope:", self.scopes[-1])
-            self.scopes.pop()
+        self.symbols.pop_scope()
 
-    def declare_var(self, name: str, typ: str, node: ASTNode) -> None:
-        if not self.scopes:
+    def declare_var(self, name: str, typ: str, node: ASTNode) -> Symbol:
+        if not self.symbols.depth:
             self.push_scope()
-        scope = self.scopes[-1]
-        if name in scope:
-            # print("Current scopes at error:", self.scopes)
-            self.errors.append(f"[Línea {node.line}] Variable '{name}' ya declarada en este ámbito")
-        scope[name] = Symbol(name, typ, node)
-
-    def lookup_var(self, name: str) -> Optional[Symbol]:
-        for scope in reversed(self.scopes):
-            if name in scope:
-                return scope[name]
-        return None
+        name = self.names.intern(name)
+        sym = Symbol(name, typ, node)
+        if self.symbols.declare(name, sym) is not None:
+            self.report(node, 'E200', name)
+        return sym
+
+    def lookup_var(self, name: Union[str, int]) -> Optional[Symbol]:
+        # name puede ser el nombre o su id en names. Un solo acceso a la tabla,
+        # sin importar la profundidad; como las claves están internadas, con un
+        # nombre del mismo AST no se recalcula el hash y se compara por identidad
+        if type(name) is int:
+            name = self.names.name(name)
+        return self.symbols.bindings.get(name)
 
     def declare_function(self, name: str, return_type: str, params: List[Symbol], node: ASTNode) -> None:
-        if name in self.functions:
-            self.errors.append(f"[Línea {node.line}] Función '{name}' ya declarada")
+        # Declara el FunctionDef que se acaba de contar en function_count. En
+        # modo paralelo functions ya trae la primera firma de cada nombre (con
+        # su orden), así que solo falta reportar las repetidas
+        order = self.function_count - 1
+        first = self.functions.get(name)
+        if first is not None and first.order < order:
+            self.report(node, 'E201', name)
             return
-        sym = Symbol(name, return_type, node)
-        # attach signature
-        sym.params = params
-        self.functions[name] = sym
+        if first is None:
+            sym = Symbol(name, return_type, node)
+            # attach signature
+            sym.params = params
+            sym.order = order
+            self.functions[name] = sym
 
     def lookup_function(self, name: str) -> Optional[Symbol]:
-        return self.functions.get(name)
+        # Solo las funciones declaradas antes de este punto del recorrido
+        sym = self.functions.get(name)
+        if sym is not None and sym.order < self.function_count:
+            return sym
+        return None
 
-    def analyze(self, root: ASTNode) -> List[str]:
-        self.visit(root)
+    def analyze(self, root: ASTNode, rules: Sequence[Pass] = ()) -> List[Diagnostic]:
+        # Las reglas (p. ej. las de Parser/lint.py) corren en el mismo recorrido;
+        # sus avisos quedan en cada regla. Si se llega a max_errors el recorrido
+        # se corta también para ellas
+        try:
+            run_passes(root, [self, *rules])
+        except ErrorLimit:
+            self.aborted = True
         return self.errors
 
-    # ----------------------- visitors -----------------------
-    def visit(self, node: ASTNode) -> Optional[str]:
-        #print(f"Visiting node: {node.kind} (line {node.line})")
-        method = getattr(self, f"visit_{node.kind}", self.generic_visit)
-        return method(node)
-
-    def generic_visit(self, node: ASTNode) -> Optional[str]:
-        for c in node.children:
-            self.visit(c)
-        return None
+    def analyze_parallel(self, root: ASTNode, workers: Optional[int] = None,
+                         min_tokens: int = PARALLEL_MIN_TOKENS) -> List[Diagnostic]:
+        # Como analyze, pero los cuerpos de las funciones se revisan en un
+        # ProcessPoolExecutor. Un solo recorrido corre SignatureCollector, que
+        # declara todas las firmas (cada una con su orden en preorden), y este
+        # analizador sin entrar en los cuerpos: de cada uno anota los tipos
+        # visibles. Los cuerpos se reparten en trabajos de tamaño parecido; los
+        # procesos heredan el AST y las firmas (fork) y devuelven sus errores.
+        # Los errores se juntan en el orden del recorrido de analyze (cada
+        # cuerpo entre los de este recorrido anteriores y posteriores a él) y
+        # así se aplican dedupe y max_errors (cada trabajo se corta también al
+        # llegar); errors queda como el de analyze ordenado por (línea, index).
+        # Con poco código (menos de min_tokens en cuerpos) o un solo proceso
+        # todo se revisa aquí, con el mismo resultado.
+        collector = SignatureCollector(self)
+        self.deferred = []
+        try:
+            run_passes(root, [collector, self])
+        except ErrorLimit:
+            # Se revisan igual los cuerpos anotados hasta aquí
+            self.aborted = True
+        deferred, self.deferred = self.deferred, None
+        sizes = [max(collector.nodes[order].end - collector.nodes[order].start, 1) for order, _, _ in deferred]
+        workers = workers or os.cpu_count() or 1
+        jobs = []
+        if deferred:
+            # Unos cuatro trabajos por proceso, de tokens parecidos y en orden
+            target = sum(sizes) / (workers * 4)
+            job, size = [], 0
+            for entry, entry_size in zip(deferred, sizes):
+                job.append(entry)
+                size += entry_size
+                if size >= target:
+                    jobs.append(job)
+                    job, size = [], 0
+            if job:
+                jobs.append(job)
+        state = (self.names, self.functions, collector.nodes, self.max_errors, self.dedupe)
+        # Las claves de los tipos son id(node): con fork (o aquí mismo) son las
+        # del AST de este proceso; sin fork los cuerpos quedan sin tipos
+        same_nodes = True
+        if len(jobs) > 1 and workers > 1 and sum(sizes) >= min_tokens:
+            fork = 'fork' in multiprocessing.get_all_start_methods()
+            same_nodes = fork
+            with ProcessPoolExecutor(min(workers, len(jobs)), initializer=_start_worker, initargs=state,
+                                     mp_context=multiprocessing.get_context('fork') if fork else None) as pool:
+                results = list(pool.map(_check_bodies, jobs))
+        else:
+            _start_worker(*state)
+            results = [_check_bodies(job) for job in jobs]
+        merged = []
+        done = 0
+        for job, (bounds, errors, types) in zip(jobs, results):
+            start = 0
+            for (_, _, at), end in zip(job, bounds):
+                merged.extend(self.errors[done:at])
+                done = at
+                merged.extend(errors[start:end])
+                start = end
+            if same_nodes:
+                self.types.update(types)
+        merged.extend(self.errors[done:])
+        if self.dedupe:
+            self.reported = {}
+            unique = []
+            for diagnostic in merged:
+                first = self.reported.get(diagnostic.key)
+                if first is None:
+                    self.reported[diagnostic.key] = diagnostic
+                    unique.append(diagnostic)
+                else:
+                    first.count += diagnostic.count
+                    if diagnostic.line < first.line:
+                        first.line, first.start, first.end = diagnostic.line, diagnostic.start, diagnostic.end
+            merged = unique
+        if self.max_errors is not None and len(merged) >= self.max_errors:
+            del merged[self.max_errors:]
+            self.aborted = True
+            if self.dedupe and any(diagnostic.count > 1 for diagnostic in merged):
+                # Las repeticiones que cada parte contó después del corte no
+                # las vería analyze, que se detiene ahí: se repite el análisis
+                # hasta el corte para que count y las líneas sean las suyas
+                check = SemanticAnalyzer(self.names, self.max_errors, self.dedupe)
+                merged = check.analyze(root)
+        for index, diagnostic in enumerate(merged):
+            diagnostic.index = index
+        merged.sort(key=attrgetter('line', 'index'))
+        self.errors = merged
+        return self.errors
 
-    def visit_Program(self, node: ASTNode) -> None:
+    def visible_types(self) -> Dict[str, str]:
+        # Nombre -> tipo de las variables visibles; se reutiliza mientras la
+        # tabla no cambie, así varias funciones seguidas comparten el mismo
+        version, types = self.snapshot
+        if version != self.symbols.version:
+            types = {name: sym.type for name, sym in self.symbols.bindings.items()}
+            self.snapshot = (self.symbols.version, types)
+        return types
+
+    def check_body(self, node: ASTNode, order: int, types: Dict[str, str]) -> None:
+        # Revisa el FunctionDef node (de orden order) como lo haría analyze al
+        # llegar a él, con las variables de types visibles
+        self.symbols = ScopedSymbols()
         self.push_scope()
-        # program -> Block
-        for c in node.children:
-            self.visit(c)
-        self.pop_scope()
-
-    def visit_Block(self, node: ASTNode) -> None:
+        for name, typ in types.items():
+            self.symbols.declare(name, Symbol(name, typ))
+        self.function_count = order + 1
+        self.current_function = None
+        self.open_function(node, self.signature(node)[1])
+        run_passes(node.children[2], [self])
+        self.leave_FunctionDef(node, [])
+
+    # ----------------------- ganchos -----------------------
+    # enter_<Kind> se llama antes de los hijos del nodo y leave_<Kind> después,
+    # con el tipo que dio cada hijo en values; lo que devuelve es el tipo del
+    # nodo (None si no tiene). Ver Parser/passes.py.
+    def enter_Program(self, node: ASTNode) -> None:
         self.push_scope()
-        for c in node.children:
-            self.visit(c)
+
+    def leave_Program(self, node: ASTNode, values: list) -> None:
         self.pop_scope()
 
-    def visit_Params(self, node: ASTNode) -> List[Symbol]:
-        params: List[Symbol] = []
-        for p in node.children:
-            sym = self.visit(p)
-            if isinstance(sym, Symbol):
-                params.append(sym)
-        return params
-
-    def visit_Param(self, node: ASTNode) -> Symbol:
-        # Param children: [Type]
-        typ = node.children[0].value if node.children else None
-        name = node.value
-        return Symbol(name, typ, node)
+    def enter_Block(self, node: ASTNode) -> None:
+        # Un bloque vacío no declara nada: no abre ámbito
+        if node.children:
+            self.push_scope()
 
-    def visit_FunctionDef(self, node: ASTNode) -> None:
-        name = node.value
-        params_node = node.children[0]
+    def leave_Block(self, node: ASTNode, values: list) -> None:
+        if node.children:
+            self.pop_scope()
+
+    def signature(self, node: ASTNode) -> Tuple[Optional[str], List[Symbol]]:
+        # Tipo de retorno y parámetros de un FunctionDef
+        # Params children: [Param], Param children: [Type]
+        params: List[Symbol] = []
+        for p in node.children[0].children:
+            typ = p.children[0].value if p.children else None
+            params.append(Symbol(p.value, typ, p))
         ret_type_node = node.children[1]
-        body = node.children[2]
-        params = self.visit_Params(params_node)
-        ret_type = ret_type_node.value if ret_type_node else None
+        return (ret_type_node.value if ret_type_node else None), params
+
+    def enter_FunctionDef(self, node: ASTNode) -> Optional[bool]:
+        ret_type, params = self.signature(node)
+        if self.deferred is None:
+            self.function_count += 1
         # declare function
-        self.declare_function(name, ret_type, params, node)
+        self.declare_function(node.value, ret_type, params, node)
+        if self.deferred is not None:
+            # Modo paralelo: SignatureCollector, que va antes en el mismo
+            # recorrido, ya contó esta función y las anidadas en su cuerpo; el
+            # cuerpo lo revisa un proceso con los tipos visibles en este punto
+            self.deferred.append((self.function_count - 1, self.visible_types(), len(self.errors)))
+            return SKIP
+        self.open_function(node, params)
+        return None
+
+    def open_function(self, node: ASTNode, params: List[Symbol]) -> None:
         # new function scope
-        prev_func = self.current_function
-        self.current_function = self.functions.get(name)
+        self.enclosing.append(self.current_function)
+        self.current_function = self.functions.get(node.value)
         self.push_scope()
         # declare parameters in scope
         for p in params:
             self.declare_var(p.name, p.type, node)
-        self.visit(body)
+
+    def leave_FunctionDef(self, node: ASTNode, values: list) -> None:
         self.pop_scope()
-        self.current_function = prev_func
+        self.current_function = self.enclosing.pop()
 
-    def visit_Declaration(self, node: ASTNode) -> None:
+    def enter_Declaration(self, node: ASTNode) -> None:
         # node.value = name, children = [Type, Initializer or expr]
-        name = node.value
-        tnode = node.children[0]
-        typ = tnode.value
-        self.declare_var(name, typ, node)
-        if len(node.children) > 1:
-            init = node.children[1]
-            init_type = self.visit(init.children[0]) if init.children else None
-            # simple check: init type matches declared type
-            if init_type and not self.type_compatible(typ, init_type):
-                self.errors.append(f"[Línea {node.line}] Inicializador de '{name}' no es compatible con el tipo {typ}")
-
-    def visit_Assign(self, node: ASTNode) -> None:
+        sym = self.declare_var(node.value, node.children[0].value, node)
+        self.types.record(node, sym.type, sym)
+
+    def leave_Declaration(self, node: ASTNode, values: list) -> None:
+        init_type = values[1] if len(values) > 1 else None
+        typ = node.children[0].value
+        # simple check: init type matches declared type
+        if init_type and not self.type_compatible(typ, init_type):
+            self.report(node, 'E204', node.value, typ)
+
+    def leave_Initializer(self, node: ASTNode, values: list) -> Optional[str]:
+        return values[0] if values else None
+
+    def enter_Assign(self, node: ASTNode) -> Optional[bool]:
         # node.value = name, children = [expr]
+        sym = self.lookup_var(node.value)
+        if not sym:
+            self.report(node, 'E202', node.value)
+            return SKIP
+        self.types.record(node, sym.type, sym)
+        return None
+
+    def leave_Assign(self, node: ASTNode, values: list) -> None:
         name = node.value
         sym = self.lookup_var(name)
-        if not sym:
-            self.errors.append(f"[Línea {node.line}] Variable '{name}' no declarada")
-            return
-        expr_type = self.visit(node.children[0])
+        expr_type = values[0]
         if expr_type and not self.type_compatible(sym.type, expr_type):
-            self.errors.append(f"[Línea {node.line}] Asignación a '{name}' ({sym.type}) con tipo incompatible {expr_type}")
+            self.report(node, 'E205', name, sym.type, expr_type)
+
+    def enter_Call(self, node: ASTNode) -> Optional[bool]:
+        if not self.lookup_function(node.value):
+            self.report(node, 'E203', node.value)
+            return SKIP
+        return None
 
-    def visit_CallStmt(self, node: ASTNode) -> None:
-        # call as statement
-        return self.visit_Call(node)
+    def leave_Args(self, node: ASTNode, values: list) -> list:
+        return values
 
-    def visit_Call(self, node: ASTNode) -> Optional[str]:
+    def leave_Call(self, node: ASTNode, values: list) -> Optional[str]:
         name = node.value
         func = self.lookup_function(name)
-        if not func:
-            self.errors.append(f"[Línea {node.line}] Llamada a función no declarada '{name}'")
-            return None
-        args_node = node.children[0] if node.children else None
-        arg_types = []
-        if args_node:
-            for a in args_node.children:
-                t = self.visit(a)
-                arg_types.append(t)
+        arg_types = values[0] if values else []
         expected = getattr(func, 'params', [])
         if len(arg_types) != len(expected):
-            self.errors.append(f"[Línea {node.line}] Llamada a '{name}' con {len(arg_types)} args, esperaba {len(expected)}")
+            self.report(node, 'E206', name, len(arg_types), len(expected))
         else:
             for i, (at, p) in enumerate(zip(arg_types, expected)):
                 if at and not self.type_compatible(p.type, at):
-                    self.errors.append(f"[Línea {node.line}] Arg {i+1} en llamada a '{name}' incompatible: esperaba {p.type}, tiene {at}")
-        return func.type
+                    self.report(node, 'E207', name, i + 1, p.type, at)
+        return self.types.record(node, func.type, func)
 
-    def visit_Return(self, node: ASTNode) -> None:
-        if not self.current_function:
-            self.errors.append(f"[Línea {node.line}] 'return' fuera de función")
-            return
-        expr_type = self.visit(node.children[0]) if node.children else None
-        if expr_type and not self.type_compatible(self.current_function.type, expr_type):
-            self.errors.append(f"[Línea {node.line}] Tipo de retorno incompatible en función '{self.current_function.name}': esperaba {self.current_function.type}, obtuvo {expr_type}")
-
-    def visit_Print(self, node: ASTNode) -> None:
-        # print accepts any type for now
-        for c in node.children:
-            self.visit(c)
-
-    def visit_If(self, node: ASTNode) -> None:
-        cond_type = self.visit(node.children[0])
-        # simple check: condition should be comparable
-        if cond_type is None:
-            pass
-        self.visit(node.children[1])
-        # El else es opcional (puede tener 2 o 3 hijos)
-        if len(node.children) > 2:
-            self.visit(node.children[2])
-
-    def visit_While(self, node: ASTNode) -> None:
-        self.visit(node.children[0])
-        self.visit(node.children[1])
-
-    def visit_For(self, node: ASTNode) -> None:
-        init = node.children[0]
-        cond = node.children[1]
-        step = node.children[2]
-        body = node.children[3]
-        if init and init.kind != 'Empty':
-            self.visit(init)
-        if cond and cond.kind != 'Empty':
-            self.visit(cond)
-        if step and step.kind != 'Empty':
-            self.visit(step)
-        self.visit(body)
-
-    def visit_ForStep(self, node: ASTNode) -> None:
-        if node.children:
-            self.visit(node.children[0])
+    # call as statement
+    enter_CallStmt = enter_Call
+    leave_CallStmt = leave_Call
 
-    def visit_Postfix(self, node: ASTNode) -> Optional[str]:
-        # used in for-step
+    def enter_Return(self, node: ASTNode) -> Optional[bool]:
+        if not self.current_function:
+            self.report(node, 'E208')
+            return SKIP
         return None
 
-    def visit_PostfixOp(self, node: ASTNode) -> Optional[str]:
+    def leave_Return(self, node: ASTNode, values: list) -> None:
+        expr_type = values[0] if values else None
+        if expr_type and not self.type_compatible(self.current_function.type, expr_type):
+            self.report(node, 'E209', self.current_function.name, self.current_function.type, expr_type)
+
+    def leave_PostfixOp(self, node: ASTNode, values: list) -> Optional[str]:
         # return type of operand
-        return self.visit(node.children[0])
+        return self.types.record(node, values[0])
 
-    def visit_UnaryOp(self, node: ASTNode) -> Optional[str]:
-        return self.visit(node.children[0])
+    def leave_UnaryOp(self, node: ASTNode, values: list) -> Optional[str]:
+        return self.types.record(node, values[0])
 
-    def visit_BinaryOp(self, node: ASTNode) -> Optional[str]:
-        left = self.visit(node.children[0])
-        right = self.visit(node.children[1])
+    def leave_BinaryOp(self, node: ASTNode, values: list) -> Optional[str]:
+        left, right = values
         if left is None or right is None:
             return None
         if not self.type_compatible(left, right):
-            self.errors.append(f"[Línea {node.line}] Operación binaria '{node.value}' entre tipos incompatibles: {left} y {right}")
+            self.report(node, 'E210', node.value, left, right)
             return None
-        return left
+        return self.types.record(node, left)
 
-    def visit_Var(self, node: ASTNode) -> Optional[str]:
+    def leave_Var(self, node: ASTNode, values: list) -> Optional[str]:
         sym = self.lookup_var(node.value)
         if not sym:
-            self.errors.append(f"[Línea {node.line}] Variable '{node.value}' no declarada")
+            self.report(node, 'E202', node.value)
             return None
-        return sym.type
-
-    def visit_Num(self, node: ASTNode) -> Optional[str]:
-        return '<int'
+        return self.types.record(node, sym.type, sym)
 
-    def visit_String(self, node: ASTNode) -> Optional[str]:
-        return '<string'
+    def leave_Num(self, node: ASTNode, values: list) -> Optional[str]:
+        return self.int_type
 
-    def visit_Char(self, node: ASTNode) -> Optional[str]:
-        return '<charal'
+    def leave_String(self, node: ASTNode, values: list) -> Optional[str]:
+        return self.string_type
 
-    def visit_Empty(self, node: ASTNode) -> Optional[str]:
-        return None
+    def leave_Char(self, node: ASTNode, values: list) -> Optional[str]:
+        return self.char_type
 
     # ----------------------- helpers -----------------------
     def type_compatible(self, expected: Optional[str], given: Optional[str]) -> bool:
         if expected is None or given is None:
             return True
         return expected == given
+
+
+class SignatureCollector(Pass):
+    # Corre junto a analyze_parallel, antes que el analizador: cuenta cada
+    # FunctionDef (también los de los cuerpos, en los que el analizador no
+    # entra) y declara en analyzer.functions la primera firma de cada nombre,
+    # con su orden. Solo mira FunctionDef, así que no entra en las expresiones
+    def __init__(self, analyzer: SemanticAnalyzer):
+        self.analyzer = analyzer
+        self.nodes: List[ASTNode] = []     # FunctionDef por orden
+
+    def enter_FunctionDef(self, node: ASTNode) -> None:
+        analyzer = self.analyzer
+        order = len(self.nodes)
+        self.nodes.append(node)
+        analyzer.function_count = order + 1
+        if node.value not in analyzer.functions:
+            ret_type, params = analyzer.signature(node)
+            sym = Symbol(node.value, ret_type, node)
+            sym.params = params
+            sym.order = order
+            analyzer.functions[node.value] = sym
+
+
+# Estado de cada proceso de analyze_parallel: (names, functions, FunctionDef
+# por orden, max_errors, dedupe). Con fork se hereda sin copiarlo
+_worker_state = None
+
+
+def _start_worker(names: NameTable, functions: Dict[str, Symbol], nodes: List[ASTNode],
+                  max_errors: Optional[int], dedupe: bool) -> None:
+    global _worker_state
+    _worker_state = (names, functions, nodes, max_errors, dedupe)
+
+
+def _check_bodies(job: List[Tuple[int, Dict[str, str], int]]) -> Tuple[List[int], List[Diagnostic], TypeTable]:
+    # Revisa los cuerpos de job; devuelve dónde terminan los errores de cada
+    # cuerpo revisado, los errores en orden de recorrido y los tipos que resolvió
+    names, functions, nodes, max_errors, dedupe = _worker_state
+    analyzer = SemanticAnalyzer(names, max_errors, dedupe)
+    analyzer.functions = functions
+    bounds = []
+    try:
+        for order, types, _ in job:
+            analyzer.check_body(nodes[order], order, types)
+            bounds.append(len(analyzer.errors))
+    except ErrorLimit:
+        bounds.append(len(analyzer.errors))
+    return bounds, analyzer.errors, analyzer.types
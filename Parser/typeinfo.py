@@ -0,0 +1,56 @@
+from typing import Any, Dict, Optional
+
+from Parser.arena import ArenaNode
+
+
+class TypeTable:
+    """Tipos y símbolos que resolvió SemanticAnalyzer, por nodo.
+
+    Es una tabla aparte (el AST no cambia): types va de la clave de cada
+    expresión a su tipo (los str internados de la compilación) y symbols de
+    la clave de cada Var, Assign, Call, CallStmt y Declaration al Symbol que
+    le corresponde. Los nodos sin tipo (p. ej. una variable no declarada) no
+    están, y los literales tampoco: su tipo sale de literals por su kind. La
+    clave es id(node) para un ASTNode y el índice para una vista de un
+    ASTArena, así que la tabla vale mientras viva el AST. Las consultas son
+    O(1): quien necesita tipos no vuelve a recorrer ni a buscar nada.
+    """
+
+    __slots__ = ('types', 'symbols', 'literals')
+
+    def __init__(self, literals: Optional[Dict[str, str]] = None):
+        self.types: Dict[int, str] = {}
+        self.symbols: Dict[int, Any] = {}
+        self.literals: Dict[str, str] = literals or {}   # kind -> tipo (Num -> '<int', ...)
+
+    @staticmethod
+    def key(node) -> int:
+        return node.index if type(node) is ArenaNode else id(node)
+
+    def record(self, node, typ: Optional[str], symbol: Any = None) -> Optional[str]:
+        # Anota el tipo (y el símbolo) de node y devuelve el tipo
+        key = node.index if type(node) is ArenaNode else id(node)
+        if typ is not None:
+            self.types[key] = typ
+        if symbol is not None:
+            self.symbols[key] = symbol
+        return typ
+
+    def type_of(self, node) -> Optional[str]:
+        typ = self.types.get(self.key(node))
+        if typ is None:
+            typ = self.literals.get(node.kind)
+        return typ
+
+    def symbol_of(self, node) -> Any:
+        return self.symbols.get(self.key(node))
+
+    def update(self, other: 'TypeTable') -> None:
+        self.types.update(other.types)
+        self.symbols.update(other.symbols)
+
+    def __contains__(self, node) -> bool:
+        return self.type_of(node) is not None
+
+    def __len__(self) -> int:
+        return len(self.types)
@@ -0,0 +1,261 @@
+# Tiempo de ejecución de programas con ciclos whale/fork: el Executable de
+# Runtime/executor.py (closures), la VM de bytecode de Runtime/vm.py y el
+# Python generado por Runtime/transpiler.py contra un intérprete que recorre el
+# árbol en cada paso (dispatch por kind y variables en diccionarios por ámbito).
+#
+#     python -m Runtime.bench_executor
+import io
+import time
+
+from Parser.parser import Parser
+from Parser.semantic import SemanticAnalyzer
+from Runtime.bytecode import compile_bytecode, loads
+from Runtime.executor import compile_program
+from Runtime.runtime import FishRuntimeError, ZERO_VALUES, divide, literal, modulo, recursion_limit, show
+from Runtime.transpiler import compile_python
+from Runtime.vm import run_bytecode
+from Tokens.automaton import default_automaton
+from Tokens.tokenizer import process_tokens
+
+PROGRAMS = {
+    'whale': '''fish {
+    <int i <= 0<D
+    <int s <= 0<D
+    whale (i << 300000) {
+        s <= s <+ i <% 7<D
+        i <++<D
+    }
+    splash(s)<D
+}''',
+    'fork anidado': '''fish {
+    <int t <= 0<D
+    fork (<int i <= 0<D i << 400<D i <++) {
+        fork (<int j <= 0<D j << 400<D j <++) {
+            if ((i <+ j) <% 3 <== 0) { t <++<D }
+        }
+    }
+    splash(t)<D
+}''',
+    'collatz': '''fish {
+    fishtion pasos(<int n) <int {
+        <int k <= 0<D
+        whale (n <!= 1) {
+            if (n <% 2 <== 0) { n <= n </ 2<D } else { n <= 3 <* n <+ 1<D }
+            k <++<D
+        }
+        emerge k<D
+    }
+    <int total <= 0<D
+    fork (<int i <= 1<D i << 3000<D i <++) {
+        total <= total <+ pasos(i)<D
+    }
+    splash(total)<D
+}''',
+}
+
+BINARY = {
+    '<+': lambda a, b: a + b, '<-': lambda a, b: a - b, '<*': lambda a, b: a * b,
+    '<<': lambda a, b: a < b, '<<>': lambda a, b: a > b, '<<=': lambda a, b: a <= b,
+    '<<>=': lambda a, b: a >= b, '<==': lambda a, b: a == b, '<!=': lambda a, b: a != b,
+}
+
+
+class Emerge(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class TreeWalker:
+    # Línea de base: evalúa el AST directamente. Cada nodo se despacha por su
+    # kind cada vez que se visita y cada variable se busca en una lista de
+    # diccionarios (un ámbito por bloque)
+    def __init__(self, out):
+        self.out = out
+        self.scopes = [{}]
+        self.functions = {}
+
+    def run(self, root):
+        self.execute(root.children[0])
+
+    def execute(self, node):
+        getattr(self, 'exec_' + node.kind)(node)
+
+    def evaluate(self, node):
+        return getattr(self, 'eval_' + node.kind)(node)
+
+    def lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope
+        raise KeyError(name)
+
+    def exec_Block(self, node):
+        self.scopes.append({})
+        try:
+            for item in node.children:
+                self.execute(item)
+        finally:
+            self.scopes.pop()
+
+    def exec_Empty(self, node):
+        pass
+
+    def exec_FunctionDef(self, node):
+        self.functions.setdefault(node.value, (node, list(self.scopes)))
+
+    def exec_Declaration(self, node):
+        self.scopes[-1][node.value] = None
+        init = node.children[1]
+        self.scopes[-1][node.value] = self.evaluate(init.children[0] if init.kind == 'Initializer' else init)
+
+    def exec_Assign(self, node):
+        self.lookup(node.value)[node.value] = self.evaluate(node.children[0])
+
+    def exec_Inc(self, node):
+        self.lookup(node.value)[node.value] += 1
+
+    def exec_Dec(self, node):
+        self.lookup(node.value)[node.value] -= 1
+
+    def exec_ForStep(self, node):
+        tail = node.children[0]
+        if tail.kind == 'Postfix':
+            self.lookup(node.value)[node.value] += 1 if tail.value == '<++' else -1
+        else:
+            self.lookup(node.value)[node.value] = self.evaluate(tail.children[0])
+
+    def exec_CallStmt(self, node):
+        self.eval_Call(node)
+
+    def exec_Print(self, node):
+        self.out.write(show(self.evaluate(node.children[0])) + '\n')
+
+    def exec_Return(self, node):
+        raise Emerge(self.evaluate(node.children[0]))
+
+    def exec_If(self, node):
+        if self.evaluate(node.children[0]):
+            self.execute(node.children[1])
+        elif len(node.children) > 2:
+            self.execute(node.children[2])
+
+    def exec_While(self, node):
+        while self.evaluate(node.children[0]):
+            self.execute(node.children[1])
+
+    def exec_For(self, node):
+        init, cond, step, block = node.children
+        self.execute(init)
+        while cond.kind == 'Empty' or self.evaluate(cond):
+            self.execute(block)
+            self.execute(step)
+
+    def exec_TryCatch(self, node):
+        try:
+            try:
+                self.execute(node.children[0])
+            except FishRuntimeError:
+                self.execute(node.children[1])
+        finally:
+            if len(node.children) > 2:
+                self.execute(node.children[2].children[0])
+
+    def eval_Num(self, node):
+        return literal(node.kind, node.value)
+
+    eval_String = eval_Num
+    eval_Char = eval_Num
+
+    def eval_Var(self, node):
+        return self.lookup(node.value)[node.value]
+
+    def eval_UnaryOp(self, node):
+        value = self.evaluate(node.children[0])
+        return -value if node.value == '<-' else value
+
+    def eval_PostfixOp(self, node):
+        delta = 1 if node.value == '<++' else -1
+        target = node.children[0]
+        if target.kind != 'Var':
+            return self.evaluate(target) + delta
+        scope = self.lookup(target.value)
+        value = scope[target.value]
+        scope[target.value] = value + delta
+        return value
+
+    def eval_BinaryOp(self, node):
+        left = self.evaluate(node.children[0])
+        right = self.evaluate(node.children[1])
+        if node.value == '</':
+            return divide(left, right, node.line)
+        if node.value == '<%':
+            return modulo(left, right, node.line)
+        return BINARY[node.value](left, right)
+
+    def eval_Call(self, node):
+        definition, scopes = self.functions[node.value]
+        params, ret_type, block = definition.children
+        args = [self.evaluate(arg) for arg in node.children[0].children]
+        saved = self.scopes
+        self.scopes = scopes + [{param.value: arg for param, arg in zip(params.children, args)}]
+        try:
+            self.execute(block)
+        except Emerge as result:
+            return result.value
+        finally:
+            self.scopes = saved
+        return ZERO_VALUES.get(ret_type.value)
+
+
+def checked(automaton, source: str):
+    tokens = process_tokens(automaton, source)
+    parser = Parser(tokens)
+    ast = parser.parse()
+    errors = SemanticAnalyzer(parser.names).analyze(ast)
+    assert not errors, errors
+    return ast
+
+
+def main():
+    automaton = default_automaton()
+    for name, source in PROGRAMS.items():
+        ast = checked(automaton, source)
+        walked = io.StringIO()
+        start = time.perf_counter()
+        with recursion_limit():
+            TreeWalker(walked).run(ast)
+        walk_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        program = compile_program(ast)
+        compile_time = time.perf_counter() - start
+        ran = io.StringIO()
+        start = time.perf_counter()
+        program.run(ran)
+        run_time = time.perf_counter() - start
+        assert ran.getvalue() == walked.getvalue()
+
+        # El bytecode pasa por dumps/loads como si viniera de un archivo .fshb
+        data = compile_bytecode(ast).dumps()
+        stepped = io.StringIO()
+        start = time.perf_counter()
+        run_bytecode(loads(data), stepped)
+        vm_time = time.perf_counter() - start
+        assert stepped.getvalue() == walked.getvalue()
+
+        start = time.perf_counter()
+        translated = compile_python(ast)
+        translate_time = time.perf_counter() - start
+        native = io.StringIO()
+        start = time.perf_counter()
+        translated.run(native)
+        python_time = time.perf_counter() - start
+        assert native.getvalue() == walked.getvalue()
+        print(f'{name:<14} árbol {walk_time:6.2f} s  closures {run_time:6.2f} s '
+              f'(+{compile_time * 1000:.1f} ms compilar) {walk_time / run_time:4.1f}x  '
+              f'vm {vm_time:6.2f} s ({len(data)} bytes) {walk_time / vm_time:4.1f}x  '
+              f'python {python_time:6.2f} s (+{translate_time * 1000:.1f} ms traducir) {walk_time / python_time:4.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,572 @@
+import marshal
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from Parser.ast import ASTNode
+from Runtime.runtime import ZERO_VALUES, literal, reads, recursion_limit, runtime_error
+
+# Versión del formato serializado; cambiarla invalida los .fshb anteriores
+BYTECODE_FORMAT = 2
+MAGIC = b'FSHB'
+
+# Códigos de operación. Cada instrucción ocupa dos enteros del arreglo: el
+# código y su operando (0 si no usa)
+(LOAD_CONST, LOAD_LOCAL, STORE_LOCAL, LOAD_OUTER, STORE_OUTER, INC_LOCAL, DEC_LOCAL, DUP, POP,
+ ADD, SUB, MUL, DIV, MOD, LT, GT, LE, GE, EQ, NE, NEG,
+ JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, CALL, RETURN, PRINT,
+ SETUP_TRY, POP_TRY, RAISE) = range(30)
+
+OPNAMES = ('LOAD_CONST', 'LOAD_LOCAL', 'STORE_LOCAL', 'LOAD_OUTER', 'STORE_OUTER', 'INC_LOCAL', 'DEC_LOCAL',
+           'DUP', 'POP', 'ADD', 'SUB', 'MUL', 'DIV', 'MOD', 'LT', 'GT', 'LE', 'GE', 'EQ', 'NE', 'NEG',
+           'JUMP', 'JUMP_IF_FALSE', 'JUMP_IF_TRUE', 'CALL', 'RETURN', 'PRINT',
+           'SETUP_TRY', 'POP_TRY', 'RAISE')
+
+BINARY_OPS = {'<+': ADD, '<-': SUB, '<*': MUL, '</': DIV, '<%': MOD, '<<': LT, '<<>': GT,
+              '<<=': LE, '<<>=': GE, '<==': EQ, '<!=': NE}
+
+# Operandos compuestos: casilla y enlaces estáticos (LOAD_OUTER/STORE_OUTER),
+# función y enlaces (CALL). NO_PARENT: la función llamada no tiene marco
+# padre visible desde la llamada
+HOPS_BITS = 8
+HOPS_MASK = (1 << HOPS_BITS) - 1
+NO_PARENT = HOPS_MASK
+MAX_OPERAND = (1 << 31) - 1
+
+# Marco de una llamada en la VM: [marco padre (enlace estático), parámetros..., locales...]
+FIRST_SLOT = 1
+
+
+class CodeObject:
+    """Una función compilada (o el programa, la función 0).
+
+    ops es el arreglo de instrucciones (código, operando), consts la tabla de
+    constantes, size las casillas del marco, template el marco inicial de cada
+    llamada (cada variable vale el cero de su tipo) y default lo que devuelve
+    si termina sin emerge. lines es la tabla de líneas comprimida: por cada
+    instrucción donde cambia la línea, la distancia en instrucciones desde el
+    cambio anterior y la diferencia de línea, como enteros de longitud
+    variable (ver line_at).
+    """
+
+    __slots__ = ('name', 'argc', 'size', 'default', 'ops', 'consts', 'lines', 'first_line', 'template')
+
+    def __init__(self, name: str, argc: int = 0):
+        self.name = name
+        self.argc = argc
+        self.size = FIRST_SLOT
+        self.default: Any = None
+        self.ops = array('i')
+        self.consts: List[Any] = []
+        self.lines = b''
+        self.first_line = -1
+        self.template: list = [None] * FIRST_SLOT
+
+    def line_at(self, pc: int) -> int:
+        # Línea de la instrucción que empieza en ops[pc]
+        line = self.first_line
+        index = pc // 2
+        position = 0
+        table = self.lines
+        i = 0
+        while i < len(table):
+            delta, i = _read_varint(table, i)
+            if position + delta > index:
+                break
+            position += delta
+            change, i = _read_varint(table, i)
+            line += (change >> 1) ^ -(change & 1)
+        return line
+
+    def disassemble(self) -> List[str]:
+        out = []
+        for pc in range(0, len(self.ops), 2):
+            op, arg = self.ops[pc], self.ops[pc + 1]
+            out.append(f'{self.line_at(pc):>5} {pc:>6} {OPNAMES[op]:<14} {arg}')
+        return out
+
+
+class BytecodeProgram:
+    # Las funciones compiladas; functions[0] es el cuerpo del programa
+    def __init__(self, functions: List[CodeObject]):
+        self.functions = functions
+
+    @property
+    def main(self) -> CodeObject:
+        return self.functions[0]
+
+    def dumps(self) -> bytes:
+        return dumps(self)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(dumps(self))
+
+    @staticmethod
+    def load(path: str) -> 'BytecodeProgram':
+        with open(path, 'rb') as f:
+            return loads(f.read())
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, i: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[i]
+        i += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, i
+        shift += 7
+
+
+class BytecodeCompiler:
+    """Baja un AST revisado a bytecode, una CodeObject por fishtion.
+
+    Los nombres se resuelven como en ClosureCompiler (Runtime/executor.py), con
+    las reglas de ámbito de SemanticAnalyzer: cada variable es una casilla del
+    marco de su función y se llega a las de funciones que la contienen por
+    enlaces estáticos. Los saltos son relativos a la instrucción siguiente. Un
+    finally se copia en cada salida de su try (al final y antes de cada emerge
+    que sale de él), como hace CPython.
+    """
+
+    def __init__(self):
+        self.functions: List[CodeObject] = []
+        self.function_ids: Dict[str, int] = {}
+        self.definers: List[Optional[int]] = []   # función que contiene a cada una
+        self.frame_levels: List[int] = []         # nivel del marco de cada una
+        self.linked: List[bool] = []              # si cada una sigue su enlace estático
+        self.scopes: List[Dict[str, Tuple[int, int]]] = []
+        self.code: Optional[CodeObject] = None
+        self.current: Optional[int] = None
+        self.level = 0
+        # Constante -> índice en consts de la función actual
+        self.const_ids: Dict[Tuple[type, Any], int] = {}
+        # Tabla de líneas en construcción: (índice de instrucción, línea)
+        self.line_marks: List[Tuple[int, int]] = []
+        # try abiertos en la función actual: el finally de cada uno (o None) y
+        # los ámbitos visibles en el try, para copiar el finally antes de un emerge
+        self.handlers: List[Tuple[Optional[ASTNode], list]] = []
+
+    def compile(self, root: ASTNode) -> BytecodeProgram:
+        if root.kind != 'Program' or not root.children:
+            raise runtime_error('E403', root.line, root.kind)
+        main = CodeObject('<fish>')
+        self.functions.append(main)
+        self.definers.append(None)
+        self.frame_levels.append(0)
+        self.linked.append(False)
+        self.scopes.append({})
+        self.begin(main, 0)
+        self.statement(root.children[0])
+        self.emit(LOAD_CONST, self.const(None))
+        self.emit(RETURN)
+        self.end()
+        return BytecodeProgram(self.functions)
+
+    # ----------------------- emisión -----------------------
+    def begin(self, code: CodeObject, index: int) -> None:
+        self.code = code
+        self.current = index
+        self.const_ids = {}
+        self.line_marks = []
+        self.handlers = []
+
+    def end(self) -> None:
+        code = self.code
+        lines = bytearray()
+        previous_index = 0
+        previous_line = code.first_line = self.line_marks[0][1] if self.line_marks else -1
+        for index, line in self.line_marks:
+            if line == previous_line:
+                continue
+            change = line - previous_line
+            _write_varint(lines, index - previous_index)
+            _write_varint(lines, change << 1 if change >= 0 else (-change << 1) - 1)
+            previous_index, previous_line = index, line
+        code.lines = bytes(lines)
+
+    def mark(self, line: int) -> None:
+        # Las instrucciones que siguen son de line
+        if line >= 0:
+            index = len(self.code.ops) // 2
+            if self.line_marks and self.line_marks[-1][0] == index:
+                self.line_marks[-1] = (index, line)
+            else:
+                self.line_marks.append((index, line))
+
+    def emit(self, op: int, arg: int = 0) -> int:
+        if not 0 <= arg <= MAX_OPERAND:
+            raise runtime_error('E404', self.line_marks[-1][1] if self.line_marks else -1, OPNAMES[op])
+        ops = self.code.ops
+        ops.append(op)
+        ops.append(arg)
+        return len(ops) - 2
+
+    def jump(self, op: int) -> int:
+        # Salto hacia adelante; el destino se completa con land
+        return self.emit(op)
+
+    def land(self, at: int) -> None:
+        # El salto de at va a la instrucción que se emite ahora
+        self.code.ops[at + 1] = len(self.code.ops) - at - 2
+
+    def jump_back(self, op: int, target: int) -> None:
+        self.emit(op)
+        ops = self.code.ops
+        ops[-1] = target - len(ops)
+
+    def const(self, value: Any) -> int:
+        key = (type(value), value)
+        index = self.const_ids.get(key)
+        if index is None:
+            index = self.const_ids[key] = len(self.code.consts)
+            self.code.consts.append(value)
+        return index
+
+    # ----------------------- nombres -----------------------
+    def declare(self, name: str, typ: Optional[str]) -> int:
+        slot = self.new_slot(ZERO_VALUES.get(typ))
+        self.scopes[-1][name] = (self.level, slot)
+        return slot
+
+    def new_slot(self, initial: Any) -> int:
+        code = self.code
+        code.size += 1
+        code.template.append(initial)
+        return code.size - 1
+
+    def resolve(self, node: ASTNode) -> Tuple[int, int]:
+        for scope in reversed(self.scopes):
+            found = scope.get(node.value)
+            if found is not None:
+                hops = self.level - found[0]
+                if hops:
+                    self.follow(hops)
+                return hops, found[1]
+        raise runtime_error('E403', node.line, node.value)
+
+    def follow(self, links: int) -> None:
+        # Como ClosureCompiler.follow: la función actual y las que la contienen
+        # siguen links enlaces estáticos
+        index = self.current
+        for _ in range(links):
+            if index is None:
+                return
+            self.linked[index] = True
+            index = self.definers[index]
+
+    def load(self, node: ASTNode) -> None:
+        hops, slot = self.resolve(node)
+        if hops == 0:
+            self.emit(LOAD_LOCAL, slot)
+        else:
+            self.emit(LOAD_OUTER, self.outer(slot, hops, node))
+
+    def store(self, node: ASTNode) -> None:
+        hops, slot = self.resolve(node)
+        if hops == 0:
+            self.emit(STORE_LOCAL, slot)
+        else:
+            self.emit(STORE_OUTER, self.outer(slot, hops, node))
+
+    def outer(self, slot: int, hops: int, node: ASTNode) -> int:
+        if hops >= NO_PARENT:
+            raise runtime_error('E404', node.line, node.value)
+        return slot << HOPS_BITS | hops
+
+    def bump(self, node: ASTNode, delta: int) -> None:
+        # x <++ / x <-- como sentencia
+        hops, slot = self.resolve(node)
+        if hops == 0:
+            self.emit(INC_LOCAL if delta > 0 else DEC_LOCAL, slot)
+        else:
+            self.load(node)
+            self.emit(LOAD_CONST, self.const(1))
+            self.emit(ADD if delta > 0 else SUB)
+            self.store(node)
+
+    # ----------------------- sentencias -----------------------
+    def statement(self, node: ASTNode) -> None:
+        method = getattr(self, 'stmt_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        self.mark(node.line)
+        method(node)
+
+    def stmt_Block(self, node: ASTNode) -> None:
+        if not node.children:
+            return
+        self.scopes.append({})
+        for item in node.children:
+            self.statement(item)
+        self.scopes.pop()
+
+    def stmt_Empty(self, node: ASTNode) -> None:
+        pass
+
+    def stmt_FunctionDef(self, node: ASTNode) -> None:
+        params, ret_type, block = node.children
+        code = CodeObject(node.value, len(params.children))
+        code.default = ZERO_VALUES.get(ret_type.value if ret_type else None)
+        index = len(self.functions)
+        self.functions.append(code)
+        self.definers.append(self.current)
+        self.frame_levels.append(self.level + 1)
+        self.linked.append(False)
+        self.function_ids.setdefault(node.value, index)
+        saved = (self.scopes, self.code, self.current, self.level, self.const_ids, self.line_marks, self.handlers)
+        self.scopes = self.scopes + [{}]
+        self.level += 1
+        self.begin(code, index)
+        self.mark(node.line)
+        for param in params.children:
+            self.declare(param.value, param.children[0].value)
+        self.statement(block)
+        self.emit(LOAD_CONST, self.const(code.default))
+        self.emit(RETURN)
+        self.end()
+        self.scopes, self.code, self.current, self.level, self.const_ids, self.line_marks, self.handlers = saved
+
+    def stmt_Declaration(self, node: ASTNode) -> None:
+        # Si el inicializador lee la variable, esta empieza valiendo el cero de
+        # su tipo también cuando la declaración se repite en un ciclo
+        typ = node.children[0].value
+        slot = self.declare(node.value, typ)
+        if len(node.children) < 2:
+            return
+        init = node.children[1]
+        value = init.children[0] if init.kind == 'Initializer' else init
+        if reads(value, node.value):
+            self.emit(LOAD_CONST, self.const(ZERO_VALUES.get(typ)))
+            self.emit(STORE_LOCAL, slot)
+        self.expression(value)
+        self.emit(STORE_LOCAL, slot)
+
+    def stmt_Assign(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        self.store(node)
+
+    def stmt_Inc(self, node: ASTNode) -> None:
+        self.bump(node, 1)
+
+    def stmt_Dec(self, node: ASTNode) -> None:
+        self.bump(node, -1)
+
+    def stmt_CallStmt(self, node: ASTNode) -> None:
+        self.expr_Call(node)
+        self.emit(POP)
+
+    def stmt_Print(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        self.emit(PRINT)
+
+    def stmt_Return(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        # Antes de salir: se sueltan los try abiertos y se corren sus finally,
+        # del más interno al más externo (cada uno con solo los de afuera abiertos)
+        handlers, scopes = self.handlers, self.scopes
+        for depth in range(len(handlers) - 1, -1, -1):
+            self.emit(POP_TRY)
+            final, visible = handlers[depth]
+            if final is not None:
+                self.handlers, self.scopes = handlers[:depth], visible
+                self.statement(final)
+        self.handlers, self.scopes = handlers, scopes
+        self.mark(node.line)
+        self.emit(RETURN)
+
+    def stmt_If(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        skip = self.jump(JUMP_IF_FALSE)
+        self.statement(node.children[1])
+        if len(node.children) < 3:
+            self.land(skip)
+            return
+        done = self.jump(JUMP)
+        self.land(skip)
+        self.statement(node.children[2])
+        self.land(done)
+
+    def stmt_While(self, node: ASTNode) -> None:
+        # La condición va al final: una sola instrucción de salto por vuelta
+        enter = self.jump(JUMP)
+        top = len(self.code.ops)
+        self.statement(node.children[1])
+        self.land(enter)
+        self.mark(node.line)
+        self.expression(node.children[0])
+        self.jump_back(JUMP_IF_TRUE, top)
+
+    def stmt_For(self, node: ASTNode) -> None:
+        init, cond, step, block = node.children
+        self.statement(init)
+        enter = self.jump(JUMP)
+        top = len(self.code.ops)
+        self.statement(block)
+        self.statement(step)
+        self.land(enter)
+        self.mark(node.line)
+        if cond.kind == 'Empty':
+            self.jump_back(JUMP, top)
+        else:
+            self.expression(cond)
+            self.jump_back(JUMP_IF_TRUE, top)
+
+    def stmt_ForStep(self, node: ASTNode) -> None:
+        if not node.children:
+            return
+        tail = node.children[0]
+        if tail.kind == 'Postfix':
+            self.bump(node, 1 if tail.value == '<++' else -1)
+        else:
+            self.expression(tail.children[0])
+            self.store(node)
+
+    def stmt_TryCatch(self, node: ASTNode) -> None:
+        # SETUP_TRY deja un manejador: si una instrucción lanza FishRuntimeError,
+        # la VM vuelve a la altura de pila del SETUP_TRY, apila el error y salta
+        # al manejador. Con finally, el catch tiene su propio manejador que corre
+        # el finally y vuelve a lanzar
+        final = node.children[2].children[0] if len(node.children) > 2 else None
+        handler = self.jump(SETUP_TRY)
+        self.handlers.append((final, list(self.scopes)))
+        self.statement(node.children[0])
+        self.handlers.pop()
+        self.emit(POP_TRY)
+        done = self.jump(JUMP)
+        self.land(handler)
+        self.emit(POP)
+        if final is None:
+            self.statement(node.children[1])
+            self.land(done)
+            return
+        reraise = self.jump(SETUP_TRY)
+        self.handlers.append((final, list(self.scopes)))
+        self.statement(node.children[1])
+        self.handlers.pop()
+        self.emit(POP_TRY)
+        caught = self.jump(JUMP)
+        self.land(reraise)
+        error_slot = self.new_slot(None)
+        self.emit(STORE_LOCAL, error_slot)
+        self.statement(final)
+        self.emit(LOAD_LOCAL, error_slot)
+        self.emit(RAISE)
+        self.land(done)
+        self.land(caught)
+        self.statement(final)
+
+    # ----------------------- expresiones -----------------------
+    def expression(self, node: ASTNode) -> None:
+        method = getattr(self, 'expr_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        method(node)
+
+    def expr_Num(self, node: ASTNode) -> None:
+        self.emit(LOAD_CONST, self.const(literal(node.kind, node.value)))
+
+    expr_String = expr_Num
+    expr_Char = expr_Num
+
+    def expr_Var(self, node: ASTNode) -> None:
+        self.load(node)
+
+    def expr_UnaryOp(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        if node.value == '<-':
+            self.mark(node.line)
+            self.emit(NEG)
+
+    def expr_PostfixOp(self, node: ASTNode) -> None:
+        # Sobre una variable vale lo que tenía antes de sumarle (o restarle) uno
+        target = node.children[0]
+        self.expression(target)
+        if target.kind == 'Var':
+            self.emit(DUP)
+        self.emit(LOAD_CONST, self.const(1))
+        self.mark(node.line)
+        self.emit(ADD if node.value == '<++' else SUB)
+        if target.kind == 'Var':
+            self.store(target)
+
+    def expr_BinaryOp(self, node: ASTNode) -> None:
+        self.expression(node.children[0])
+        self.expression(node.children[1])
+        self.mark(node.line)
+        self.emit(BINARY_OPS[node.value])
+
+    def expr_Call(self, node: ASTNode) -> None:
+        index = self.function_ids.get(node.value)
+        if index is None:
+            raise runtime_error('E403', node.line, node.value)
+        for arg in node.children[0].children:
+            self.expression(arg)
+        # Enlace estático y E406, como en ClosureCompiler.call
+        definer = self.definers[index]
+        enclosing = self.current
+        opened = False
+        while enclosing is not None and enclosing != definer:
+            opened = opened or enclosing == index
+            enclosing = self.definers[enclosing]
+        if enclosing == definer and (self.linked[index] or opened):
+            hops = self.level - (0 if definer is None else self.frame_levels[definer])
+            if hops:
+                self.follow(hops if self.linked[index] else hops - 1)
+        elif self.linked[index]:
+            raise runtime_error('E406', node.line, node.value)
+        else:
+            hops = NO_PARENT
+        if hops > NO_PARENT:
+            raise runtime_error('E404', node.line, node.value)
+        self.mark(node.line)
+        self.emit(CALL, index << HOPS_BITS | hops)
+
+
+def compile_bytecode(root: ASTNode) -> BytecodeProgram:
+    # Compila el AST revisado de root (un Program) a bytecode
+    with recursion_limit():
+        return BytecodeCompiler().compile(root)
+
+
+def dumps(program: BytecodeProgram) -> bytes:
+    # Formato: MAGIC y después, con marshal, la versión, el orden de bytes de
+    # las instrucciones y por función (nombre, argumentos, marco inicial, valor
+    # por defecto, instrucciones, constantes, tabla de líneas, primera línea)
+    functions = tuple((code.name, code.argc, tuple(code.template), code.default, code.ops.tobytes(), tuple(code.consts),
+                       code.lines, code.first_line) for code in program.functions)
+    return MAGIC + marshal.dumps((BYTECODE_FORMAT, sys.byteorder, functions))
+
+
+def loads(data: bytes) -> BytecodeProgram:
+    # Inversa de dumps; ValueError si data no es un programa de este formato
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('no es un programa Fish++ compilado')
+    try:
+        version, byteorder, functions = marshal.loads(data[len(MAGIC):])
+    except (EOFError, TypeError, ValueError):
+        raise ValueError('programa compilado dañado') from None
+    if version != BYTECODE_FORMAT:
+        raise ValueError(f'formato de bytecode {version}, se esperaba {BYTECODE_FORMAT}')
+    result = []
+    for name, argc, template, default, ops, consts, lines, first_line in functions:
+        code = CodeObject(name, argc)
+        code.template = list(template)
+        code.size = len(template)
+        code.default = default
+        code.ops.frombytes(ops)
+        if byteorder != sys.byteorder:
+            code.ops.byteswap()
+        code.consts = list(consts)
+        code.lines = lines
+        code.first_line = first_line
+        result.append(code)
+    return BytecodeProgram(result)
@@ -0,0 +1,199 @@
+# Comprueba que un programa revisado sólo falla con errores de Fish++: una
+# fishtion anidada llamada fuera de quien la define se rechaza al compilar
+# (E406), una variable que se lee antes de asignarse vale el cero de su tipo y
+# las operaciones entre valores incompatibles dan E407. Corre casos fijos y
+# programas generados con todos los tipos en los closures, la VM y el
+# transpilador: ninguno debe escapar como un TypeError o NameError de Python y
+# los tres deben dar la misma salida y el mismo error, en la misma línea. Los
+# casos con DEPTH niveles de anidamiento no deben tumbar al intérprete.
+#
+#     python -m Runtime.check_runtime
+import io
+import random
+
+from Parser.parser import Parser
+from Parser.semantic import SemanticAnalyzer
+from Runtime.bytecode import compile_bytecode, loads
+from Runtime.executor import execute
+from Runtime.runtime import FishRuntimeError
+from Runtime.transpiler import run_python
+from Runtime.vm import run_bytecode
+from Tokens.automaton import default_automaton
+from Tokens.tokenizer import process_tokens
+
+GENERATED = 300
+# Anidamiento de las expresiones de los casos profundos: más del que aguanta
+# la pila de C con una función recursiva por nivel
+DEPTH = 30000
+BACKENDS = {
+    'closures': lambda ast, out: execute(ast, out),
+    # Por dumps/loads: el marco inicial también se guarda en el .fshb
+    'vm': lambda ast, out: run_bytecode(loads(compile_bytecode(ast).dumps()), out),
+    'python': lambda ast, out: run_python(ast, out),
+}
+# Programa -> (salida, código del error o None), o un dict con eso por backend
+# cuando no todos pueden correrlo (CPython no compila una expresión tan
+# anidada: E405; los closures no compilan tantas llamadas anidadas: E408)
+CASES = {
+    'fish { fishtion outer(<int a) <int { fishtion inner() <int { emerge a <D } emerge 1 <D } '
+    'splash(inner()) <D }': ('', 'E406'),
+    'fish { fishtion outer(<int a) <int { fishtion inner() <int { emerge a <D } emerge inner() <D } '
+    'fishtion other() <int { emerge inner() <D } splash(outer(3)) <D }': ('', 'E406'),
+    'fish { fishtion outer(<int a) <int { fishtion inner() <int { emerge 7 <D } emerge inner() <+ a <D } '
+    'splash(inner()) <D splash(outer(1)) <D }': ('7\n8\n', None),
+    'fish { fishtion s() <int { emerge 2 <D } fishtion k() <int { fishtion n() <int { emerge s() <D } '
+    'emerge n() <D } splash(n()) <D splash(k()) <D }': ('2\n2\n', None),
+    'fish { <int c <= c <+ 1 <D splash(c) <D }': ('1\n', None),
+    'fish { <int c <= 5 <D fishtion g() <int { <int c <= c <++ <+ c <D emerge c <D } splash(g()) <D }': ('1\n', None),
+    'fish { fork (<int i <= 0 <D i << 3 <D i <++) { <string s <= s <+ "a" <D splash(s) <D } }': ('a\na\na\n', None),
+    'fish { if (0) { <int x <= 1 <D fishtion k() <int { emerge x <+ 1 <D } } splash(k()) <D }': ('1\n', None),
+    'fish { <string s <= ("a" << "b") <D splash(s <+ "x") <D }': ('', 'E407'),
+    'fish { <string s <= "ab" <D try { s <++ <D } catch { splash("c") <D } splash(<- s) <D }': ('c\n', 'E407'),
+    'fish { <charal c <= \'a\' <D splash(c </ c) <D }': ('', 'E407'),
+    'fish { <int x <= ' + '(' * DEPTH + '1' + ' <+ 1)' * DEPTH + ' <D splash(x) <D }':
+        {'closures': (f'{DEPTH + 1}\n', None), 'vm': (f'{DEPTH + 1}\n', None), 'python': ('', 'E405')},
+    'fish { fishtion f(<int a) <int { emerge a <D } splash(' + 'f(' * DEPTH + '1' + ')' * DEPTH + ') <D }':
+        {'closures': ('', 'E408'), 'vm': ('1\n', None), 'python': ('', 'E405')},
+    'fish { fishtion k() <hook { splash(1) <D } splash(k()) <D }': ('1\n0.0\n', None),
+    'fish { <bubble b <= b <D splash(b) <D }': ('0\n', None),
+}
+TYPES = ('<int', '<string', '<charal', '<bubble', '<hook')
+LITERALS = {'<int': ('0', '1', '7'), '<string': ('"ab"', '""'), '<charal': ("'a'", "'z'")}
+OPERATORS = ('<+', '<-', '<*', '</', '<%', '<<', '<<>', '<==', '<!=', '<<=', '<<>=')
+
+
+def parse(automaton, source: str):
+    parser = Parser(process_tokens(automaton, source))
+    ast = parser.parse()
+    assert not SemanticAnalyzer(parser.names).analyze(ast), source
+    return ast
+
+
+def run(backend, ast) -> tuple:
+    # (salida, código y línea del error o None); cualquier otra excepción sale
+    # de aquí
+    out = io.StringIO()
+    try:
+        backend(ast, out)
+    except FishRuntimeError as error:
+        return out.getvalue(), (error.diagnostic.code, error.line)
+    return out.getvalue(), None
+
+
+class Generator:
+    # Programas al azar que pasan SemanticAnalyzer (el análisis descarta los
+    # que no): variables y fishtions anidadas de todos los tipos, operaciones
+    # entre cualquier par de valores del mismo tipo estático y try/catch. Como
+    # en Fish++, una fishtion se puede llamar desde cualquier parte después de
+    # declararse, también fuera del bloque o de la función que la define. Una
+    # fishtion no se llama a sí misma, así que todos terminan
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        # (nombre, tipo de retorno, tipos de los parámetros)
+        self.functions: list = []
+        self.count = 0
+
+    def expression(self, typ: str, variables: list, depth: int = 0):
+        rng = self.rng
+        names = [name for name, t in variables if t == typ]
+        chance = rng.random()
+        if depth > 2 or chance < 0.3:
+            if names and (chance < 0.2 or typ not in LITERALS):
+                return rng.choice(names) + rng.choice(('', '', ' <++', ' <--'))
+            return rng.choice(LITERALS[typ]) if typ in LITERALS else None
+        if chance < 0.45:
+            return self.call([f for f in self.functions if f[1] == typ], variables, depth)
+        if chance < 0.55:
+            operand = self.expression(typ, variables, depth + 1)
+            return operand and '<- ' + operand
+        left = self.expression(typ, variables, depth + 1)
+        right = self.expression(typ, variables, depth + 1)
+        if left is None or right is None:
+            return left or right
+        return f'({left} {rng.choice(OPERATORS)} {right})'
+
+    def call(self, candidates: list, variables: list, depth: int):
+        if not candidates:
+            return None
+        name, _, params = self.rng.choice(candidates)
+        args = [self.expression(typ, variables, depth + 1) for typ in params]
+        if None in args:
+            return None
+        return f'{name}({", ".join(args)})'
+
+    def block(self, variables: list, depth: int, ret) -> str:
+        rng = self.rng
+        variables = list(variables)
+        lines = []
+        for _ in range(rng.randint(1, 5)):
+            chance = rng.random()
+            if chance < 0.25:
+                typ, name = rng.choice(TYPES), f'v{rng.randrange(5)}'
+                # A veces el inicializador lee la variable que declara
+                visible = variables + [(name, typ)] if rng.random() < 0.3 else variables
+                value = self.expression(typ, visible)
+                if value is not None:
+                    lines.append(f'{typ} {name} <= {value} <D')
+                    variables.append((name, typ))
+            elif chance < 0.4 and depth < 3:
+                self.count += 1
+                name, typ = f'f{self.count}', rng.choice(TYPES)
+                params = [rng.choice(TYPES) for _ in range(rng.randrange(3))]
+                inner = variables + [(f'p{i}', t) for i, t in enumerate(params)]
+                body = self.block(inner, depth + 1, typ)
+                self.functions.append((name, typ, params))
+                declared = ', '.join(f'{t} p{i}' for i, t in enumerate(params))
+                lines.append(f'fishtion {name}({declared}) {typ} {{\n{body}\n}}')
+            elif chance < 0.55:
+                value = self.expression(rng.choice(TYPES), variables)
+                if value is not None:
+                    lines.append(f'splash({value}) <D')
+            elif chance < 0.65 and variables:
+                name, typ = rng.choice(variables)
+                value = self.expression(typ, variables)
+                if value is not None:
+                    lines.append(f'{name} <= {value} <D')
+            elif chance < 0.7 and variables:
+                lines.append(f'{rng.choice(variables)[0]} {rng.choice(("<++", "<--"))} <D')
+            elif chance < 0.78:
+                value = self.call(self.functions, variables, 0)
+                if value is not None:
+                    lines.append(value + ' <D')
+            elif chance < 0.85:
+                value = self.expression('<int', variables)
+                if value is not None:
+                    lines.append(f'if ({value}) {{\n{self.block(variables, depth + 1, ret)}\n}}')
+            elif chance < 0.92:
+                lines.append(f'try {{\n{self.block(variables, depth + 1, ret)}\n}} '
+                             f'catch {{\nsplash("c") <D\n}}')
+            elif ret is not None:
+                value = self.expression(ret, variables)
+                if value is not None:
+                    lines.append(f'emerge {value} <D')
+        return '\n'.join(lines)
+
+
+def main():
+    automaton = default_automaton()
+    for source, expected in CASES.items():
+        ast = parse(automaton, source)
+        for name, backend in BACKENDS.items():
+            output, error = run(backend, ast)
+            wanted = expected[name] if isinstance(expected, dict) else expected
+            assert (output, error and error[0]) == wanted, (name, source[:80], output, error)
+    checked = 0
+    for number in range(GENERATED):
+        source = 'fish {\n' + Generator(random.Random(number)).block([], 0, None) + '\n}\n'
+        parser = Parser(process_tokens(automaton, source))
+        ast = parser.parse()
+        if SemanticAnalyzer(parser.names).analyze(ast):
+            continue
+        checked += 1
+        results = {name: run(backend, ast) for name, backend in BACKENDS.items()}
+        assert len(set(results.values())) == 1, (source, results)
+    print(f'{len(CASES)} casos y {checked} programas generados: '
+          f'sólo errores de Fish++ en {", ".join(BACKENDS)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,666 @@
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Parser.ast import ASTNode
+from Runtime.runtime import (LITERAL_TYPES, OPERATORS, ZERO_VALUES, FishRuntimeError, divide, literal, modulo,
+                             negate, operate, recursion_limit, runtime_error, show)
+
+# Líneas de splash que se juntan antes de escribirlas en la salida
+FLUSH_LINES = 4096
+
+# Marco de una llamada (una lista): el marco donde se definió la función (el
+# enlace estático), el valor de retorno y después los parámetros y las
+# variables locales, cada una en su casilla
+FIRST_SLOT = 2
+
+# Constructores de los closures de BinaryOp entre <int (o con <== y <!=, que
+# aceptan cualquier valor): operandos cualesquiera, operando derecho constante,
+# variable local y constante, dos variables locales. Las demás pasan por
+# operate
+BINARY = {
+    '<+': lambda l, r: lambda f: l(f) + r(f),
+    '<-': lambda l, r: lambda f: l(f) - r(f),
+    '<*': lambda l, r: lambda f: l(f) * r(f),
+    '<<': lambda l, r: lambda f: l(f) < r(f),
+    '<<>': lambda l, r: lambda f: l(f) > r(f),
+    '<<=': lambda l, r: lambda f: l(f) <= r(f),
+    '<<>=': lambda l, r: lambda f: l(f) >= r(f),
+    '<==': lambda l, r: lambda f: l(f) == r(f),
+    '<!=': lambda l, r: lambda f: l(f) != r(f),
+}
+BINARY_CONST = {
+    '<+': lambda l, c: lambda f: l(f) + c,
+    '<-': lambda l, c: lambda f: l(f) - c,
+    '<*': lambda l, c: lambda f: l(f) * c,
+    '<<': lambda l, c: lambda f: l(f) < c,
+    '<<>': lambda l, c: lambda f: l(f) > c,
+    '<<=': lambda l, c: lambda f: l(f) <= c,
+    '<<>=': lambda l, c: lambda f: l(f) >= c,
+    '<==': lambda l, c: lambda f: l(f) == c,
+    '<!=': lambda l, c: lambda f: l(f) != c,
+}
+BINARY_LOCAL_CONST = {
+    '<+': lambda s, c: lambda f: f[s] + c,
+    '<-': lambda s, c: lambda f: f[s] - c,
+    '<*': lambda s, c: lambda f: f[s] * c,
+    '<<': lambda s, c: lambda f: f[s] < c,
+    '<<>': lambda s, c: lambda f: f[s] > c,
+    '<<=': lambda s, c: lambda f: f[s] <= c,
+    '<<>=': lambda s, c: lambda f: f[s] >= c,
+    '<==': lambda s, c: lambda f: f[s] == c,
+    '<!=': lambda s, c: lambda f: f[s] != c,
+}
+BINARY_LOCALS = {
+    '<+': lambda a, b: lambda f: f[a] + f[b],
+    '<-': lambda a, b: lambda f: f[a] - f[b],
+    '<*': lambda a, b: lambda f: f[a] * f[b],
+    '<<': lambda a, b: lambda f: f[a] < f[b],
+    '<<>': lambda a, b: lambda f: f[a] > f[b],
+    '<<=': lambda a, b: lambda f: f[a] <= f[b],
+    '<<>=': lambda a, b: lambda f: f[a] >= f[b],
+    '<==': lambda a, b: lambda f: f[a] == f[b],
+    '<!=': lambda a, b: lambda f: f[a] != f[b],
+}
+# </ y <% pasan por los auxiliares de Runtime/runtime.py (división entera de
+# C y error con la línea al dividir por cero)
+ARITHMETIC = {'</': divide, '<%': modulo}
+
+
+def nothing(frame: list) -> None:
+    # Sentencia vacía (bloque vacío, FunctionDef, parte vacía de un fork)
+    return None
+
+
+def frame_up(hops: int) -> Callable[[list], list]:
+    # Closure que sube hops enlaces estáticos desde un marco
+    if hops == 0:
+        return lambda f: f
+    if hops == 1:
+        return lambda f: f[0]
+
+    def up(f):
+        for _ in range(hops):
+            f = f[0]
+        return f
+    return up
+
+
+def sequence(statements: List[Callable]) -> Callable:
+    # Una sentencia devuelve True si ejecutó un emerge (el valor queda en el
+    # marco) y None si no; la secuencia corta en el primer True
+    statements = [s for s in statements if s is not nothing]
+    if not statements:
+        return nothing
+    if len(statements) == 1:
+        return statements[0]
+    if len(statements) == 2:
+        a, b = statements
+        return lambda f: a(f) or b(f)
+    if len(statements) == 3:
+        a, b, c = statements
+        return lambda f: a(f) or b(f) or c(f)
+    statements = tuple(statements)
+
+    def run(f):
+        for statement in statements:
+            if statement(f):
+                return True
+    return run
+
+
+class FunctionCode:
+    # Una fishtion compilada. level es el nivel del marco donde se definió,
+    # definer la FunctionCode que la contiene (None en el programa) y type su
+    # tipo de retorno. outer queda en True si el cuerpo sigue el enlace
+    # estático (usa variables de definer o de más afuera). body y template (el
+    # marco inicial de cada llamada) se completan al terminar de compilar el
+    # cuerpo, así una llamada recursiva ya puede apuntar aquí
+    __slots__ = ('name', 'level', 'definer', 'type', 'outer', 'body', 'template')
+
+    def __init__(self, name: str, level: int, definer: Optional['FunctionCode'], typ: Optional[str]):
+        self.name = name
+        self.level = level
+        self.definer = definer
+        self.type = typ
+        self.outer = False
+        self.body: Callable = nothing
+        self.template: list = []
+
+
+class Executable:
+    """Un programa compilado a closures: se ejecuta con run().
+
+    Lo que escribe splash se junta en buffer y se escribe en la salida cada
+    FLUSH_LINES líneas y al terminar (también si la ejecución falla).
+    """
+
+    def __init__(self):
+        self.body: Callable = nothing
+        self.template: list = [None, None]
+        self.buffer: List[str] = []
+        self.out = None
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.out.write('\n'.join(self.buffer) + '\n')
+            self.buffer.clear()
+
+    def run(self, out=None) -> None:
+        # Ejecuta el programa escribiendo en out (sys.stdout si no se da). Un
+        # error de ejecución que no atrapa un catch sale como FishRuntimeError
+        self.out = out or sys.stdout
+        frame = self.template[:]
+        try:
+            with recursion_limit():
+                self.body(frame)
+        finally:
+            self.flush()
+
+
+class ClosureCompiler:
+    """Compila un AST revisado (sin errores sintácticos ni semánticos) a closures.
+
+    Cada nodo se convierte una sola vez en una función de Python que recibe el
+    marco actual: la dispatch por kind y la resolución de nombres (a casilla y
+    cantidad de enlaces estáticos, con las mismas reglas de ámbito que
+    SemanticAnalyzer) se hacen aquí, así que al ejecutar no queda ninguna de
+    las dos. Los casos comunes (operando constante o variable local, bloques
+    cortos) tienen su propio closure. El tipo de cada expresión se sigue como
+    en SemanticAnalyzer: las operaciones que no son entre <int revisan los
+    tipos al ejecutar (E407).
+    """
+
+    def __init__(self, executable: Executable):
+        self.executable = executable
+        # Ámbitos abiertos: nombre -> (nivel del marco, casilla, tipo)
+        self.scopes: List[Dict[str, Tuple[int, int, str]]] = []
+        self.functions: Dict[str, FunctionCode] = {}
+        self.function: Optional[FunctionCode] = None
+        self.level = 0
+        # Marco inicial de la función actual: cada variable empieza valiendo el
+        # cero de su tipo, así leer una que aún no se asignó (declarada en un
+        # bloque que no corrió) da un valor de su tipo y no None
+        self.template: list = [None, None]
+        # Closure de cada constante -> su valor (para plegar y especializar)
+        self.constants: Dict[Callable, Any] = {}
+        # Línea de la última sentencia que se empezó a compilar (para E408)
+        self.line = -1
+        # Tipo de la última expresión compilada
+        self.type: Optional[str] = None
+        # Casilla de la variable cuyo inicializador se compila y si este la lee
+        self.initializing = -1
+        self.self_reference = False
+
+    def compile(self, root: ASTNode) -> Executable:
+        if root.kind != 'Program' or not root.children:
+            raise runtime_error('E403', root.line, root.kind)
+        self.scopes.append({})
+        self.executable.body = self.statement(root.children[0])
+        self.executable.template = self.template
+        return self.executable
+
+    # ----------------------- nombres -----------------------
+    def declare(self, name: str, typ: str) -> int:
+        slot = len(self.template)
+        self.template.append(ZERO_VALUES.get(typ))
+        self.scopes[-1][name] = (self.level, slot, typ)
+        return slot
+
+    def lookup(self, node: ASTNode) -> Tuple[int, int, str]:
+        # (nivel del marco, casilla, tipo) de la variable node.value
+        for scope in reversed(self.scopes):
+            found = scope.get(node.value)
+            if found is not None:
+                return found
+        raise runtime_error('E403', node.line, node.value)
+
+    def resolve(self, node: ASTNode) -> Tuple[int, int]:
+        # (enlaces que hay que subir, casilla) de la variable node.value
+        level, slot, _ = self.lookup(node)
+        hops = self.level - level
+        if hops:
+            self.follow(hops)
+        elif slot == self.initializing:
+            self.self_reference = True
+        return hops, slot
+
+    def follow(self, links: int) -> None:
+        # La función actual y las que la contienen siguen links enlaces
+        # estáticos: cada una necesita el marco de quien la define (ver call)
+        code = self.function
+        for _ in range(links):
+            if code is None:
+                return
+            code.outer = True
+            code = code.definer
+
+    def read(self, node: ASTNode) -> Callable:
+        hops, slot = self.resolve(node)
+        if hops == 0:
+            return lambda f: f[slot]
+        if hops == 1:
+            return lambda f: f[0][slot]
+        up = frame_up(hops)
+        return lambda f: up(f)[slot]
+
+    def write(self, node: ASTNode, value: Callable) -> Callable:
+        hops, slot = self.resolve(node)
+        if hops == 0:
+            if value in self.constants:
+                c = self.constants[value]
+
+                def assign(f):
+                    f[slot] = c
+            else:
+                def assign(f):
+                    f[slot] = value(f)
+        elif hops == 1:
+            def assign(f):
+                f[0][slot] = value(f)
+        else:
+            up = frame_up(hops)
+
+            def assign(f):
+                up(f)[slot] = value(f)
+        return assign
+
+    def step(self, node: ASTNode, delta: int) -> Callable:
+        # x <++ / x <-- como sentencia
+        hops, slot = self.resolve(node)
+        if self.lookup(node)[2] != '<int':
+            op = '<+' if delta > 0 else '<-'
+            line = node.line
+            up = frame_up(hops)
+
+            def bump(f):
+                frame = up(f)
+                frame[slot] = operate(op, frame[slot], 1, line)
+        elif hops == 0:
+            def bump(f):
+                f[slot] += delta
+        else:
+            up = frame_up(hops)
+
+            def bump(f):
+                up(f)[slot] += delta
+        return bump
+
+    # ----------------------- sentencias -----------------------
+    def statement(self, node: ASTNode) -> Callable:
+        method = getattr(self, 'stmt_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        self.line = node.line
+        return method(node)
+
+    def stmt_Block(self, node: ASTNode) -> Callable:
+        # Como en SemanticAnalyzer, un bloque vacío no abre ámbito
+        if not node.children:
+            return nothing
+        self.scopes.append({})
+        body = sequence([self.statement(item) for item in node.children])
+        self.scopes.pop()
+        return body
+
+    def stmt_Empty(self, node: ASTNode) -> Callable:
+        return nothing
+
+    def stmt_FunctionDef(self, node: ASTNode) -> Callable:
+        params, ret_type, block = node.children
+        code = FunctionCode(node.value, self.level, self.function, ret_type.value if ret_type else None)
+        # La primera declaración de cada nombre es la que vale
+        self.functions.setdefault(node.value, code)
+        saved = (self.scopes, self.function, self.level, self.template)
+        self.scopes = self.scopes + [{}]
+        self.function = code
+        self.level += 1
+        self.template = [None, ZERO_VALUES.get(code.type)]
+        for param in params.children:
+            self.declare(param.value, param.children[0].value)
+        code.body = self.statement(block)
+        code.template = self.template
+        self.scopes, self.function, self.level, self.template = saved
+        return nothing
+
+    def stmt_Declaration(self, node: ASTNode) -> Callable:
+        # Como en SemanticAnalyzer, el nombre se declara antes del inicializador.
+        # Si este lo lee, la variable empieza valiendo el cero de su tipo
+        typ = node.children[0].value
+        slot = self.declare(node.value, typ)
+        if len(node.children) < 2:
+            return nothing
+        init = node.children[1]
+        saved = (self.initializing, self.self_reference)
+        self.initializing, self.self_reference = slot, False
+        value = self.expression(init.children[0] if init.kind == 'Initializer' else init)
+        self_reference = self.self_reference
+        self.initializing, self.self_reference = saved
+        if self_reference:
+            zero = ZERO_VALUES.get(typ)
+
+            def declare(f):
+                f[slot] = zero
+                f[slot] = value(f)
+        elif value in self.constants:
+            c = self.constants[value]
+
+            def declare(f):
+                f[slot] = c
+        else:
+            def declare(f):
+                f[slot] = value(f)
+        return declare
+
+    def stmt_Assign(self, node: ASTNode) -> Callable:
+        return self.write(node, self.expression(node.children[0]))
+
+    def stmt_Inc(self, node: ASTNode) -> Callable:
+        return self.step(node, 1)
+
+    def stmt_Dec(self, node: ASTNode) -> Callable:
+        return self.step(node, -1)
+
+    def stmt_CallStmt(self, node: ASTNode) -> Callable:
+        call = self.call(node)
+
+        def call_statement(f):
+            call(f)
+        return call_statement
+
+    def stmt_Print(self, node: ASTNode) -> Callable:
+        value = self.expression(node.children[0])
+        executable = self.executable
+        buffer = executable.buffer
+        append = buffer.append
+
+        def splash(f):
+            v = value(f)
+            append(v if type(v) is str else show(v))
+            if len(buffer) >= FLUSH_LINES:
+                executable.flush()
+        return splash
+
+    def stmt_Return(self, node: ASTNode) -> Callable:
+        value = self.expression(node.children[0])
+
+        def emerge(f):
+            f[1] = value(f)
+            return True
+        return emerge
+
+    def stmt_If(self, node: ASTNode) -> Callable:
+        cond = self.expression(node.children[0])
+        then = self.statement(node.children[1])
+        if len(node.children) < 3:
+            return lambda f: then(f) if cond(f) else None
+        otherwise = self.statement(node.children[2])
+        return lambda f: then(f) if cond(f) else otherwise(f)
+
+    def stmt_While(self, node: ASTNode) -> Callable:
+        cond = self.expression(node.children[0])
+        body = self.statement(node.children[1])
+
+        def whale(f):
+            while cond(f):
+                if body(f):
+                    return True
+        return whale
+
+    def stmt_For(self, node: ASTNode) -> Callable:
+        # El inicializador declara en el ámbito actual, como en SemanticAnalyzer
+        init_node, cond_node, step_node, block = node.children
+        init = self.statement(init_node)
+        cond = self.expression(cond_node) if cond_node.kind != 'Empty' else None
+        step = self.statement(step_node)
+        body = self.statement(block)
+        if cond is None:
+            def fork(f):
+                init(f)
+                while True:
+                    if body(f):
+                        return True
+                    step(f)
+        else:
+            def fork(f):
+                init(f)
+                while cond(f):
+                    if body(f):
+                        return True
+                    step(f)
+        return fork
+
+    def stmt_ForStep(self, node: ASTNode) -> Callable:
+        if not node.children:
+            return nothing
+        tail = node.children[0]
+        if tail.kind == 'Postfix':
+            return self.step(node, 1 if tail.value == '<++' else -1)
+        return self.write(node, self.expression(tail.children[0]))
+
+    def stmt_TryCatch(self, node: ASTNode) -> Callable:
+        body = self.statement(node.children[0])
+        handler = self.statement(node.children[1])
+
+        def try_catch(f):
+            try:
+                return body(f)
+            except FishRuntimeError:
+                return handler(f)
+        if len(node.children) < 3:
+            return try_catch
+        final = self.statement(node.children[2].children[0])
+
+        def try_finally(f):
+            # Un emerge en el finally gana, como en C++/Java
+            try:
+                result = try_catch(f)
+            except BaseException:
+                if final(f):
+                    return True
+                raise
+            return final(f) or result
+        return try_finally
+
+    # ----------------------- expresiones -----------------------
+    def expression(self, node: ASTNode) -> Callable:
+        method = getattr(self, 'expr_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        return method(node)
+
+    def constant(self, value: Any) -> Callable:
+        closure = lambda f: value
+        self.constants[closure] = value
+        return closure
+
+    def expr_Num(self, node: ASTNode) -> Callable:
+        self.type = LITERAL_TYPES[node.kind]
+        return self.constant(literal(node.kind, node.value))
+
+    expr_String = expr_Num
+    expr_Char = expr_Num
+
+    def expr_Var(self, node: ASTNode) -> Callable:
+        read = self.read(node)
+        self.type = self.lookup(node)[2]
+        return read
+
+    def expr_Call(self, node: ASTNode) -> Callable:
+        return self.call(node)
+
+    def expr_UnaryOp(self, node: ASTNode) -> Callable:
+        operand = self.expression(node.children[0])
+        if node.value != '<-':
+            return operand
+        if self.type != '<int':
+            line = node.line
+            return lambda f: negate(operand(f), line)
+        if operand in self.constants:
+            return self.constant(-self.constants[operand])
+        return lambda f: -operand(f)
+
+    def expr_PostfixOp(self, node: ASTNode) -> Callable:
+        # Sobre una variable, x<++ la incrementa y vale lo que tenía antes; sobre
+        # otra expresión solo suma (o resta) uno
+        delta = 1 if node.value == '<++' else -1
+        target = node.children[0]
+        operand = self.expression(target)
+        checked = self.type != '<int'
+        op = '<+' if delta > 0 else '<-'
+        line = node.line
+        if target.kind != 'Var':
+            if checked:
+                return lambda f: operate(op, operand(f), 1, line)
+            return lambda f: operand(f) + delta
+        hops, slot = self.resolve(target)
+        up = frame_up(hops)
+        if checked:
+            def post(f):
+                frame = up(f)
+                value = frame[slot]
+                frame[slot] = operate(op, value, 1, line)
+                return value
+        else:
+            def post(f):
+                frame = up(f)
+                value = frame[slot]
+                frame[slot] = value + delta
+                return value
+        return post
+
+    def expr_BinaryOp(self, node: ASTNode) -> Callable:
+        op = node.value
+        left_node, right_node = node.children
+        left = self.expression(left_node)
+        typ = self.type
+        right = self.expression(right_node)
+        # Como en SemanticAnalyzer, el tipo es el del operando izquierdo
+        self.type = typ
+        constants = self.constants
+        if typ != '<int' and op in OPERATORS:
+            line = node.line
+            if left in constants and right in constants:
+                try:
+                    return self.constant(operate(op, constants[left], constants[right], line))
+                except FishRuntimeError:
+                    pass
+            return lambda f: operate(op, left(f), right(f), line)
+        if op in ARITHMETIC:
+            helper = ARITHMETIC[op]
+            line = node.line
+            if left in constants and right in constants:
+                try:
+                    return self.constant(helper(constants[left], constants[right], line))
+                except FishRuntimeError:
+                    pass
+            return lambda f: helper(left(f), right(f), line)
+        if left in constants and right in constants:
+            return self.constant(BINARY[op](left, right)(None))
+        local_left = left_node.kind == 'Var' and self.resolve(left_node)
+        if right in constants:
+            if local_left and local_left[0] == 0:
+                return BINARY_LOCAL_CONST[op](local_left[1], constants[right])
+            return BINARY_CONST[op](left, constants[right])
+        if local_left and local_left[0] == 0 and right_node.kind == 'Var':
+            hops, slot = self.resolve(right_node)
+            if hops == 0:
+                return BINARY_LOCALS[op](local_left[1], slot)
+        return BINARY[op](left, right)
+
+    def call(self, node: ASTNode) -> Callable:
+        # Llamada a la fishtion node.value, que ya tiene que estar declarada
+        code = self.functions.get(node.value)
+        if code is None:
+            raise runtime_error('E403', node.line, node.value)
+        args = [self.expression(arg) for arg in node.children[0].children]
+        self.type = code.type
+        # Enlace estático: el marco de la función que contiene la definición, a
+        # level - code.level enlaces de aquí. Solo hace falta si la llamada usa
+        # ese marco (outer) o si todavía no se sabe: code está abierta, es la
+        # actual o una que la contiene. Una función cerrada ya tiene su outer
+        # definitivo; desde fuera de su definer no hay tal marco y una que lo
+        # usa no se puede llamar (E406)
+        definer = code.definer
+        enclosing = self.function
+        opened = False
+        while enclosing is not None and enclosing is not definer:
+            opened = opened or enclosing is code
+            enclosing = enclosing.definer
+        if enclosing is definer and (code.outer or opened):
+            hops = self.level - code.level
+            if hops:
+                self.follow(hops if code.outer else hops - 1)
+            up = frame_up(hops)
+        elif code.outer:
+            raise runtime_error('E406', node.line, node.value)
+        else:
+            up = lambda f: None
+        name = node.value
+        line = node.line
+        if len(args) == 0:
+            def call(f):
+                frame = code.template[:]
+                frame[0] = up(f)
+                try:
+                    code.body(frame)
+                except RecursionError:
+                    raise runtime_error('E402', line, name) from None
+                return frame[1]
+        elif len(args) == 1:
+            a, = args
+
+            def call(f):
+                frame = code.template[:]
+                frame[0] = up(f)
+                frame[2] = a(f)
+                try:
+                    code.body(frame)
+                except RecursionError:
+                    raise runtime_error('E402', line, name) from None
+                return frame[1]
+        elif len(args) == 2:
+            a, b = args
+
+            def call(f):
+                frame = code.template[:]
+                frame[0] = up(f)
+                frame[2] = a(f)
+                frame[3] = b(f)
+                try:
+                    code.body(frame)
+                except RecursionError:
+                    raise runtime_error('E402', line, name) from None
+                return frame[1]
+        else:
+            slots = tuple(enumerate(args, FIRST_SLOT))
+
+            def call(f):
+                frame = code.template[:]
+                frame[0] = up(f)
+                for i, arg in slots:
+                    frame[i] = arg(f)
+                try:
+                    code.body(frame)
+                except RecursionError:
+                    raise runtime_error('E402', line, name) from None
+                return frame[1]
+        return call
+
+
+def compile_program(root: ASTNode) -> Executable:
+    # Compila el AST revisado de root (un Program) a un Executable. Cada nivel
+    # de una expresión es una llamada de Python al compilar: si ni con el
+    # límite alto cabe, E408 en la línea de la sentencia que la contiene
+    compiler = ClosureCompiler(Executable())
+    try:
+        with recursion_limit():
+            return compiler.compile(root)
+    except RecursionError:
+        raise runtime_error('E408', compiler.line) from None
+
+
+def execute(root: ASTNode, out=None) -> Executable:
+    # Compila y ejecuta root; devuelve el Executable para volver a correrlo
+    program = compile_program(root)
+    program.run(out)
+    return program
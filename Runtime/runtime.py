@@ -0,0 +1,130 @@
+import math
+import operator
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from Parser.ast import ASTNode
+from Parser.diagnostics import Diagnostic
+
+# Profundidad de recursión de Python mientras se compila o se ejecuta un
+# programa: los árboles profundos (expresiones largas, bloques anidados,
+# recursión de Fish++) se compilan y se ejecutan con llamadas anidadas
+RECURSION_LIMIT = 100000
+
+# Valor que devuelve una función que termina sin emerge, según su tipo
+ZERO_VALUES: Dict[str, Any] = {'<int': 0, '<string': '', '<charal': '', '<bubble': 0, '<hook': 0.0}
+
+# Tipo de cada literal, como en SemanticAnalyzer
+LITERAL_TYPES = {'Num': '<int', 'String': '<string', 'Char': '<charal'}
+
+# Los operadores que fallan en Python con operandos de tipos distintos (<== y
+# <!= no fallan; </ y <% son divide y modulo), como funciones. Un operando
+# <int siempre vale un número al ejecutar, pero los demás no: una comparación
+# entre <string vale 1 o 0 y sigue tipada como <string. Las operaciones que no
+# son entre <int pasan por aquí y un TypeError de Python se reporta como E407
+OPERATORS = {
+    '<+': operator.add, '<-': operator.sub, '<*': operator.mul,
+    '<<': operator.lt, '<<>': operator.gt, '<<=': operator.le, '<<>=': operator.ge,
+}
+
+
+class FishRuntimeError(Exception):
+    # Error al ejecutar un programa; lleva su Diagnostic como ParseError. Es lo
+    # que atrapa un catch de Fish++
+    def __init__(self, diagnostic: Diagnostic):
+        super().__init__(diagnostic)
+        self.diagnostic = diagnostic
+        self.line = diagnostic.line
+
+    def __str__(self) -> str:
+        return str(self.diagnostic)
+
+
+def runtime_error(code: str, line: int, *args) -> FishRuntimeError:
+    return FishRuntimeError(Diagnostic(code, line, args=args))
+
+
+def literal(kind: str, lexeme: str) -> Any:
+    # Valor de un nodo Num, String o Char (el lexema trae las comillas)
+    if kind == 'Num':
+        return float(lexeme) if '.' in lexeme else int(lexeme)
+    return lexeme[1:-1]
+
+
+def divide(a, b, line: int):
+    # </ como en C: entre enteros trunca hacia cero
+    try:
+        if type(a) is int and type(b) is int:
+            q = a // b
+            if q < 0 and q * b != a:
+                q += 1
+            return q
+        return a / b
+    except ZeroDivisionError:
+        raise runtime_error('E400', line) from None
+    except TypeError:
+        raise runtime_error('E407', line, '</') from None
+
+
+def modulo(a, b, line: int):
+    # <% como en C: el resto tiene el signo del dividendo
+    try:
+        if type(a) is int and type(b) is int:
+            r = a % b
+            if r and (r < 0) != (a < 0):
+                r -= b
+            return r
+        return math.fmod(a, b)
+    except (ZeroDivisionError, ValueError):
+        raise runtime_error('E401', line) from None
+    except TypeError:
+        raise runtime_error('E407', line, '<%') from None
+
+
+def operate(op: str, a, b, line: int):
+    # a op b con uno de OPERATORS, revisando los tipos al ejecutar
+    try:
+        return OPERATORS[op](a, b)
+    except TypeError:
+        raise runtime_error('E407', line, op) from None
+
+
+def negate(value, line: int):
+    # <- unario, revisando el tipo al ejecutar
+    try:
+        return -value
+    except TypeError:
+        raise runtime_error('E407', line, '<-') from None
+
+
+def reads(node: ASTNode, name: str) -> bool:
+    # Si la expresión node lee la variable name (una expresión no abre ámbitos,
+    # así que cualquier Var con ese nombre es la misma variable). Con una pila
+    # propia: una expresión muy anidada no usa la pila de C
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.kind == 'Var' and node.value == name:
+            return True
+        stack.extend(node.children)
+    return False
+
+
+def show(value) -> str:
+    # Lo que escribe splash: las comparaciones dan 1 o 0, como en C
+    if value is True:
+        return '1'
+    if value is False:
+        return '0'
+    return str(value)
+
+
+@contextmanager
+def recursion_limit(limit: int = RECURSION_LIMIT):
+    previous = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(previous, limit))
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(previous)
@@ -0,0 +1,507 @@
+import hashlib
+import math
+import sys
+from types import CodeType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from Parser.ast import ASTNode
+from Runtime.executor import FLUSH_LINES
+from Runtime.runtime import OPERATORS as CHECKED
+from Runtime.runtime import (LITERAL_TYPES, ZERO_VALUES, FishRuntimeError, divide, literal, modulo, negate, operate,
+                             reads, recursion_limit, runtime_error, show)
+
+# Nombre de archivo de los code objects generados (sale en los tracebacks)
+FILENAME = '<fish++>'
+INDENT = '    '
+
+# Code objects ya compilados, por huella del fuente de Python generado. Al
+# llegar a CODE_CACHE_SIZE entradas se descarta la más vieja
+CODE_CACHE: Dict[bytes, CodeType] = {}
+CODE_CACHE_SIZE = 256
+
+# Precedencias de Python de menor a mayor, para poner solo los paréntesis
+# necesarios (el tokenizer de Python no acepta más de 200 anidados)
+COMPARISON, ADDITIVE, MULTIPLICATIVE, UNARY, ATOM = range(5)
+
+OPERATORS = {
+    '<+': ('+', ADDITIVE), '<-': ('-', ADDITIVE), '<*': ('*', MULTIPLICATIVE),
+    '<<': ('<', COMPARISON), '<<>': ('>', COMPARISON), '<<=': ('<=', COMPARISON),
+    '<<>=': ('>=', COMPARISON), '<==': ('==', COMPARISON), '<!=': ('!=', COMPARISON),
+}
+# </ y <% llaman a los auxiliares de Runtime/runtime.py con la línea del nodo.
+# Con una variable entera no negativa y un divisor entero positivo constante
+# dan lo mismo que // y % de Python, que se usan directamente
+ARITHMETIC = {'</': ('_divide', '//'), '<%': ('_modulo', '%')}
+# Los operadores de CHECKED entre valores que no son <int se traducen a
+# _operate (y el <- unario a _negate): un TypeError de Python sale como E407
+
+
+class PythonFunction:
+    # Una fishtion traducida. level es el nivel de su marco (el programa es el
+    # nivel 0), definer la PythonFunction que la contiene y type su tipo de
+    # retorno. need es el nivel más externo de cuyas variables depende: si no
+    # depende de ninguna de fuera se escribe en el módulo, si no dentro de su
+    # definer (placed) y solo se puede llamar desde ahí
+    __slots__ = ('name', 'pyname', 'level', 'definer', 'type', 'params', 'zero', 'body', 'nonlocals', 'preset',
+                 'nested', 'need', 'placed')
+
+    def __init__(self, name: str, pyname: str, level: int, definer: Optional['PythonFunction'],
+                 typ: Optional[str] = None):
+        self.name = name
+        self.pyname = pyname
+        self.level = level
+        self.definer = definer
+        self.type = typ
+        self.params: List[str] = []
+        self.zero = ZERO_VALUES.get(typ)
+        # Líneas del cuerpo: (sangría relativa, línea de Fish++, texto, llamadas)
+        self.body: List[Tuple[int, int, str, tuple]] = []
+        self.nonlocals: Set[str] = set()
+        # Variables que empiezan valiendo el cero de su tipo, como las casillas
+        # del marco del executor: declaradas sin inicializador o usadas por
+        # fishtions anidadas (que pueden correr sin que se hayan asignado)
+        self.preset: Dict[str, Any] = {}
+        self.nested: List['PythonFunction'] = []
+        self.need = level
+        self.placed = False
+
+
+class PythonProgram:
+    """Un programa traducido a Python y compilado por CPython: se ejecuta con run().
+
+    source es el fuente generado, lines la línea de Fish++ de cada una de sus
+    líneas y calls las llamadas de cada línea: (def llamado, línea de Fish++).
+    splash se junta en buffer como en Executable.
+    """
+
+    def __init__(self, source: str, code: CodeType, lines: List[int], calls: List[tuple], names: Dict[str, str]):
+        self.source = source
+        self.code = code
+        self.lines = lines
+        self.calls = calls
+        self.names = names
+        self.buffer: List[str] = []
+        self.out = None
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.out.write('\n'.join(self.buffer) + '\n')
+            self.buffer.clear()
+
+    def splash(self, value) -> None:
+        self.buffer.append(value if type(value) is str else show(value))
+        if len(self.buffer) >= FLUSH_LINES:
+            self.flush()
+
+    def run(self, out=None) -> None:
+        self.out = out or sys.stdout
+        namespace = {
+            '__builtins__': {}, '_divide': divide, '_modulo': modulo, '_splash': self.splash,
+            '_CATCH': (FishRuntimeError, RecursionError), '_inf': math.inf, '_int': int,
+            '_operate': operate, '_negate': negate,
+        }
+        try:
+            exec(self.code, namespace)
+            with recursion_limit():
+                namespace['_fish_main']()
+        except RecursionError as error:
+            raise self.recursion_error(error) from None
+        finally:
+            self.flush()
+
+    def recursion_error(self, error: RecursionError) -> FishRuntimeError:
+        # E402 en la última llamada del código generado, como la reporta el
+        # executor: con la línea del nodo Call y el nombre de la fishtion
+        frames = []
+        tb = error.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code.co_filename == FILENAME:
+                frames.append((tb.tb_frame.f_code.co_name, tb.tb_lineno))
+            tb = tb.tb_next
+        if len(frames) < 2:
+            return runtime_error('E402', -1, '?')
+        called = frames[-1][0]
+        line = frames[-2][1] - 1
+        fish_line = next((at for pyname, at in self.calls[line] if pyname == called), self.lines[line])
+        return runtime_error('E402', fish_line, self.names.get(called, called))
+
+
+class PythonGenerator:
+    """Traduce un AST revisado (sin errores sintácticos ni semánticos) a Python.
+
+    Cada variable de Fish++ se vuelve una variable local con nombre único
+    (nombre_N), resuelta con las reglas de ámbito de SemanticAnalyzer. Cada
+    fishtion se vuelve un def: en el módulo si no usa variables de fuera, o
+    anidada en la función que la contiene (con nonlocal para las que asigna).
+    Los def van al principio de su función, así una fishtion se puede llamar
+    antes de llegar a su definición, como en el executor. Una llamada a un def
+    anidado desde fuera de su función no lo vería: se rechaza con E406. El tipo
+    de cada expresión se sigue como en ClosureCompiler.
+    """
+
+    def __init__(self):
+        # Ámbitos abiertos: nombre -> (nivel, nombre en Python, tipo)
+        self.scopes: List[Dict[str, Tuple[int, str, str]]] = []
+        self.functions: Dict[str, PythonFunction] = {}
+        self.module: List[PythonFunction] = []
+        # Funciones abiertas, una por nivel
+        self.open: List[PythonFunction] = []
+        self.function: Optional[PythonFunction] = None
+        self.depth = 0
+        self.counter = 0
+        # Llamadas de la sentencia que se está traduciendo
+        self.pending: List[Tuple[str, int]] = []
+        # Tipo de la última expresión traducida
+        self.type: Optional[str] = None
+
+    def generate(self, root: ASTNode) -> Tuple[str, List[int], List[tuple], Dict[str, str]]:
+        # Devuelve el fuente, la línea de Fish++ y las llamadas de cada línea y
+        # el nombre de Fish++ de cada def
+        if root.kind != 'Program' or not root.children:
+            raise runtime_error('E403', root.line, root.kind)
+        main = PythonFunction('fish', '_fish_main', 0, None)
+        self.scopes.append({})
+        self.open.append(main)
+        self.function = main
+        self.statement(root.children[0])
+        self.module.append(main)
+        out: List[Tuple[str, int, tuple]] = []
+        for function in self.module:
+            self.assemble(function, 0, out)
+        names = {f.pyname: f.name for f in self.functions.values()}
+        source = '\n'.join(text for text, _, _ in out) + '\n'
+        return source, [line for _, line, _ in out], [calls for _, _, calls in out], names
+
+    def assemble(self, function: PythonFunction, indent: int, out: List[Tuple[str, int, tuple]]) -> None:
+        pad = INDENT * indent
+        inner = pad + INDENT
+        line = function.body[0][1] if function.body else -1
+        out.append((f"{pad}def {function.pyname}({', '.join(function.params)}):", line, ()))
+        if function.nonlocals:
+            out.append((f"{inner}nonlocal {', '.join(sorted(function.nonlocals))}", line, ()))
+        preset: Dict[str, List[str]] = {}
+        for pyname, zero in function.preset.items():
+            if pyname not in function.params:
+                preset.setdefault(repr(zero), []).append(pyname)
+        for zero, pynames in sorted(preset.items()):
+            out.append((f"{inner}{' = '.join(sorted(pynames))} = {zero}", line, ()))
+        for nested in function.nested:
+            self.assemble(nested, indent + 1, out)
+        for depth, fish_line, text, calls in function.body:
+            out.append((inner + INDENT * depth + text, fish_line, calls))
+        if not function.body or function.body[-1][0] or not function.body[-1][2].startswith('return '):
+            out.append((f'{inner}return {function.zero!r}', line, ()))
+
+    # ----------------------- nombres -----------------------
+    def declare(self, name: str, typ: str) -> str:
+        self.counter += 1
+        pyname = f'{name}_{self.counter}'
+        self.scopes[-1][name] = (self.function.level, pyname, typ)
+        return pyname
+
+    def resolve(self, node: ASTNode, assign: bool = False) -> str:
+        # Nombre en Python de la variable node.value; deja su tipo en type
+        for scope in reversed(self.scopes):
+            found = scope.get(node.value)
+            if found is not None:
+                level, pyname, self.type = found
+                if level < self.function.level:
+                    self.function.need = min(self.function.need, level)
+                    self.open[level].preset[pyname] = ZERO_VALUES.get(self.type)
+                    if assign:
+                        self.function.nonlocals.add(pyname)
+                return pyname
+        raise runtime_error('E403', node.line, node.value)
+
+    def step(self, node: ASTNode, sign: str) -> None:
+        # x <++ / x <-- como sentencia
+        name = self.resolve(node, True)
+        if self.type == '<int':
+            self.emit(node.line, f'{name} {sign}= 1')
+        else:
+            self.emit(node.line, f"{name} = _operate('<{sign}', {name}, 1, {node.line})")
+
+    def emit(self, line: int, text: str) -> None:
+        self.function.body.append((self.depth, line, text, tuple(self.pending)))
+        self.pending.clear()
+
+    def suite(self, node: ASTNode, line: int) -> None:
+        # Cuerpo de un if/whale/try: una sangría más, y pass si queda vacío
+        body = self.function.body
+        before = len(body)
+        self.depth += 1
+        self.statement(node)
+        if len(body) == before:
+            self.emit(line, 'pass')
+        self.depth -= 1
+
+    # ----------------------- sentencias -----------------------
+    def statement(self, node: ASTNode) -> None:
+        method = getattr(self, 'stmt_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        method(node)
+
+    def stmt_Block(self, node: ASTNode) -> None:
+        # Como en SemanticAnalyzer, un bloque vacío no abre ámbito
+        if not node.children:
+            return
+        self.scopes.append({})
+        for item in node.children:
+            self.statement(item)
+        self.scopes.pop()
+
+    def stmt_Empty(self, node: ASTNode) -> None:
+        pass
+
+    def stmt_FunctionDef(self, node: ASTNode) -> None:
+        params, ret_type, block = node.children
+        self.counter += 1
+        function = PythonFunction(node.value, f'{node.value}_{self.counter}', self.function.level + 1, self.function,
+                                  ret_type.value if ret_type else None)
+        # La primera declaración de cada nombre es la que vale
+        self.functions.setdefault(node.value, function)
+        saved = (self.scopes, self.function, self.depth)
+        self.scopes = self.scopes + [{}]
+        self.function = function
+        self.open.append(function)
+        self.depth = 0
+        for param in params.children:
+            function.params.append(self.declare(param.value, param.children[0].value))
+        self.statement(block)
+        self.open.pop()
+        self.scopes, self.function, self.depth = saved
+        definer = self.function
+        if function.need >= function.level:
+            self.module.append(function)
+        else:
+            definer.nested.append(function)
+            function.placed = True
+            if function.need < definer.level:
+                definer.need = min(definer.need, function.need)
+
+    def stmt_Declaration(self, node: ASTNode) -> None:
+        # Como en SemanticAnalyzer, el nombre se declara antes del inicializador.
+        # Si este lo lee, la variable empieza valiendo el cero de su tipo
+        typ = node.children[0].value
+        pyname = self.declare(node.value, typ)
+        if len(node.children) < 2:
+            self.function.preset[pyname] = ZERO_VALUES.get(typ)
+            return
+        init = node.children[1]
+        init = init.children[0] if init.kind == 'Initializer' else init
+        if reads(init, node.value):
+            self.emit(node.line, f'{pyname} = {ZERO_VALUES.get(typ)!r}')
+        self.emit(node.line, f'{pyname} = {self.value(init)}')
+
+    def stmt_Assign(self, node: ASTNode) -> None:
+        value = self.value(node.children[0])
+        self.emit(node.line, f'{self.resolve(node, True)} = {value}')
+
+    def stmt_Inc(self, node: ASTNode) -> None:
+        self.step(node, '+')
+
+    def stmt_Dec(self, node: ASTNode) -> None:
+        self.step(node, '-')
+
+    def stmt_CallStmt(self, node: ASTNode) -> None:
+        self.emit(node.line, self.call(node))
+
+    def stmt_Print(self, node: ASTNode) -> None:
+        self.emit(node.line, f'_splash({self.value(node.children[0])})')
+
+    def stmt_Return(self, node: ASTNode) -> None:
+        self.emit(node.line, f'return {self.value(node.children[0])}')
+
+    def stmt_If(self, node: ASTNode, keyword: str = 'if') -> None:
+        self.emit(node.line, f'{keyword} {self.value(node.children[0])}:')
+        self.suite(node.children[1], node.line)
+        if len(node.children) < 3:
+            return
+        otherwise = node.children[2]
+        if otherwise.kind == 'If':
+            self.stmt_If(otherwise, 'elif')
+        else:
+            self.emit(node.line, 'else:')
+            self.suite(otherwise, node.line)
+
+    def stmt_While(self, node: ASTNode) -> None:
+        self.emit(node.line, f'while {self.value(node.children[0])}:')
+        self.suite(node.children[1], node.line)
+
+    def stmt_For(self, node: ASTNode) -> None:
+        # El inicializador declara en el ámbito actual, como en SemanticAnalyzer
+        init, cond, step, block = node.children
+        self.statement(init)
+        self.emit(node.line, f'while {self.value(cond) if cond.kind != "Empty" else "True"}:')
+        body = self.function.body
+        before = len(body)
+        self.depth += 1
+        self.statement(block)
+        self.statement(step)
+        if len(body) == before:
+            self.emit(node.line, 'pass')
+        self.depth -= 1
+
+    def stmt_ForStep(self, node: ASTNode) -> None:
+        if not node.children:
+            return
+        tail = node.children[0]
+        if tail.kind == 'Postfix':
+            self.step(node, '+' if tail.value == '<++' else '-')
+        else:
+            value = self.value(tail.children[0])
+            self.emit(node.line, f'{self.resolve(node, True)} = {value}')
+
+    def stmt_TryCatch(self, node: ASTNode) -> None:
+        # catch también atrapa la recursión demasiado profunda, que en el
+        # executor llega como un FishRuntimeError (E402). Un emerge en el
+        # finally gana, igual que un return en un finally de Python
+        self.emit(node.line, 'try:')
+        self.suite(node.children[0], node.line)
+        self.emit(node.line, 'except _CATCH:')
+        self.suite(node.children[1], node.line)
+        if len(node.children) > 2:
+            self.emit(node.line, 'finally:')
+            self.suite(node.children[2].children[0], node.line)
+
+    # ----------------------- expresiones -----------------------
+    def value(self, node: ASTNode) -> str:
+        return self.expression(node)[0]
+
+    @staticmethod
+    def wrap(text: str, own: int, precedence: int) -> str:
+        # text, entre paréntesis si su precedencia own no llega a precedence
+        return text if own >= precedence else f'({text})'
+
+    def expression(self, node: ASTNode) -> Tuple[str, int]:
+        method = getattr(self, 'expr_' + node.kind, None)
+        if method is None:
+            raise runtime_error('E403', node.line, node.kind)
+        return method(node)
+
+    def expr_Num(self, node: ASTNode) -> Tuple[str, int]:
+        value = literal(node.kind, node.value)
+        self.type = LITERAL_TYPES[node.kind]
+        if isinstance(value, float) and math.isinf(value):
+            text = '_inf' if value > 0 else '-_inf'
+        else:
+            text = repr(value)
+        return text, UNARY if text.startswith('-') else ATOM
+
+    expr_String = expr_Num
+    expr_Char = expr_Num
+
+    def expr_Var(self, node: ASTNode) -> Tuple[str, int]:
+        return self.resolve(node), ATOM
+
+    def expr_Call(self, node: ASTNode) -> Tuple[str, int]:
+        return self.call(node), ATOM
+
+    def expr_UnaryOp(self, node: ASTNode) -> Tuple[str, int]:
+        if node.value != '<-':
+            return self.expression(node.children[0])
+        operand, precedence = self.expression(node.children[0])
+        if self.type != '<int':
+            return f'_negate({operand}, {node.line})', ATOM
+        return '-' + self.wrap(operand, precedence, UNARY), UNARY
+
+    def expr_PostfixOp(self, node: ASTNode) -> Tuple[str, int]:
+        # Sobre una variable, x<++ la incrementa y vale lo que tenía antes; sobre
+        # otra expresión solo suma (o resta) uno
+        sign = '+' if node.value == '<++' else '-'
+        target = node.children[0]
+        if target.kind != 'Var':
+            text, precedence = self.expression(target)
+            if self.type != '<int':
+                return f"_operate('<{sign}', {text}, 1, {node.line})", ATOM
+            return f'{self.wrap(text, precedence, ADDITIVE)} {sign} 1', ADDITIVE
+        name = self.resolve(target, True)
+        if self.type != '<int':
+            return f"({name}, {name} := _operate('<{sign}', {name}, 1, {node.line}))[0]", ATOM
+        return f'({name}, {name} := {name} {sign} 1)[0]', ATOM
+
+    def expr_BinaryOp(self, node: ASTNode) -> Tuple[str, int]:
+        left, right = node.children
+        a, a_precedence = self.expression(left)
+        typ = self.type
+        b, b_precedence = self.expression(right)
+        # Como en SemanticAnalyzer, la operación tiene el tipo de su operando izquierdo
+        self.type = typ
+        if node.value in ARITHMETIC:
+            helper, op = ARITHMETIC[node.value]
+            call = f'{helper}({a}, {b}, {node.line})'
+            if left.kind == 'Var' and right.kind == 'Num' and b.isdigit() and int(b) > 0:
+                return f'({a} {op} {b} if {a}.__class__ is _int and {a} >= 0 else {call})', ATOM
+            return call, ATOM
+        if typ != '<int' and node.value in CHECKED:
+            return f'_operate({node.value!r}, {a}, {b}, {node.line})', ATOM
+        op, precedence = OPERATORS[node.value]
+        # Las comparaciones de Python se encadenan: a < b < c no es (a < b) < c
+        left_min = precedence + 1 if precedence == COMPARISON else precedence
+        return f'{self.wrap(a, a_precedence, left_min)} {op} {self.wrap(b, b_precedence, precedence + 1)}', precedence
+
+    def call(self, node: ASTNode) -> str:
+        # Llamada a la fishtion node.value, que ya tiene que estar declarada
+        function = self.functions.get(node.value)
+        if function is None:
+            raise runtime_error('E403', node.line, node.value)
+        current = self.function
+        if function.level <= current.level and self.open[function.level] is function:
+            # Una función abierta (la actual o una que la contiene): la llamada
+            # tiene que quedar dentro de ella
+            if function is not current:
+                current.need = min(current.need, function.level)
+        elif function.placed:
+            # Anidada en su definer: su nombre es una variable de ese nivel, que
+            # solo se ve desde dentro de él
+            definer = function.definer
+            if definer.level > current.level or self.open[definer.level] is not definer:
+                raise runtime_error('E406', node.line, node.value)
+            current.need = min(current.need, function.level - 1)
+        self.pending.append((function.pyname, node.line))
+        # En un bucle y no con un generador dentro de join(), que anidaría la
+        # pila de C en cada llamada de los argumentos
+        args = []
+        for arg in node.children[0].children:
+            args.append(self.value(arg))
+        self.type = function.type
+        return f"{function.pyname}({', '.join(args)})"
+
+
+def transpile(root: ASTNode) -> Tuple[str, List[int], List[tuple], Dict[str, str]]:
+    # Fuente de Python del AST revisado de root, con sus tablas de líneas y
+    # llamadas. Una expresión tan anidada que ni la traducción cabe en la pila
+    # de Python tampoco la compilaría CPython: E405, como en compile_python
+    try:
+        with recursion_limit():
+            return PythonGenerator().generate(root)
+    except RecursionError:
+        raise runtime_error('E405', -1, 'RecursionError') from None
+
+
+def compile_python(root: ASTNode) -> PythonProgram:
+    # Traduce root y lo compila con compile(); el code object se reutiliza si
+    # el mismo fuente ya se compiló. CPython no compila anidamientos muy
+    # profundos (paréntesis, bloques, sangría): eso sale como E405
+    source, lines, calls, names = transpile(root)
+    key = hashlib.blake2b(source.encode(), digest_size=20).digest()
+    code = CODE_CACHE.get(key)
+    if code is None:
+        try:
+            code = compile(source, FILENAME, 'exec')
+        except (SyntaxError, RecursionError, MemoryError) as error:
+            lineno = getattr(error, 'lineno', None) or 0
+            line = lines[lineno - 1] if 0 < lineno <= len(lines) else -1
+            raise runtime_error('E405', line, getattr(error, 'msg', type(error).__name__)) from None
+        if len(CODE_CACHE) >= CODE_CACHE_SIZE:
+            del CODE_CACHE[next(iter(CODE_CACHE))]
+        CODE_CACHE[key] = code
+    return PythonProgram(source, code, lines, calls, names)
+
+
+def run_python(root: ASTNode, out=None) -> PythonProgram:
+    # Traduce, compila y ejecuta root; devuelve el PythonProgram para volver a correrlo
+    program = compile_python(root)
+    program.run(out)
+    return program
@@ -0,0 +1,201 @@
+import sys
+
+from Runtime.bytecode import (ADD, BINARY_OPS, CALL, DEC_LOCAL, DIV, DUP, EQ, GE, GT, HOPS_BITS, HOPS_MASK, INC_LOCAL,
+                              JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, LE, LOAD_CONST, LOAD_LOCAL, LOAD_OUTER, LT, MOD, MUL,
+                              NE, NEG, NO_PARENT, POP, POP_TRY, PRINT, RAISE, RETURN, SETUP_TRY, STORE_LOCAL,
+                              STORE_OUTER, SUB, BytecodeProgram)
+from Runtime.executor import FLUSH_LINES
+from Runtime.runtime import FishRuntimeError, divide, modulo, runtime_error, show
+
+# Llamadas anidadas que admite la VM antes de dar un error de recursión
+MAX_CALL_DEPTH = 100000
+
+# Operador de Fish++ de cada instrucción que puede fallar con un TypeError de
+# Python (E407); DIV y MOD ya lo reportan en divide y modulo
+SYMBOLS = {op: symbol for symbol, op in BINARY_OPS.items()}
+SYMBOLS.update({NEG: '<-', INC_LOCAL: '<+', DEC_LOCAL: '<-'})
+
+
+class VM:
+    """Ejecuta un BytecodeProgram con un ciclo de dispatch.
+
+    Una sola pila de valores para todo el programa y una pila de llamadas
+    explícita (la recursión de Fish++ no usa la pila de Python). Cada marco
+    tiene su lista de manejadores de try: (instrucción del manejador, altura
+    de la pila). Un FishRuntimeError sin línea toma la de la instrucción que
+    falló, de la tabla de líneas de su función; un TypeError de una operación
+    entre valores incompatibles se reporta igual, como E407. splash se junta en buffer como
+    en Executable.
+    """
+
+    def __init__(self, program: BytecodeProgram):
+        self.program = program
+        self.buffer = []
+        self.out = None
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.out.write('\n'.join(self.buffer) + '\n')
+            self.buffer.clear()
+
+    def run(self, out=None) -> None:
+        self.out = out or sys.stdout
+        try:
+            self.execute()
+        finally:
+            self.flush()
+
+    def execute(self) -> None:
+        functions = self.program.functions
+        # Las instrucciones como listas: indexarlas es más rápido que al arreglo
+        all_ops = [code.ops.tolist() for code in functions]
+        code = functions[0]
+        ops = all_ops[0]
+        consts = code.consts
+        frame = code.template[:]
+        handlers = []
+        calls = []
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        buffer = self.buffer
+        append = buffer.append
+        pc = 0
+        while True:
+            try:
+                while True:
+                    op = ops[pc]
+                    arg = ops[pc + 1]
+                    pc += 2
+                    if op == LOAD_LOCAL:
+                        push(frame[arg])
+                    elif op == LOAD_CONST:
+                        push(consts[arg])
+                    elif op == STORE_LOCAL:
+                        frame[arg] = pop()
+                    elif op == JUMP_IF_TRUE:
+                        if pop():
+                            pc += arg
+                    elif op == JUMP_IF_FALSE:
+                        if not pop():
+                            pc += arg
+                    elif op == INC_LOCAL:
+                        frame[arg] += 1
+                    elif op == ADD:
+                        b = pop()
+                        stack[-1] += b
+                    elif op == SUB:
+                        b = pop()
+                        stack[-1] -= b
+                    elif op == LT:
+                        b = pop()
+                        stack[-1] = stack[-1] < b
+                    elif op == EQ:
+                        b = pop()
+                        stack[-1] = stack[-1] == b
+                    elif op == MOD:
+                        b = pop()
+                        stack[-1] = modulo(stack[-1], b, -1)
+                    elif op == MUL:
+                        b = pop()
+                        stack[-1] *= b
+                    elif op == DIV:
+                        b = pop()
+                        stack[-1] = divide(stack[-1], b, -1)
+                    elif op == JUMP:
+                        pc += arg
+                    elif op == NE:
+                        b = pop()
+                        stack[-1] = stack[-1] != b
+                    elif op == GT:
+                        b = pop()
+                        stack[-1] = stack[-1] > b
+                    elif op == LE:
+                        b = pop()
+                        stack[-1] = stack[-1] <= b
+                    elif op == GE:
+                        b = pop()
+                        stack[-1] = stack[-1] >= b
+                    elif op == DEC_LOCAL:
+                        frame[arg] -= 1
+                    elif op == CALL:
+                        index = arg >> HOPS_BITS
+                        callee = functions[index]
+                        new = callee.template[:]
+                        hops = arg & HOPS_MASK
+                        if hops != NO_PARENT:
+                            parent = frame
+                            for _ in range(hops):
+                                parent = parent[0]
+                            new[0] = parent
+                        argc = callee.argc
+                        if argc:
+                            new[1:argc + 1] = stack[-argc:]
+                            del stack[-argc:]
+                        if len(calls) >= MAX_CALL_DEPTH:
+                            raise runtime_error('E402', -1, callee.name)
+                        calls.append((code, ops, consts, frame, handlers, pc))
+                        code = callee
+                        ops = all_ops[index]
+                        consts = code.consts
+                        frame = new
+                        handlers = []
+                        pc = 0
+                    elif op == RETURN:
+                        # El valor de retorno queda en la pila para quien llamó
+                        if not calls:
+                            pop()
+                            return
+                        code, ops, consts, frame, handlers, pc = calls.pop()
+                    elif op == PRINT:
+                        value = pop()
+                        append(value if type(value) is str else show(value))
+                        if len(buffer) >= FLUSH_LINES:
+                            self.flush()
+                    elif op == POP:
+                        pop()
+                    elif op == DUP:
+                        push(stack[-1])
+                    elif op == NEG:
+                        stack[-1] = -stack[-1]
+                    elif op == LOAD_OUTER:
+                        parent = frame
+                        for _ in range(arg & HOPS_MASK):
+                            parent = parent[0]
+                        push(parent[arg >> HOPS_BITS])
+                    elif op == STORE_OUTER:
+                        parent = frame
+                        for _ in range(arg & HOPS_MASK):
+                            parent = parent[0]
+                        parent[arg >> HOPS_BITS] = pop()
+                    elif op == SETUP_TRY:
+                        handlers.append((pc + arg, len(stack)))
+                    elif op == POP_TRY:
+                        handlers.pop()
+                    elif op == RAISE:
+                        raise pop()
+                    else:
+                        raise ValueError(f'código de operación desconocido {op} en {code.name}')
+            except (FishRuntimeError, TypeError) as caught:
+                error = caught
+                if type(caught) is TypeError:
+                    symbol = SYMBOLS.get(ops[pc - 2])
+                    if symbol is None:
+                        raise
+                    error = runtime_error('E407', -1, symbol)
+                if error.line < 0:
+                    error.line = error.diagnostic.line = code.line_at(pc - 2)
+                # Se desarma la pila de llamadas hasta un marco con manejador
+                while not handlers:
+                    if not calls:
+                        if error is caught:
+                            raise
+                        raise error from None
+                    code, ops, consts, frame, handlers, pc = calls.pop()
+                pc, depth = handlers.pop()
+                del stack[depth:]
+                push(error)
+
+
+def run_bytecode(program: BytecodeProgram, out=None) -> None:
+    VM(program).run(out)
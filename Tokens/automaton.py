@@ -0,0 +1,20 @@
+from Helpers.transitions import transitions as TRANSITIONS, accept_states as ACCEPT_STATES
+
+
+class Automaton:
+    def __init__(self, transitions: list, accept_states: set):
+        self.transitions = transitions
+        self.accept_states = accept_states
+        max_state = max(max(frm, to) for frm, to, _ in transitions)
+        self.states = {i: {} for i in range(max_state + 1)}
+        self.start_state = 0
+        self._build_transitions(transitions)
+
+    def _build_transitions(self, transitions):
+        for from_state, to_state, symbol in transitions:
+            self.states[from_state][symbol] = to_state
+
+
+def default_automaton() -> Automaton:
+    # Autómata del lenguaje (Helpers/transitions.py)
+    return Automaton(TRANSITIONS, ACCEPT_STATES)
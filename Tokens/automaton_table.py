@@ -0,0 +1,261 @@
+# Generado por Tokens/build_table.py; no editar a mano.
+# 202 estados -> 125 tras minimizar, 47 clases de carácter.
+FINGERPRINT = 'c35dd9754f928869ee121792a68fd62479a7fa7f'
+WIDTH = 47
+SEEN = '!"%\'()*+,-./0123456789<=>ABCDEFGHIJKLMNOPQRSTUVWXYZ[]_abcdefghijklmnopqrstuvwxyz{}~'
+BYTE_CLASSES = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x03\x00\x00\x04\x00\x05\x06\x07\x08\t\n\x0b\x0c\r\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x00\x00\x0f\x10\x11\x00\x00\x12\x12\x12\x13\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x12\x14\x15\x16\x00\x12\x00\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x12 !"#$%\x12&\'()\x12*\x12+\x12,\x00-.\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+TYPES = (
+    'NO RECONOCIDO',  # 0
+    'NO RECONOCIDO',  # 1
+    'NO RECONOCIDO',  # 2
+    '(',  # 3
+    ')',  # 4
+    'NO RECONOCIDO',  # 5
+    ',',  # 6
+    'PUNTO',  # 7
+    'NUM',  # 8
+    'NO RECONOCIDO',  # 9
+    'NO RECONOCIDO',  # 10
+    'ident',  # 11
+    'CORCHETE_IZQ',  # 12
+    'CORCHETE_DER',  # 13
+    'ident',  # 14
+    'ident',  # 15
+    'ident',  # 16
+    'ident',  # 17
+    'ident',  # 18
+    'ident',  # 19
+    'ident',  # 20
+    'ident',  # 21
+    'ident',  # 22
+    '{',  # 23
+    '}',  # 24
+    'NO RECONOCIDO',  # 25
+    'STRING_LITERAL',  # 26
+    'CHAR_LITERAL',  # 27
+    'NO RECONOCIDO',  # 28
+    'NO RECONOCIDO',  # 29
+    '<%',  # 30
+    '<*',  # 31
+    '<+',  # 32
+    '<-',  # 33
+    '</',  # 34
+    '<<',  # 35
+    '<=',  # 36
+    '<D',  # 37
+    'NO RECONOCIDO',  # 38
+    'NO RECONOCIDO',  # 39
+    'NO RECONOCIDO',  # 40
+    'NO RECONOCIDO',  # 41
+    'NO RECONOCIDO',  # 42
+    'COMENTARIO_BLOQUE_INICIO',  # 43
+    'OP',  # 44
+    'ident',  # 45
+    'ident',  # 46
+    'ident',  # 47
+    'ident',  # 48
+    'ident',  # 49
+    'ident',  # 50
+    'NO RECONOCIDO',  # 51
+    'if',  # 52
+    'ident',  # 53
+    'ident',  # 54
+    'ident',  # 55
+    'COMENTARIO_BLOQUE_FIN',  # 56
+    'COMENTARIO_LINEA',  # 57
+    'NUM',  # 58
+    '<!=',  # 59
+    '<++',  # 60
+    '<--',  # 61
+    '<<=',  # 62
+    '<<>',  # 63
+    '<==',  # 64
+    'NO RECONOCIDO',  # 65
+    'NO RECONOCIDO',  # 66
+    'NO RECONOCIDO',  # 67
+    'NO RECONOCIDO',  # 68
+    'NO RECONOCIDO',  # 69
+    'ident',  # 70
+    'ident',  # 71
+    'ident',  # 72
+    'ident',  # 73
+    'ident',  # 74
+    'ident',  # 75
+    'ident',  # 76
+    'NO RECONOCIDO',  # 77
+    'ident',  # 78
+    'try',  # 79
+    'ident',  # 80
+    '<<>=',  # 81
+    'NO RECONOCIDO',  # 82
+    'NO RECONOCIDO',  # 83
+    'NO RECONOCIDO',  # 84
+    '<int',  # 85
+    'NO RECONOCIDO',  # 86
+    'ident',  # 87
+    'ident',  # 88
+    'DICT',  # 89
+    'else',  # 90
+    'ident',  # 91
+    'ident',  # 92
+    'fish',  # 93
+    'fork',  # 94
+    'ident',  # 95
+    'ident',  # 96
+    'NO RECONOCIDO',  # 97
+    'NO RECONOCIDO',  # 98
+    '<hook',  # 99
+    'NO RECONOCIDO',  # 100
+    'ARRAY',  # 101
+    'catch',  # 102
+    'ident',  # 103
+    'ident',  # 104
+    'ident',  # 105
+    'ident',  # 106
+    'ident',  # 107
+    'whale',  # 108
+    'NO RECONOCIDO',  # 109
+    'NO RECONOCIDO',  # 110
+    'NO RECONOCIDO',  # 111
+    'emerge',  # 112
+    'ident',  # 113
+    'ident',  # 114
+    'ident',  # 115
+    'splash',  # 116
+    '<bubble',  # 117
+    '<charal',  # 118
+    '<string',  # 119
+    'finally',  # 120
+    'ident',  # 121
+    'ident',  # 122
+    'IMPORT',  # 123
+    'fishtion',  # 124
+)
+# Una fila por estado: destino * WIDTH, o acción especial (< 0)
+TABLE = (
+    -1, -2, -7, 47, -7, 94, 141, 188, -7, 235, 282, 235, 329, -7, 376, 423, 470, -7, 517, 517, 564, -1, 611, 658, 517, 705, 752, 799, 846, 517, 517, 893, 517, 517, 517, 517, 517, 517, 517, 940, 987, 517, 1034, 517, 1081, 1128, 1175,
+    47, 47, 47, 1222, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47, 47,
+    94, 94, 94, 94, 94, 1269, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, -6, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94, 94,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, 470, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 376, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 1316, -4, 376, -4, -4, -4, -5, -5, -4, -3, -4, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -5, -4, -4, -4,
+    -3, -3, 1363, -4, 1410, -4, -4, -4, 1457, 1504, -4, 1551, -4, 1598, -4, 1645, 1692, -4, -4, 1739, -4, -3, -4, -4, 1786, 1833, -4, -4, -4, -4, 1880, 1927, -4, -4, -4, -4, -4, -4, -4, 1974, -4, -4, -4, -4, -4, -4, 2021,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, 2068, -4, 2068, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 2115, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 2162, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 2209, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 2256, 2303, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 2350, 517, 517, 517, 517, 2397, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 2444, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 2491, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 2538, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 2585, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2632, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2679,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2726, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2773, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, 2820, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2867, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2914, 2961, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3008, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3055, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, 3102, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3149, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3196, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3243, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3290, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3337, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 3384, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3431, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 3478, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3525, 517, 517, 517, 3572, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3619, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3666, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 3713, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 3760, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 2726, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3807, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, 3854, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, 3901, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3948, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 3995, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 4042, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 4089, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 4136, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4183, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 4230, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4277, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 4324, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 4371, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4418, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 4465, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4512, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, 4559, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 4606, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 4653, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, 4700, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4747, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 4794, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 4841, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 4888, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 4935, -4, -4, 4982, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5029, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 5076, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 5123, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, 5170, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 5217, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 5264, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5311, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5358, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 5405, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 5452, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, 5499, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 5546, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, 5593, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5640, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5687, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5734, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5781, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, 517, -4, -4, -4, 517, 517, -4, -3, -4, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 517, 5828, 517, 517, 517, 517, 517, 517, 517, 517, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+    -3, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -3, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4, -4,
+)
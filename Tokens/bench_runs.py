@@ -0,0 +1,41 @@
+# Benchmark de entradas patológicas para el tokenizador: una cadena de 10 MB,
+# identificadores y números muy largos y bloques de espacios. Cada caso se mide
+# con tamaños que se duplican; si el tiempo por MB se mantiene, el costo es lineal.
+#
+#     python -m Tokens.bench_runs
+import time
+
+from Tokens.automaton import default_automaton
+from Tokens.tokenizer import process_tokens
+
+MB = 1 << 20
+SIZES = (MB, 2 * MB, 5 * MB, 10 * MB)
+
+CASES = {
+    'cadena': lambda n: '"' + 'a' * n + '"',
+    'identificador': lambda n: 'x' * n + ' ',
+    'numero': lambda n: '1' * n,
+    'espacios': lambda n: 'a' + ' ' * (n // 2) + '(' + '\n' * (n // 2) + ')',
+}
+
+
+def measure(automaton, text: str, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        began = time.perf_counter()
+        process_tokens(automaton, text)
+        elapsed = time.perf_counter() - began
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    automaton = default_automaton()
+    for name, build in CASES.items():
+        for size in SIZES:
+            elapsed = measure(automaton, build(size))
+            print(f'{name:>14} {size // MB:>3} MB  {elapsed * 1000:8.1f} ms  {elapsed * 1000 * MB / size:6.1f} ms/MB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# Genera Tokens/automaton_table.py: la tabla del autómata ya minimizada, para que
+# compile_automaton la cargue sin construirla. Volver a ejecutar tras cambiar
+# Helpers/transitions.py, Helpers/tokenizerHelpers.py o las reglas de Tokens/compiled.py:
+#
+#     python -m Tokens.build_table
+import os
+
+from Tokens.automaton import default_automaton
+from Tokens.compiled import CompiledAutomaton, fingerprint
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'automaton_table.py')
+
+
+def render(automaton) -> str:
+    full = CompiledAutomaton.build(automaton)
+    compiled = full.minimized()
+    width = compiled.width
+    lines = [
+        '# Generado por Tokens/build_table.py; no editar a mano.',
+        f'# {len(full.types)} estados -> {len(compiled.types)} tras minimizar, {width} clases de carácter.',
+        f'FINGERPRINT = {fingerprint(automaton)!r}',
+        f'WIDTH = {width}',
+        f'SEEN = {compiled.seen!r}',
+        f'BYTE_CLASSES = {compiled.byte_classes!r}',
+        'TYPES = (',
+    ]
+    lines += [f'    {typ!r},  # {s}' for s, typ in enumerate(compiled.types)]
+    lines += [')', '# Una fila por estado: destino * WIDTH, o acción especial (< 0)', 'TABLE = (']
+    for s in range(len(compiled.types)):
+        row = compiled.table[s * width:(s + 1) * width]
+        lines.append('    ' + ', '.join(map(str, row)) + ',')
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+def main() -> None:
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        f.write(render(default_automaton()))
+    print(f"Tabla escrita en {OUTPUT}")
+
+
+if __name__ == '__main__':
+    main()
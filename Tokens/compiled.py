@@ -0,0 +1,487 @@
+import hashlib
+import re
+
+from Helpers.tokenizerHelpers import (
+    RESERVED_FINAL_STATES, RESERVED_PREFIX_STATES, RESERVED_INITIALS, ID_STATE, NUM_STATE,
+    STRING_BODY_STATE, CHAR_BODY_STATE, CHAR_END_STATE, STATE_TOKEN_TYPES, TOKEN_TYPE_IDS, classify_state,
+    is_alpha, is_digit,
+)
+
+# Acciones especiales de la tabla (los valores >= 0 son "consumir e ir al estado")
+SKIP = -1        # espacio ignorado en el estado inicial
+NEWLINE = -2     # salto de línea en el estado inicial
+TRAIL = -3       # espacio/salto después de un token a medias
+EMIT = -4        # no hay transición: volcar token y reprocesar el carácter
+NO_VALIDO = -5   # número seguido de letra
+ESCAPE = -6      # '\' dentro de un char literal
+STRAY = -7       # carácter sin transición desde el estado inicial
+
+NO_VALIDO_KIND = TOKEN_TYPE_IDS['NO VALIDO']
+NO_RECONOCIDO_KIND = TOKEN_TYPE_IDS['NO RECONOCIDO']
+
+# Caracteres que el autómata ve; el resto (incluido no ASCII) se ignora
+_ASCII = [chr(i) for i in range(128)]
+# Tamaño de ventana al calcular clases de un archivo mapeado
+_WINDOW = 1 << 20
+
+
+def _category(state: int, c: str):
+    # Misma categorización que usaba process_tokens carácter a carácter
+    if state == STRING_BODY_STATE:
+        return '"' if c == '"' else 'str'
+    if state == CHAR_BODY_STATE:
+        return "'" if c == "'" else 'char_body'
+    if c == '"' or c == "'":
+        return c
+    if is_alpha(c):
+        if state == 0 and c in RESERVED_INITIALS:
+            return c
+        if state in RESERVED_PREFIX_STATES or state >= 10:
+            return c
+        return 'char'
+    if is_digit(c):
+        return 'num'
+    if c == '.' or c in "+-*/=(){},[]<%>!D~":
+        return c
+    return None
+
+
+def _action(states: dict, state: int, c: str) -> int:
+    category = _category(state, c)
+    if category is None:
+        if c == '\n':
+            return NEWLINE if state == 0 else TRAIL
+        return SKIP if state == 0 else TRAIL
+    if state == 0 and c == "'":
+        return CHAR_BODY_STATE
+    if state == CHAR_BODY_STATE:
+        if c == '\\':
+            return ESCAPE
+        return CHAR_END_STATE if c == "'" else CHAR_BODY_STATE
+    if state == CHAR_END_STATE:
+        return EMIT
+    if state == NUM_STATE and is_alpha(c):
+        return NO_VALIDO
+    row = states.get(state, {})
+    if category in row:
+        return row[category]
+    # Prefijo de reservada roto por letra/dígito: continúa como identificador
+    if (state in RESERVED_PREFIX_STATES and state not in RESERVED_FINAL_STATES
+            and (is_alpha(c) or is_digit(c))):
+        return _action(states, ID_STATE, c)
+    return STRAY if state == 0 else EMIT
+
+
+class _ClassMap(dict):
+    # str.translate consulta este dict; lo que no aparece es un carácter ignorado
+    def __init__(self, mapping: dict, skip: str):
+        super().__init__(mapping)
+        self.skip = skip
+
+    def __missing__(self, key):
+        return self.skip
+
+
+def _class_run(classes: list):
+    # match(clases, i, n).end() da el fin del tramo de esas clases desde i
+    if not classes:
+        return None
+    return re.compile(b'[' + b''.join(re.escape(bytes([k])) for k in classes) + b']*').match
+
+
+class CompiledAutomaton:
+    """Autómata bajado a una tabla densa estado × clase de carácter.
+
+    table[estado * width + clase] guarda el estado destino ya multiplicado por
+    width (>= 0) o una de las acciones especiales de arriba. El estado 0 es el
+    inicial. Se construye con build() (desde un Automaton) o se carga ya
+    minimizado desde Tokens/automaton_table.py (ver Tokens/build_table.py).
+    """
+
+    def __init__(self, table, width: int, byte_classes: bytes, types, seen: str):
+        self.table = table
+        self.width = width
+        self.byte_classes = byte_classes
+        self.types = types
+        self.seen = seen
+        self.skip_class = byte_classes[ord(' ')]
+        self.newline_class = byte_classes[ord('\n')]
+        self.class_map = _ClassMap({b: chr(byte_classes[b]) for b in range(128)}, chr(self.skip_class))
+
+        alnum = bytearray(width)
+        for c in _ASCII:
+            if is_alpha(c) or is_digit(c):
+                alnum[byte_classes[ord(c)]] = 1
+        self.alnum = bytes(alnum)
+
+        # Id de tipo (TOKEN_TYPE_IDS) indexado por estado * width, como base en scan
+        self.kinds = [0] * (len(types) * width)
+        for s, typ in enumerate(types):
+            self.kinds[s * width] = TOKEN_TYPE_IDS[typ]
+
+        # Tramos que scan salta de una vez con una regex sobre las clases, en vez
+        # de una transición por carácter: runs[base] para los estados con lazo
+        # (cuerpo de cadena o char, cola de identificador, dígitos), trails[base]
+        # para los espacios tras un token y blank para los del estado inicial
+        self.runs = [None] * len(self.kinds)
+        self.trails = [None] * len(self.kinds)
+        for s in range(len(types)):
+            base = s * width
+            row = table[base:base + width]
+            self.runs[base] = _class_run([k for k in range(width) if row[k] == base])
+            self.trails[base] = _class_run([k for k in range(width) if row[k] == TRAIL])
+        self.blank = _class_run([k for k in range(width) if table[k] in (SKIP, NEWLINE)])
+        self.alnum_run = _class_run([k for k in range(width) if alnum[k]])
+        self._ignored = re.compile('[^' + re.escape(seen) + ']')
+
+    @classmethod
+    def build(cls, automaton) -> 'CompiledAutomaton':
+        states = automaton.states
+        n_states = max(max(states), CHAR_END_STATE) + 1
+
+        # Clases de carácter: caracteres con el mismo comportamiento en todos los estados
+        signatures = {}
+        char_class = {}
+        for c in _ASCII:
+            sig = tuple(_action(states, s, c) for s in range(n_states))
+            char_class[c] = signatures.setdefault(sig, len(signatures))
+        width = len(signatures)
+        # Los bytes no ASCII (partes de un carácter UTF-8) se ignoran como un espacio
+        byte_classes = bytes(
+            char_class[chr(b)] if b < 128 else char_class[' '] for b in range(256)
+        )
+
+        table = [0] * (n_states * width)
+        for sig, k in signatures.items():
+            for s, act in enumerate(sig):
+                table[s * width + k] = act * width if act >= 0 else act
+
+        # Tipo de token por estado (los no aceptados se reportan como NO RECONOCIDO)
+        types = [
+            classify_state(s) if s in automaton.accept_states else 'NO RECONOCIDO'
+            for s in range(n_states)
+        ]
+        seen = ''.join(c for c in _ASCII if _category(0, c) is not None)
+        return cls(table, width, byte_classes, types, seen)
+
+    def minimized(self) -> 'CompiledAutomaton':
+        # Minimización de Moore: se quitan los estados inalcanzables desde el inicial
+        # y se unen los que tienen el mismo tipo y las mismas acciones hacia
+        # bloques equivalentes. El inicial sigue siendo el estado 0.
+        table = self.table
+        width = self.width
+        order = [0]
+        reached = {0}
+        for s in order:
+            for act in table[s * width:(s + 1) * width]:
+                if act >= 0 and act // width not in reached:
+                    reached.add(act // width)
+                    order.append(act // width)
+
+        def row(s, block):
+            return tuple(block[act // width] if act >= 0 else act
+                         for act in table[s * width:(s + 1) * width])
+
+        block = {s: (self.types[s], row(s, dict.fromkeys(reached, None))) for s in order}
+        while True:
+            ids = {}
+            refined = {s: ids.setdefault((block[s], row(s, block)), len(ids)) for s in order}
+            if len(ids) == len(set(block.values())):
+                break
+            block = refined
+        # Numerar bloques en orden de aparición (el del estado 0 queda en 0)
+        number = {}
+        for s in order:
+            number.setdefault(refined[s], len(number))
+        members = {}
+        for s in order:
+            members.setdefault(number[refined[s]], s)
+
+        new_table = []
+        types = []
+        for b in range(len(number)):
+            s = members[b]
+            new_table.extend(number[refined[act // width]] * width if act >= 0 else act
+                             for act in table[s * width:(s + 1) * width])
+            types.append(self.types[s])
+        return CompiledAutomaton(new_table, width, self.byte_classes, types, self.seen)
+
+    def classes(self, text) -> bytes:
+        # Clase de cada carácter de text (str) o de cada byte (bytes, mmap)
+        if isinstance(text, str):
+            return text.translate(self.class_map).encode('latin-1')
+        if isinstance(text, (bytes, bytearray)):
+            return text.translate(self.byte_classes)
+        # mmap no tiene translate: se traduce por ventanas
+        classes = bytearray(len(text))
+        for pos in range(0, len(text), _WINDOW):
+            classes[pos:pos + _WINDOW] = bytes(text[pos:pos + _WINDOW]).translate(self.byte_classes)
+        return classes
+
+    def strip_ignored(self, lexeme: str) -> str:
+        # Lexema con espacios intermedios (p. ej. "ab cd" -> "abcd")
+        return self._ignored.sub('', lexeme)
+
+    def walk(self, lexeme: str):
+        # Estado alcanzado consumiendo lexeme desde el inicial (None si se detiene antes)
+        base = 0
+        for k in self.classes(lexeme):
+            act = self.table[base + k]
+            if act < 0:
+                return None
+            base = act
+        return base // self.width
+
+    def continuations(self, state: int) -> str:
+        # Caracteres que el autómata seguiría consumiendo desde state
+        base = state * self.width
+        out = []
+        for c, k in zip(_ASCII, self.classes(''.join(_ASCII))):
+            act = self.table[base + k]
+            if act >= 0 or act == NO_VALIDO:
+                out.append(c)
+        return ''.join(out)
+
+
+def fingerprint(automaton) -> str:
+    # Huella de todo lo que define la tabla: si cambia, la tabla precompilada ya no sirve
+    data = repr((
+        sorted(automaton.transitions), sorted(automaton.accept_states),
+        sorted(RESERVED_PREFIX_STATES), sorted(RESERVED_FINAL_STATES), sorted(RESERVED_INITIALS),
+        sorted(STATE_TOKEN_TYPES.items()),
+    ))
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def _precompiled(automaton):
+    # Tabla generada por Tokens/build_table.py, si corresponde a este autómata
+    try:
+        from Tokens import automaton_table
+    except ImportError:
+        return None
+    if automaton_table.FINGERPRINT != fingerprint(automaton):
+        return None
+    return CompiledAutomaton(automaton_table.TABLE, automaton_table.WIDTH, automaton_table.BYTE_CLASSES,
+                             automaton_table.TYPES, automaton_table.SEEN)
+
+
+def compile_automaton(automaton) -> CompiledAutomaton:
+    compiled = getattr(automaton, 'compiled', None)
+    if compiled is None:
+        compiled = _precompiled(automaton)
+        if compiled is None:
+            compiled = CompiledAutomaton.build(automaton).minimized()
+        automaton.compiled = compiled
+    return compiled
+
+
+class ScanState:
+    # Estado del autómata entre un fragmento de entrada y el siguiente
+    def __init__(self):
+        self.line = 1
+        self.base = 0           # estado actual * width
+        self.gap = False        # el lexema tiene espacios intermedios que no forman parte de él
+        self.head = []          # partes del lexema leídas en fragmentos anteriores
+        self.first = 0          # posición en el fuente donde empezó el lexema a medias
+        self.trailing = False   # el fragmento anterior terminó en espacios tras el lexema
+        self.novalido = False   # el fragmento anterior terminó dentro de un NO VALIDO
+        self.escape = False     # el fragmento anterior terminó en '\\' dentro de un char literal
+
+
+def scan(compiled, text, final: bool, carry: ScanState, stream,
+         lo: int = 0, hi: int = None, classes: bytes = None) -> None:
+        # Tokeniza text[lo:hi] (str, o bytes/mmap con posiciones de byte) continuando
+        # desde carry y agrega las filas a stream (TokenStream sobre text); si final
+        # es False, lo que quede a medias se guarda en carry para el siguiente
+        # fragmento. classes puede venir ya calculado para todo text (varios tramos
+        # del mismo texto).
+        table = compiled.table
+        width = compiled.width
+        kinds = compiled.kinds
+        newline_class = compiled.newline_class
+        strip_ignored = compiled.strip_ignored
+        runs = compiled.runs
+        trails = compiled.trails
+        blank = compiled.blank
+        alnum_run = compiled.alnum_run
+        if classes is None:
+            classes = compiled.classes(text)
+
+        kind_append = stream.kind.append
+        start_append = stream.start.append
+        length_append = stream.length.append
+        line_append = stream.line.append
+        base = carry.base
+        gap = carry.gap
+        head = carry.head
+        line = carry.line
+        start = lo      # inicio del lexema en curso dentro de text
+        i = lo
+        n = len(text) if hi is None else hi
+
+        if carry.escape:
+            # El carácter escapado es el primero de este fragmento
+            if i < n:
+                i += 1
+            elif not final:
+                return
+            carry.escape = False
+        elif carry.novalido:
+            j = alnum_run(classes, lo, n).end()
+            if j == n and not final:
+                head.append(text[lo:n])
+                return
+            first = _irregular(stream, carry, head, text[lo:j], gap, strip_ignored, lo)
+            kind_append(NO_VALIDO_KIND)
+            start_append(first)
+            length_append(j - first)
+            line_append(line)
+            carry.novalido = False
+            head = []
+            base = 0
+            gap = False
+            start = i = j
+        elif carry.trailing:
+            if n == lo and not final:
+                return
+            carry.trailing = False
+            # Hubo espacios entre lo leído y este fragmento: si el token sigue, tiene hueco
+            if n > lo and table[base + classes[lo]] not in (EMIT, TRAIL):
+                gap = True
+
+        while i < n:
+            act = table[base + classes[i]]
+            if act >= 0:
+                i += 1
+                if act == base:
+                    # Segundo carácter del lazo: el resto del tramo va de una vez
+                    i = runs[base](classes, i, n).end()
+                base = act
+            elif act == SKIP or act == NEWLINE:
+                j = blank(classes, i, n).end()
+                line += classes.count(newline_class, i, j)
+                start = i = j
+            elif act == EMIT:
+                # Volcar token sin consumir c; se reprocesa desde el estado inicial
+                if head or gap:
+                    first = _irregular(stream, carry, head, text[start:i], gap, strip_ignored, start)
+                    head = []
+                    gap = False
+                else:
+                    first = start
+                kind_append(kinds[base])
+                start_append(first)
+                length_append(i - first)
+                line_append(line)
+                base = 0
+                start = i
+            elif act == TRAIL:
+                # Saltar los espacios y ver si el token continúa después de ellos
+                j = i + 1
+                if j < n and table[base + classes[j]] == TRAIL:
+                    j = trails[base](classes, j, n).end()
+                    line += classes.count(newline_class, i, j)
+                elif classes[i] == newline_class:
+                    line += 1
+                if j == n and not final:
+                    if not head:
+                        carry.first = start
+                    head.append(text[start:i])
+                    carry.trailing = True
+                    break
+                if j < n and table[base + classes[j]] != EMIT:
+                    gap = True
+                    i = j
+                    continue
+                if head or gap:
+                    first = _irregular(stream, carry, head, text[start:i], gap, strip_ignored, start)
+                    head = []
+                    gap = False
+                else:
+                    first = start
+                kind_append(kinds[base])
+                start_append(first)
+                length_append(i - first)
+                line_append(line)
+                base = 0
+                start = i = j
+            elif act == NO_VALIDO:
+                # Número seguido de letra: se consume todo el bloque alfanumérico
+                j = alnum_run(classes, i + 1, n).end()
+                if j == n and not final:
+                    if not head:
+                        carry.first = start
+                    head.append(text[start:n])
+                    carry.novalido = True
+                    break
+                if head or gap:
+                    first = _irregular(stream, carry, head, text[start:j], gap, strip_ignored, start)
+                    head = []
+                    gap = False
+                else:
+                    first = start
+                kind_append(NO_VALIDO_KIND)
+                start_append(first)
+                length_append(j - first)
+                line_append(line)
+                base = 0
+                start = i = j
+            elif act == ESCAPE:
+                # Soporte para escape de caracter
+                if i + 1 < n:
+                    i += 2
+                elif final:
+                    i += 1
+                else:
+                    if not head:
+                        carry.first = start
+                    head.append(text[start:n])
+                    carry.escape = True
+                    break
+            else:
+                # Carácter sin transición desde el estado inicial
+                kind_append(NO_RECONOCIDO_KIND)
+                start_append(i)
+                length_append(1)
+                line_append(line)
+                i += 1
+                start = i
+        else:
+            if final:
+                if base:
+                    if head or gap:
+                        first = _irregular(stream, carry, head, text[start:n], gap, strip_ignored, start)
+                        head = []
+                        gap = False
+                    else:
+                        first = start
+                    kind_append(kinds[base])
+                    start_append(first)
+                    length_append(n - first)
+                    line_append(line)
+                base = 0
+            elif base:
+                if not head:
+                    carry.first = start
+                head.append(text[start:n])
+
+        carry.head = head
+        carry.base = base
+        carry.gap = gap
+        carry.line = line
+
+
+def _irregular(stream, carry, head, last: str, gap: bool, strip_ignored, start: int) -> int:
+        # Lexema que no es un trozo literal del fuente: se guarda completo (como str)
+        # en extra. Devuelve la posición donde empieza su tramo en el fuente.
+        if head:
+            head.append(last)
+            lexeme = last[:0].join(head)
+            first = carry.first
+        else:
+            lexeme = last
+            first = start
+        if not isinstance(lexeme, str):
+            lexeme = lexeme.decode('utf-8')
+        stream.extra[len(stream.kind)] = strip_ignored(lexeme) if gap else lexeme
+        return first
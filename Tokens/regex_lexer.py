@@ -0,0 +1,192 @@
+import re
+
+from Helpers.symbolsTable import tokens as SYMBOLS
+from Helpers.cleaner import clean_input
+from Helpers.tokenizerHelpers import TOKEN_TYPE_IDS
+from Tokens.compiled import compile_automaton, scan, ScanState, SKIP, NEWLINE, STRAY
+from Tokens.stream import TokenStream
+
+# Clases de token que no son literales fijos. La tabla de símbolos describe el
+# identificador exactamente como el autómata; números y literales siguen las
+# reglas del autómata (signo, "NO VALIDO", cadenas sin escapes, chars de varios caracteres).
+_ID = SYMBOLS['ID']['regex']
+# Cada "()" vacío marca qué alternativa coincidió (m.lastindex) y va al final
+# de la rama, para que el motor descarte la rama por su primer carácter.
+_PATTERNS = [
+    # (regex, [(tipo o None para usar el del estado, lexema representativo, inmediato) por marca])
+    (r'"[^"]*"()', [(None, '""', False)]),
+    (r'"[^"]*\Z()', [('NO RECONOCIDO', None, False)]),
+    (r"'(?:[^'\\]|\\.)*'()", [(None, "''", False)]),
+    (r"'(?:[^'\\]|\\.)*\\?\Z()", [('NO RECONOCIDO', None, False)]),
+    (r'(?:[0-9]|[+-][0-9])[0-9]*(?:[a-zA-Z_][a-zA-Z0-9_]*()|\.[0-9]+()|\.()|())',
+     [('NO VALIDO', None, True), (None, '0.0', False), (None, '0.', False), (None, '0', False)]),
+]
+
+
+def _literal(entry: dict):
+    # Entrada de symbolsTable cuya regex es un texto fijo (p. ej. r"<\+" -> "<+")
+    text = re.sub(r'\\(.)', r'\1', entry['regex'])
+    return text if text == entry['example'] else None
+
+
+def _automaton_literals(automaton) -> set:
+    # Todos los textos fijos que el autómata reconoce desde el estado inicial
+    edges = {}
+    for frm, to, symbol in automaton.transitions:
+        if len(symbol) == 1 and symbol not in '"\'' and frm != to:
+            edges.setdefault(frm, []).append((symbol, to))
+    found = set()
+    stack = [(automaton.start_state, '')]
+    while stack:
+        state, text = stack.pop()
+        for symbol, to in edges.get(state, []):
+            found.add(text + symbol)
+            stack.append((to, text + symbol))
+    return found
+
+
+def _charset(chars: str) -> str:
+    return '[' + ''.join(re.escape(c) for c in sorted(chars)) + ']'
+
+
+def _trie_regex(literals: dict, prefix: str = '') -> str:
+    # Alternancia factorizada por prefijos: el motor descarta ramas con un solo
+    # carácter en vez de probar cada literal. Las ramas más largas van primero y
+    # el final del literal solo vale si no sigue un carácter de continuación.
+    children = sorted({text[len(prefix)] for text in literals
+                       if text.startswith(prefix) and len(text) > len(prefix)})
+    branches = [re.escape(c) + _trie_regex(literals, prefix + c) for c in children]
+    if prefix in literals:
+        cont = literals[prefix][1]
+        branches.append('(?!' + _charset(cont) + ')' if cont else '')
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class RegexLexer:
+    """Lexer alternativo: una sola alternancia compilada recorrida con finditer.
+
+    Cada literal lleva un lookahead negativo con los caracteres con los que el
+    autómata seguiría consumiendo, así que coincide exactamente donde el autómata
+    cortaría el token. Si un token sigue después de espacios ("ab cd" -> "abcd"),
+    el resto del texto se entrega al motor de tabla.
+    """
+
+    def __init__(self, automaton):
+        self.compiled = compiled = compile_automaton(automaton)
+        types = compiled.types
+
+        literals = _automaton_literals(automaton)
+        literals.update(filter(None, (_literal(entry) for entry in SYMBOLS.values())))
+
+        # Cada alternativa termina en (espacios que siguen al token)(marca): m.lastindex
+        # identifica la alternativa y el grupo anterior da el fin del lexema y los espacios.
+        # Los literales comparten marca y su tipo se busca por lexema.
+        seen = ''.join(
+            c for c in map(chr, range(128))
+            if compiled.table[compiled.classes(c)[0]] not in (SKIP, NEWLINE)
+        )
+        ignored = '[^' + re.escape(seen) + ']*'
+        self.kinds = [None]     # índice de marca -> (id de tipo, continuaciones, inmediato)
+        parts = []
+
+        def add(regex, markers):
+            parts.append(regex.replace('()', '(' + ignored + ')()'))
+            for typ, sample, immediate in markers:
+                state = compiled.walk(sample) if sample is not None else None
+                cont = compiled.continuations(state) if state is not None else ''
+                self.kinds += [None, (TOKEN_TYPE_IDS[typ or types[state]], cont, immediate)]
+
+        for regex, markers in _PATTERNS:
+            add(regex, markers)
+
+        self.literals = {}      # lexema -> (id de tipo, continuaciones, inmediato)
+        for text in literals:
+            state = compiled.walk(text)
+            if state is not None:
+                self.literals[text] = (TOKEN_TYPE_IDS[types[state]], compiled.continuations(state), False)
+        parts.append(_trie_regex(self.literals) + '(' + ignored + ')()')
+        self.kinds += [None, None]
+        self.literal_group = len(self.kinds) - 1
+
+        add(_ID + '(?:[+-]()|())', [(None, 'x+', False), (None, 'x', False)])
+
+        stray = ''.join(c for c in map(chr, range(128)) if compiled.table[compiled.classes(c)[0]] == STRAY)
+        add(_charset(stray) + '()', [('NO RECONOCIDO', None, True)])
+
+        self.leading = re.compile(ignored)
+        self.pattern = re.compile('|'.join(parts), re.S)
+
+    def tokenize(self, text: str) -> TokenStream:
+        stream = TokenStream(text)
+        kind_append = stream.kind.append
+        start_append = stream.start.append
+        length_append = stream.length.append
+        line_append = stream.line.append
+        kinds = self.kinds
+        literals = self.literals
+        literal_group = self.literal_group
+        count = text.count
+        n = len(text)
+
+        pos = self.leading.match(text).end()
+        line = 1 + count('\n', 0, pos)
+        for m in self.pattern.finditer(text, pos):
+            index = m.lastindex
+            start = m.start()
+            end, after = m.span(index - 1)
+            kind, cont, immediate = literals[text[start:end]] if index == literal_group else kinds[index]
+            if end == after:
+                kind_append(kind)
+                start_append(start)
+                length_append(end - start)
+                line_append(line)
+                continue
+            # El token se emite con la línea posterior a los espacios que lo siguen
+            before = line
+            line += count('\n', end, after)
+            if cont and after < n and text[after] in cont:
+                # El autómata une el token con lo que sigue a los espacios ("ab cd" -> "abcd")
+                state = ScanState()
+                state.line = before
+                scan(self.compiled, text, True, state, stream, start)
+                return stream
+            kind_append(kind)
+            start_append(start)
+            length_append(end - start)
+            line_append(before if immediate else line)
+        return stream
+
+
+def compile_regex_lexer(automaton) -> RegexLexer:
+    lexer = getattr(automaton, 'regex_lexer', None)
+    if lexer is None:
+        lexer = RegexLexer(automaton)
+        automaton.regex_lexer = lexer
+    return lexer
+
+
+def tokenize_regex(automaton, input_text: str) -> TokenStream:
+    # input_text ya limpio (ver clean_input)
+    return compile_regex_lexer(automaton).tokenize(input_text)
+
+
+def compare_engines(automaton, paths) -> list:
+    # Arnés diferencial: tokeniza cada archivo con ambos motores y devuelve las
+    # diferencias como (archivo, posición, token_tabla, token_regex)
+    from Helpers.reader import reader
+    from Tokens.tokenizer import process_tokens
+
+    mismatches = []
+    for path in paths:
+        raw = reader(path)
+        expected = process_tokens(automaton, raw, engine='table')
+        got = tokenize_regex(automaton, clean_input(raw))
+        for i in range(max(len(expected), len(got))):
+            a = expected[i] if i < len(expected) else None
+            b = got[i] if i < len(got) else None
+            if a != b:
+                mismatches.append((path, i, a, b))
+                break
+    return mismatches
@@ -0,0 +1,128 @@
+from array import array
+
+from Helpers.names import NameTable
+from Helpers.tokenizerHelpers import TOKEN_TYPES, TOKEN_TYPE_IDS
+
+
+class TokenStream:
+    """Tokens guardados por columnas sobre el texto fuente.
+
+    Cada token ocupa una fila: kind (id en TOKEN_TYPES), start y length (tramo
+    del fuente) y line. El lexema se recorta del fuente solo cuando se pide;
+    los que no son un trozo literal del fuente (p. ej. "ab cd" -> "abcd", o un
+    token partido por un comentario) se guardan aparte en extra. El fuente
+    puede ser un str o bytes/mmap: en ese caso start y length son posiciones
+    de byte y el lexema se decodifica (UTF-8) al pedirlo.
+    Iterar o indexar devuelve las mismas tuplas (lexema, tipo, línea) de siempre.
+    names es la tabla de nombres internados de la compilación: name(i) da el
+    lexema del token i como str canónico (el mismo objeto en cada aparición).
+    """
+
+    def __init__(self, source=''):
+        self.source = source
+        self.encoded = not isinstance(source, str)
+        self.kind = array('B')
+        self.start = array('I')
+        self.length = array('I')
+        self.line = array('i')
+        self.extra = {}         # índice -> lexema
+        self.compiled = None    # tabla con la que se tokenizó (la usa relex)
+        self.changed = None     # (primero, fin viejo, fin nuevo) respecto del stream editado (lo pone relex)
+        self.names = NameTable()
+
+    @classmethod
+    def from_tokens(cls, tokens) -> 'TokenStream':
+        # Desde tuplas (lexema, tipo[, línea]) u objetos con type/lexeme/line;
+        # el fuente es la concatenación de los lexemas
+        stream = cls()
+        parts = []
+        offset = 0
+        for i, token in enumerate(tokens):
+            if isinstance(token, tuple):
+                if len(token) == 3:
+                    lexeme, typ, line = token
+                else:
+                    lexeme, typ = token
+                    line = i + 1
+            else:
+                lexeme, typ, line = token.lexeme, token.type, token.line
+            stream.kind.append(TOKEN_TYPE_IDS[typ])
+            stream.start.append(offset)
+            stream.length.append(len(lexeme))
+            stream.line.append(line)
+            parts.append(lexeme)
+            offset += len(lexeme)
+        stream.source = ''.join(parts)
+        stream.encoded = False
+        return stream
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def type(self, i: int) -> str:
+        return TOKEN_TYPES[self.kind[i]]
+
+    def lexeme(self, i: int) -> str:
+        if self.extra and i in self.extra:
+            return self.extra[i]
+        start = self.start[i]
+        lexeme = self.source[start:start + self.length[i]]
+        return lexeme.decode('utf-8') if self.encoded else lexeme
+
+    def name(self, i: int) -> str:
+        # Como lexeme, pero internado en names
+        if self.extra and i in self.extra:
+            return self.names.intern(self.extra[i])
+        start = self.start[i]
+        lexeme = self.source[start:start + self.length[i]]
+        return self.names.intern(lexeme.decode('utf-8') if self.encoded else lexeme)
+
+    def __getitem__(self, i: int) -> tuple:
+        if i < 0:
+            i += len(self.kind)
+        return (self.lexeme(i), TOKEN_TYPES[self.kind[i]], self.line[i])
+
+    def __iter__(self):
+        source = self.source
+        extra = self.extra
+        encoded = self.encoded
+        for i, (kind, start, length, line) in enumerate(zip(self.kind, self.start, self.length, self.line)):
+            if extra and i in extra:
+                lexeme = extra[i]
+            else:
+                lexeme = source[start:start + length]
+                if encoded:
+                    lexeme = lexeme.decode('utf-8')
+            yield (lexeme, TOKEN_TYPES[kind], line)
+
+
+class TokenCursor:
+    # Vista del token en la posición pos de un TokenStream; pasado el último
+    # token se comporta como el token de fin de entrada '$'
+    __slots__ = ('stream', 'kind', 'pos', 'end')
+
+    def __init__(self, stream: TokenStream):
+        self.stream = stream
+        self.kind = stream.kind
+        self.pos = 0
+        self.end = len(stream)
+
+    @property
+    def type(self) -> str:
+        try:
+            return TOKEN_TYPES[self.kind[self.pos]]
+        except IndexError:
+            return '$'
+
+    @property
+    def lexeme(self) -> str:
+        if self.pos < self.end:
+            return self.stream.lexeme(self.pos)
+        return '$'
+
+    @property
+    def line(self) -> int:
+        try:
+            return self.stream.line[self.pos]
+        except IndexError:
+            return -1
@@ -1,121 +1,233 @@
-from Helpers.tokenizerHelpers import RESERVED_FINAL_STATES, RESERVED_PREFIX_STATES, ID_STATE, STRING_BODY_STATE, classify_state, is_alpha, is_digit
-from Helpers.transitions import STRING_BODY_STATE
-from Helpers.cleaner import clean_input
-
-def process_tokens(self, input_text: str) -> list:
-        
-        input_text = clean_input(input_text)
-
-        tokens = []
-        state = self.start_state
-        buffer = ""
-        i = 0
-        n = len(input_text)
-        line = 1
-
-        reserved_initials = {'f', 'i', 'e', 't', 'c', 'w', 's', 'a', 'd'}
-
-
-        CHAR_BODY_STATE = 200
-        CHAR_END_STATE = 201
-
-        while i < n:
-            c = input_text[i]
-            # Categoría
-            if state == STRING_BODY_STATE:
-                category = '"' if c == '"' else 'str'
-            elif state == CHAR_BODY_STATE:
-                category = "'" if c == "'" else 'char_body'
-            elif c == '"':
-                category = '"'
-            elif c == "'":
-                category = "'"
-            elif is_alpha(c):
-                if state == 0 and c in reserved_initials:
-                    category = c
-                elif state in RESERVED_PREFIX_STATES:
-                    category = c
-                elif state >= 10:
-                    category = c
-                else:
-                    category = 'char'
-            elif is_digit(c):
-                category = 'num'
-            elif c == '.':
-                category = '.'
-            elif c in "+-*/=(){},[]<%>!D~":
-                category = c
-            else:
-                # Manejar saltos de línea para llevar el conteo de líneas
-                if c == '\n':
-                    line += 1
-                i += 1
-                continue
-
-            # Transición para char literal
-            if state == 0 and c == "'":
-                state = CHAR_BODY_STATE
-                buffer += c
-                i += 1
-                continue
-            elif state == CHAR_BODY_STATE:
-                # Solo se permite un caracter entre comillas simples
-                if c != "'" and c != '\\':
-                    buffer += c
-                    i += 1
-                    continue
-                elif c == '\\':
-                    # Soporte para escape de caracter
-                    if i + 1 < n:
-                        buffer += c + input_text[i+1]
-                        i += 2
-                        continue
-                elif c == "'":
-                    buffer += c
-                    state = CHAR_END_STATE
-                    i += 1
-                    continue
-            elif state == CHAR_END_STATE:
-                tokens.append((buffer, 'CHAR_LITERAL', line))
-                buffer = ""
-                state = self.start_state
-                continue
-
-            # Lógica especial: si estamos en estado de número y el siguiente carácter es letra, marcar como NO VALIDO
-            if state == 6 and is_alpha(input_text[i]):
-                buffer += input_text[i]
-                i += 1
-                while i < n and (is_alpha(input_text[i]) or is_digit(input_text[i])):
-                    buffer += input_text[i]
-                    i += 1
-                tokens.append((buffer, 'NO VALIDO', line))
-                buffer = ""
-                state = self.start_state
-                continue
-            
-            if category in self.states[state]:
-                #print (f"Transición: {state} --{category}--> {self.states[state][category]}")
-                state = self.states[state][category]
-                buffer += c
-                #print (state)
-                i += 1
-            else:
-                # Si rompemos un prefijo reservado (no final), convertirse en id sin consumir c
-                if (state in RESERVED_PREFIX_STATES and state not in RESERVED_FINAL_STATES
-                        and (is_alpha(c) or is_digit(c))):
-                    state = ID_STATE
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+from operator import add
+
+from Helpers.cleaner import clean_input, clean_stream, kept_segments, bare_carriage_returns
+from Helpers.reader import read_chunks
+from Helpers.tokenizerHelpers import TOKEN_TYPE_IDS
+from Tokens.compiled import compile_automaton, scan, ScanState
+from Tokens.regex_lexer import tokenize_regex
+from Tokens.stream import TokenStream
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _tokenize_table(automaton, input_text) -> TokenStream:
+        # Tabla densa estado × clase (se construye una vez por autómata)
+        return _scan_text(compile_automaton(automaton), input_text)
+
+
+def _scan_text(compiled, input_text, final: bool = True, line: int = 1) -> TokenStream:
+        # Los comentarios y los CR se resuelven aquí mismo: se recorren solo los
+        # tramos que clean_input conservaría, sin construir el texto limpio.
+        # No es una sola pasada: antes de scan se calculan las clases de todo el
+        # texto (para un str, translate y encode: dos buffers del largo del
+        # texto) y kept_segments lo recorre con find; si hay CR, otra pasada los
+        # busca y las clases se copian a un bytearray.
+        # Con final=False el token que quede a medias al final no se emite.
+        classes = compiled.classes(input_text)
+        segments = kept_segments(input_text)
+        has_cr = input_text.find('\r' if isinstance(input_text, str) else b'\r') >= 0
+        if has_cr:
+            # Un '\r' suelto cuenta como salto de línea; el de un CRLF se ignora
+            classes = bytearray(classes)
+            for pos in bare_carriage_returns(input_text, segments):
+                classes[pos] = compiled.newline_class
+
+        stream = TokenStream(input_text)
+        stream.compiled = compiled
+        state = ScanState()
+        state.line = line
+        for lo, hi in segments:
+            scan(compiled, input_text, False, state, stream, lo, hi, classes)
+        if final:
+            end = len(input_text)
+            scan(compiled, input_text, True, state, stream, end, end, classes)
+
+        if has_cr:
+            _normalize_literal_newlines(stream)
+        return stream
+
+
+def _normalize_literal_newlines(stream: TokenStream) -> None:
+        # Dentro de cadenas y chars el CR se conserva en el lexema: se normaliza
+        # como lo haría clean_input y el lexema pasa a extra
+        source = stream.source
+        cr = b'\r' if stream.encoded else '\r'
+        extra = stream.extra
+        for i, lexeme in extra.items():
+            if '\r' in lexeme:
+                extra[i] = lexeme.replace('\r\n', '\n').replace('\r', '\n')
+        kinds = stream.kind.tobytes()
+        for typ in ('STRING_LITERAL', 'CHAR_LITERAL', 'NO RECONOCIDO'):
+            kind = TOKEN_TYPE_IDS[typ]
+            i = kinds.find(kind)
+            while i >= 0:
+                start = stream.start[i]
+                end = start + stream.length[i]
+                if i not in extra and source.find(cr, start, end) >= 0:
+                    extra[i] = stream.lexeme(i).replace('\r\n', '\n').replace('\r', '\n')
+                i = kinds.find(kind, i + 1)
+
+
+def _tokenize_regex(automaton, input_text) -> TokenStream:
+        # La alternancia del motor regex necesita el texto limpio y contiguo
+        if not isinstance(input_text, str):
+            input_text = bytes(input_text).decode('utf-8')
+        return tokenize_regex(automaton, clean_input(input_text))
+
+
+# Motores disponibles; ambos producen un TokenStream con las mismas tuplas (lexema, tipo, línea)
+ENGINES = {
+    'table': _tokenize_table,
+    'regex': _tokenize_regex,
+}
+
+
+def process_tokens(self, input_text, engine: str = 'table') -> TokenStream:
+        # input_text es el código tal cual se leyó: comentarios y saltos de línea
+        # los resuelve cada motor. Puede ser un str o los bytes del archivo (p. ej.
+        # map_file): el motor de tabla los recorre sin decodificarlos y solo
+        # decodifica los lexemas que se piden
+        if engine not in ENGINES:
+            raise ValueError(f"Motor de tokenización desconocido: '{engine}'")
+        return ENGINES[engine](self, input_text)
+
+
+def process_tokens_stream(self, file_obj, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        # Igual que process_tokens, pero leyendo file_obj por fragmentos y entregando
+        # las tuplas a medida que se completan; la memoria no depende del tamaño del archivo
+        compiled = compile_automaton(self)
+        carry = ScanState()
+        for chunk in clean_stream(read_chunks(file_obj, chunk_size)):
+            stream = TokenStream(chunk)
+            carry.first = 0     # un lexema a medias empezó en un fragmento anterior
+            scan(compiled, chunk, False, carry, stream)
+            yield from stream
+        stream = TokenStream()
+        carry.first = 0
+        scan(compiled, '', True, carry, stream)
+        yield from stream
+
+
+# Caracteres que pueden formar un delimitador con el siguiente ('<~', '~>', '~~',
+# CRLF): una ventana de relex nunca termina justo después de uno de ellos
+_PAIR_STARTS = ('<', '~', '\r', b'<', b'~', b'\r')
+# Tipos que se emiten antes de los espacios que los siguen (la línea del token
+# siguiente puede ser mayor); no sirven como punto de reinicio
+_IMMEDIATE_KINDS = (TOKEN_TYPE_IDS['NO VALIDO'], TOKEN_TYPE_IDS['NO RECONOCIDO'])
+# Tamaño mínimo de la primera ventana que se vuelve a escanear
+RELEX_WINDOW = 1024
+
+
+def relex(previous_tokens: TokenStream, source, edit_offset: int, removed_len: int,
+          inserted_text) -> TokenStream:
+        # Tokens de source (el texto ya editado) a partir de previous_tokens, los del
+        # texto anterior, sabiendo que en edit_offset se quitaron removed_len
+        # caracteres y se insertó inserted_text. Se vuelve a escanear desde el último
+        # límite de token seguro antes de la edición hasta que un token nuevo empieza
+        # donde empezaba uno viejo (desplazado); desde ahí se reutilizan los viejos.
+        # En changed queda qué filas cambiaron (ver token_diff).
+        old = previous_tokens
+        compiled = old.compiled
+        if compiled is None:
+            raise ValueError("relex necesita un TokenStream producido por el motor de tabla")
+        delta = len(inserted_text) - removed_len
+        if (len(source) != len(old.source) + delta or edit_offset < 0
+                or edit_offset + removed_len > len(old.source)):
+            raise ValueError("La edición no corresponde al texto de previous_tokens")
+        n = len(source)
+        old_start = old.start
+        edit_end = edit_offset + len(inserted_text)
+
+        # Reiniciar en el token m: el anterior ya no dependía de nada a partir de la
+        # edición (su emisión mira hasta el inicio del token m y un carácter más).
+        # Un '~' seguido de un comentario de bloque puede unirse en '~~' con lo que
+        # quede después del comentario, así que tampoco sirve como reinicio.
+        tilde = b'~' if old.encoded else '~'
+        m = bisect_right(old_start, edit_offset - 2) - 1
+        while m > 0 and (old.kind[m - 1] in _IMMEDIATE_KINDS
+                         or old.source[old_start[m]:old_start[m] + 1] == tilde):
+            m -= 1
+        if m > 0:
+            lo = old_start[m]
+            line = old.line[m - 1]
+        else:
+            m = 0
+            lo = 0
+            line = 1
+
+        # Ventanas crecientes desde lo hasta encontrar un token que empiece donde
+        # empezaba uno viejo; si no aparece se duplica la ventana
+        span = max(2 * (edit_end - lo), RELEX_WINDOW)
+        while True:
+            hi = min(n, lo + span)
+            while hi < n and source[hi - 1:hi] in _PAIR_STARTS:
+                hi += 1
+            window = _scan_text(compiled, source[lo:hi], final=hi == n, line=line)
+            resync = None
+            for j in range(len(window)):
+                pos = lo + window.start[j]
+                if pos < edit_end:
                     continue
-                # Volcar token si hay uno aceptado
-                if buffer and state in self.accept_states:
-                    tokens.append((buffer, classify_state(state), line))
-                elif buffer:
-                    tokens.append((buffer, 'NO RECONOCIDO', line))
-                buffer = ""
-                state = self.start_state
-                continue
-
-        if buffer and state in self.accept_states:
-            tokens.append((buffer, classify_state(state), line))
-        elif buffer:
-            tokens.append((buffer, 'NO RECONOCIDO', line))
-        return tokens
\ No newline at end of file
+                k = bisect_left(old_start, pos - delta, m)
+                if k < len(old_start) and old_start[k] == pos - delta:
+                    resync = j, k
+                    break
+            if resync is not None or hi == n:
+                break
+            span *= 2
+
+        # Empalmar: viejos antes de m, nuevos de la ventana, viejos desplazados
+        stream = TokenStream(source)
+        stream.compiled = compiled
+        stream.names = old.names
+        count = resync[0] if resync else len(window)
+        for column in ('kind', 'start', 'length', 'line'):
+            getattr(stream, column).extend(getattr(old, column)[:m])
+        stream.kind.extend(window.kind[:count])
+        stream.start.extend(start + lo for start in window.start[:count])
+        stream.length.extend(window.length[:count])
+        stream.line.extend(window.line[:count])
+        stream.extra = {i: lexeme for i, lexeme in old.extra.items() if i < m}
+        stream.extra.update((m + i, lexeme) for i, lexeme in window.extra.items() if i < count)
+        # Filas de la ventana iguales a las viejas (terminan antes de la edición)
+        first = m
+        while (first - m < count and first < len(old) and old_start[first] + old.length[first] <= edit_offset
+               and window.kind[first - m] == old.kind[first] and lo + window.start[first - m] == old_start[first]
+               and window.length[first - m] == old.length[first] and window.line[first - m] == old.line[first]):
+            first += 1
+        stream.changed = (first, resync[1] if resync else len(old), m + count)
+        if resync:
+            j, k = resync
+            shift = window.line[j] - old.line[k]
+            moved = m + count - k
+            stream.kind.extend(old.kind[k:])
+            stream.length.extend(old.length[k:])
+            stream.start.extend(map(add, old_start[k:], repeat(delta)) if delta else old_start[k:])
+            stream.line.extend(map(add, old.line[k:], repeat(shift)) if shift else old.line[k:])
+            stream.extra.update((i + moved, lexeme) for i, lexeme in old.extra.items() if i >= k)
+        return stream
+
+
+def token_diff(previous_tokens: TokenStream, tokens: TokenStream) -> tuple:
+        # (primero, fin viejo, fin nuevo): las filas [0, primero) son iguales en
+        # ambos streams y las viejas desde fin viejo son las nuevas desde fin nuevo,
+        # todas con la misma diferencia de línea. relex ya lo deja en changed; esto
+        # compara fila por fila (tipo, lexema, línea) desde los dos extremos.
+        old = list(previous_tokens)
+        new = list(tokens)
+        first = 0
+        limit = min(len(old), len(new))
+        while first < limit and old[first] == new[first]:
+            first += 1
+        old_end = len(old)
+        new_end = len(new)
+        shift = new[-1][2] - old[-1][2] if old and new else 0
+        while old_end > first and new_end > first:
+            lexeme, typ, line = old[old_end - 1]
+            if new[new_end - 1] != (lexeme, typ, line + shift):
+                break
+            old_end -= 1
+            new_end -= 1
+        return first, old_end, new_end
@@ -1,24 +1,11 @@
 from Tokens.tokenizer import process_tokens
-from Helpers.cleaner import clean_input
+from Tokens.automaton import Automaton
 from Helpers.transitions import transitions, accept_states
 from Helpers.reader import reader
 from Parser.parser import Parser
 from Parser.ast import pretty_print
 from Parser.semantic import SemanticAnalyzer
 
-class Automaton:
-    def __init__(self, transitions: list, accept_states: set):
-        self.transitions = transitions
-        self.accept_states = accept_states
-        max_state = max(max(frm, to) for frm, to, _ in transitions)
-        self.states = {i: {} for i in range(max_state + 1)}
-        self.start_state = 0
-        self._build_transitions(transitions)
-
-    def _build_transitions(self, transitions):
-        for from_state, to_state, symbol in transitions:
-            self.states[from_state][symbol] = to_state
-
 automaton = Automaton(transitions, accept_states)
 
 for i in range(3):
@@ -34,8 +21,7 @@ for i in range(3):
         # Un test rapido mostrando funcionamiento de un error sintáctico
         print("Aqui se debe presentar un error sintáctico (falta el main, es decir fish)...")
         raw = reader('Testing/Small/test_invalid_no_fish.txt')
-    text = clean_input(raw)
-    tokens = process_tokens(automaton, text)
+    tokens = process_tokens(automaton, raw)
     if not tokens:
         pass
     for token in tokens:
@@ -47,7 +33,7 @@ for i in range(3):
     pretty_print(ast)
 
     # Analizador semántico
-    analyzer = SemanticAnalyzer()
+    analyzer = SemanticAnalyzer(parser.names)
     errors = analyzer.analyze(ast)
     # print ("scopes", analyzer.scopes)
     # print ("Functions", analyzer.functions)